@@ -4,7 +4,7 @@ FastAPI Backend for CrewAI Ghostwriter Mobile App
 This server exposes REST API endpoints and WebSocket for real-time updates.
 """
 
-from fastapi import FastAPI, File, UploadFile, WebSocket, HTTPException, BackgroundTasks
+from fastapi import FastAPI, File, UploadFile, WebSocket, HTTPException, BackgroundTasks, Header
 from fastapi.responses import FileResponse
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
@@ -16,11 +16,7 @@ from pathlib import Path
 import uuid
 
 from crewai_ghostwriter.main import GhostwriterOrchestrator
-from crewai import Crew, Task, Process
-from crewai_ghostwriter.agents import (
-    get_architect_expansion_task,
-    get_line_edit_task
-)
+from crewai_ghostwriter.core import ManuscriptMemory, TaskType, get_storage_client, get_redis_pool_stats
 
 
 # Initialize FastAPI app
@@ -65,6 +61,7 @@ class SystemHealth(BaseModel):
     chromadb_connected: bool
     openai_api_configured: bool
     anthropic_api_configured: bool
+    redis_pools: Dict[str, Dict] = {}
 
 
 # ============================================================================
@@ -195,12 +192,10 @@ def health_check():
     """Check system health."""
     import os
 
-    # Check Redis
+    # Check storage (shared Redis pool or local store, no new socket per request)
     redis_connected = False
     try:
-        import redis
-        r = redis.Redis(host='localhost', port=6379, socket_timeout=1)
-        r.ping()
+        get_storage_client().ping()
         redis_connected = True
     except:
         pass
@@ -231,7 +226,8 @@ def health_check():
         redis_connected=redis_connected,
         chromadb_connected=chromadb_connected,
         openai_api_configured=openai_key.startswith("sk-"),
-        anthropic_api_configured=anthropic_key.startswith("sk-ant-")
+        anthropic_api_configured=anthropic_key.startswith("sk-ant-"),
+        redis_pools=get_redis_pool_stats()
     )
 
 
@@ -240,7 +236,8 @@ async def upload_manuscript(
     background_tasks: BackgroundTasks,
     file: UploadFile = File(...),
     x_openai_key: str = Header(..., alias="X-OpenAI-Key"),
-    x_anthropic_key: str = Header(..., alias="X-Anthropic-Key")
+    x_anthropic_key: str = Header(..., alias="X-Anthropic-Key"),
+    pipelined: bool = False
 ):
     """
     Upload a manuscript file and start processing.
@@ -250,6 +247,9 @@ async def upload_manuscript(
     Requires user's API keys in headers:
     - X-OpenAI-Key: User's OpenAI API key
     - X-Anthropic-Key: User's Anthropic API key
+
+    Pass ?pipelined=true to run expand → edit → validate per chapter
+    instead of waiting for every chapter at each phase.
     """
     # Validate file type
     if not file.filename.endswith('.txt'):
@@ -285,7 +285,8 @@ async def upload_manuscript(
         book_id=book_id,
         file_path=str(file_path),
         openai_key=x_openai_key,
-        anthropic_key=x_anthropic_key
+        anthropic_key=x_anthropic_key,
+        pipelined=pipelined
     )
 
     return {
@@ -295,6 +296,50 @@ async def upload_manuscript(
     }
 
 
+@app.post("/resume/{book_id}")
+async def resume_manuscript(
+    book_id: str,
+    background_tasks: BackgroundTasks,
+    x_openai_key: str = Header(..., alias="X-OpenAI-Key"),
+    x_anthropic_key: str = Header(..., alias="X-Anthropic-Key"),
+    pipelined: bool = False
+):
+    """
+    Resume an interrupted book from its Redis checkpoints.
+
+    Completed phases and chapter stages are skipped; abandoned in-progress
+    chapters are requeued. Returns a new job_id for tracking progress.
+    """
+    # Validate API keys
+    if not x_openai_key.startswith("sk-"):
+        raise HTTPException(status_code=400, detail="Invalid OpenAI API key format")
+    if not x_anthropic_key.startswith("sk-ant-"):
+        raise HTTPException(status_code=400, detail="Invalid Anthropic API key format")
+
+    if not ManuscriptMemory(book_id).get_all_chapters():
+        raise HTTPException(status_code=404, detail="No stored chapters for this book")
+
+    job_id = str(uuid.uuid4())
+    create_job(job_id)
+
+    background_tasks.add_task(
+        process_manuscript_async,
+        job_id=job_id,
+        book_id=book_id,
+        file_path=None,
+        openai_key=x_openai_key,
+        anthropic_key=x_anthropic_key,
+        pipelined=pipelined,
+        resume=True
+    )
+
+    return {
+        "job_id": job_id,
+        "book_id": book_id,
+        "message": "Resuming from checkpoints"
+    }
+
+
 @app.get("/status/{job_id}", response_model=JobStatus)
 def get_job_status(job_id: str):
     """Get current status of a processing job."""
@@ -360,7 +405,92 @@ async def websocket_endpoint(websocket: WebSocket, job_id: str):
 # BACKGROUND PROCESSING
 # ============================================================================
 
-async def process_manuscript_async(job_id: str, book_id: str, file_path: str, openai_key: str, anthropic_key: str):
+async def run_chapter_pipeline_with_progress(
+    job_id: str,
+    orchestrator: GhostwriterOrchestrator,
+    num_chapters: int,
+    resume: bool = False
+):
+    """
+    Run expand → edit → validate per chapter and report each stage.
+
+    Chapters flow through the stages independently, so chapter 1 can be
+    validated while later chapters are still expanding.
+
+    Args:
+        job_id: Unique job identifier
+        orchestrator: Orchestrator with agents initialized
+        num_chapters: Number of chapters in the manuscript
+        resume: Skip chapter stages completed by an earlier run
+    """
+    stage_labels = {"expand": "expanded", "edit": "polished", "validate": "validated"}
+    total_steps = max(num_chapters * len(stage_labels), 1)
+    steps_completed = 0
+
+    def on_progress(ch_num: int, stage: str, status: str):
+        nonlocal steps_completed
+
+        if status == "running":
+            update_job(
+                job_id,
+                chapter_progress={ch_num: "running"},
+                log_message=f"Chapter {ch_num}: {stage}..."
+            )
+        elif status == "completed":
+            steps_completed += 1
+            update_job(
+                job_id,
+                chapter_progress={ch_num: "completed"} if stage == "validate" else None,
+                log_message=f"Chapter {ch_num} {stage_labels.get(stage, stage)}",
+                log_level="success",
+                progress=50 + int((steps_completed / total_steps) * 30)
+            )
+        else:
+            update_job(
+                job_id,
+                chapter_progress={ch_num: "error"},
+                log_message=f"Error in {stage} for Chapter {ch_num}",
+                log_level="error",
+                error_phase="Pipeline"
+            )
+
+    update_job(
+        job_id,
+        current_phase="Pipeline",
+        phase_status={"Pipeline": "running"},
+        log_message=f"Pipelining {num_chapters} chapters (expand → edit → validate)...",
+        progress=50
+    )
+
+    results = await orchestrator.run_chapter_pipeline_async(on_progress=on_progress, resume=resume)
+
+    # Chapters fully restored from checkpoints never report progress
+    update_job(
+        job_id,
+        chapter_progress={
+            ch_num: "completed" for ch_num, stages in results.items()
+            if len(stages) == len(stage_labels)
+        }
+    )
+
+    update_job(
+        job_id,
+        phase_status={"Pipeline": "completed"},
+        log_message="All chapters expanded, polished and validated",
+        log_level="success",
+        progress=80
+    )
+
+
+async def process_manuscript_async(
+    job_id: str,
+    book_id: str,
+    file_path: Optional[str],
+    openai_key: str,
+    anthropic_key: str,
+    pipelined: bool = False,
+    resume: bool = False
+):
     """
     Process manuscript in background with progress updates.
 
@@ -369,9 +499,11 @@ async def process_manuscript_async(job_id: str, book_id: str, file_path: str, op
     Args:
         job_id: Unique job identifier
         book_id: Unique book identifier
-        file_path: Path to uploaded manuscript
+        file_path: Path to uploaded manuscript (None when resuming)
         openai_key: User's OpenAI API key
         anthropic_key: User's Anthropic API key
+        pipelined: Run expansion, editing and chapter QA as a per-chapter pipeline
+        resume: Continue from Redis checkpoints instead of starting over
     """
     try:
         update_job(
@@ -389,14 +521,28 @@ async def process_manuscript_async(job_id: str, book_id: str, file_path: str, op
             verbose=False
         )
 
-        # Load manuscript
-        update_job(
-            job_id,
-            log_message=f"Loading manuscript...",
-            progress=10
-        )
+        if resume:
+            # Chapters, contract and checkpoints are reloaded from Redis
+            checkpoint = orchestrator.prepare_resume()
+            update_job(
+                job_id,
+                log_message=(
+                    f"Resuming from checkpoints: {len(checkpoint['completed_phases'])} phases, "
+                    f"{checkpoint['completed_tasks']} chapter tasks done, "
+                    f"{len(checkpoint['requeued'])} requeued"
+                ),
+                progress=10
+            )
+        else:
+            # Load manuscript
+            update_job(
+                job_id,
+                log_message=f"Loading manuscript...",
+                progress=10
+            )
+
+            orchestrator.load_manuscript(file_path)
 
-        orchestrator.load_manuscript(file_path)
         stats = orchestrator.manuscript_memory.get_memory_stats()
         num_chapters = stats['chapters_stored']
 
@@ -405,18 +551,19 @@ async def process_manuscript_async(job_id: str, book_id: str, file_path: str, op
             log_message=f"Loaded {num_chapters} chapters",
             log_level="success",
             progress=15,
-            chapter_progress={i: "pending" for i in range(1, num_chapters + 1)}
+            chapter_progress={i: "pending" for i in orchestrator.manuscript_memory.get_chapter_numbers()}
         )
 
-        # Initialize story contract
-        update_job(job_id, log_message="Initializing Story Contract...")
-        orchestrator.manuscript_memory.initialize_story_contract_from_manuscript()
-        update_job(
-            job_id,
-            log_message="Story Contract created",
-            log_level="success",
-            progress=20
-        )
+        # Initialize story contract (kept as-is when resuming)
+        if not (resume and orchestrator.manuscript_memory.get_story_contract().contract["pov"]["type"]):
+            update_job(job_id, log_message="Initializing Story Contract...")
+            orchestrator.manuscript_memory.initialize_story_contract_from_manuscript()
+            update_job(
+                job_id,
+                log_message="Story Contract created",
+                log_level="success",
+                progress=20
+            )
 
         # Initialize agents
         update_job(job_id, log_message="Initializing 6 agents...")
@@ -437,7 +584,7 @@ async def process_manuscript_async(job_id: str, book_id: str, file_path: str, op
             progress=30
         )
 
-        orchestrator._run_analysis()
+        await orchestrator.run_phase_async("analysis", orchestrator._run_analysis, resume)
 
         update_job(
             job_id,
@@ -456,7 +603,7 @@ async def process_manuscript_async(job_id: str, book_id: str, file_path: str, op
             progress=40
         )
 
-        orchestrator._run_continuity_build()
+        await orchestrator.run_phase_async("continuity", orchestrator._run_continuity_build, resume)
 
         update_job(
             job_id,
@@ -466,131 +613,119 @@ async def process_manuscript_async(job_id: str, book_id: str, file_path: str, op
             progress=45
         )
 
-        # Phase 3: Expansion
-        update_job(
-            job_id,
-            current_phase="Expansion",
-            phase_status={"Expansion": "running"},
-            log_message=f"Expanding {num_chapters} chapters...",
-            progress=50
-        )
-
-        chapters = orchestrator.manuscript_memory.get_all_chapters()
-        chapters_completed = 0
+        completed_before = orchestrator.state_manager.completed_tasks_count
 
-        for ch_num in sorted(chapters.keys()):
+        if pipelined:
+            # Phases 3-4: Per-chapter pipeline
+            await run_chapter_pipeline_with_progress(job_id, orchestrator, num_chapters, resume)
+        else:
+            # Phase 3: Expansion
             update_job(
                 job_id,
-                chapter_progress={ch_num: "running"},
-                log_message=f"Expanding Chapter {ch_num}..."
+                current_phase="Expansion",
+                phase_status={"Expansion": "running"},
+                log_message=f"Expanding {num_chapters} chapters...",
+                progress=50
             )
 
-            try:
-                task = Task(
-                    description=get_architect_expansion_task(ch_num),
-                    agent=orchestrator.agents['architect'],
-                    expected_output=f"Expanded Chapter {ch_num}"
-                )
-
-                crew = Crew(
-                    agents=[orchestrator.agents['architect']],
-                    tasks=[task],
-                    process=Process.sequential,
-                    verbose=False
-                )
-
-                crew.kickoff()
-
-                chapters_completed += 1
-                progress = 50 + int((chapters_completed / num_chapters) * 15)
+            pending = orchestrator.get_runnable_chapters(TaskType.EXPAND, resume)
+            chapters_completed = num_chapters - len(pending)
 
+            for ch_num in pending:
                 update_job(
                     job_id,
-                    chapter_progress={ch_num: "completed"},
-                    log_message=f"Chapter {ch_num} expanded",
-                    log_level="success",
-                    progress=progress
+                    chapter_progress={ch_num: "running"},
+                    log_message=f"Expanding Chapter {ch_num}..."
                 )
 
-            except Exception as e:
-                update_job(
-                    job_id,
-                    chapter_progress={ch_num: "error"},
-                    log_message=f"Error expanding Chapter {ch_num}",
-                    log_level="error",
-                    error_phase="Expansion",
-                    error_message=str(e)
-                )
-
-        update_job(
-            job_id,
-            phase_status={"Expansion": "completed"},
-            log_message="All chapters expanded",
-            log_level="success",
-            progress=65
-        )
+                try:
+                    # Leased and checkpointed so a crash can resume here
+                    await orchestrator.run_chapter_stage(TaskType.EXPAND, ch_num)
+
+                    chapters_completed += 1
+                    progress = 50 + int((chapters_completed / num_chapters) * 15)
+
+                    update_job(
+                        job_id,
+                        chapter_progress={ch_num: "completed"},
+                        log_message=f"Chapter {ch_num} expanded",
+                        log_level="success",
+                        progress=progress
+                    )
+
+                except Exception as e:
+                    update_job(
+                        job_id,
+                        chapter_progress={ch_num: "error"},
+                        log_message=f"Error expanding Chapter {ch_num}",
+                        log_level="error",
+                        error_phase="Expansion",
+                        error_message=str(e)
+                    )
 
-        # Phase 4: Editing
-        update_job(
-            job_id,
-            current_phase="Editing",
-            phase_status={"Editing": "running"},
-            log_message="Polishing prose...",
-            progress=70
-        )
-
-        chapters_completed = 0
-        for ch_num in sorted(chapters.keys()):
             update_job(
                 job_id,
-                chapter_progress={ch_num: "running"},
-                log_message=f"Editing Chapter {ch_num}..."
+                phase_status={"Expansion": "completed"},
+                log_message="All chapters expanded",
+                log_level="success",
+                progress=65
             )
 
-            try:
-                task = Task(
-                    description=get_line_edit_task(ch_num),
-                    agent=orchestrator.agents['editor'],
-                    expected_output=f"Polished Chapter {ch_num}"
-                )
-
-                crew = Crew(
-                    agents=[orchestrator.agents['editor']],
-                    tasks=[task],
-                    process=Process.sequential,
-                    verbose=False
-                )
-
-                crew.kickoff()
+            # Phase 4: Editing
+            update_job(
+                job_id,
+                current_phase="Editing",
+                phase_status={"Editing": "running"},
+                log_message="Polishing prose...",
+                progress=70
+            )
 
-                chapters_completed += 1
-                progress = 70 + int((chapters_completed / num_chapters) * 10)
+            pending = orchestrator.get_runnable_chapters(TaskType.POLISH, resume)
+            chapters_completed = num_chapters - len(pending)
 
+            for ch_num in pending:
                 update_job(
                     job_id,
-                    chapter_progress={ch_num: "completed"},
-                    log_message=f"Chapter {ch_num} polished",
-                    log_level="success",
-                    progress=progress
+                    chapter_progress={ch_num: "running"},
+                    log_message=f"Editing Chapter {ch_num}..."
                 )
 
-            except Exception as e:
-                update_job(
-                    job_id,
-                    chapter_progress={ch_num: "error"},
-                    log_message=f"Error editing Chapter {ch_num}",
-                    log_level="error",
-                    error_phase="Editing",
-                    error_message=str(e)
-                )
+                try:
+                    # Leased and checkpointed so a crash can resume here
+                    await orchestrator.run_chapter_stage(TaskType.POLISH, ch_num)
+
+                    chapters_completed += 1
+                    progress = 70 + int((chapters_completed / num_chapters) * 10)
+
+                    update_job(
+                        job_id,
+                        chapter_progress={ch_num: "completed"},
+                        log_message=f"Chapter {ch_num} polished",
+                        log_level="success",
+                        progress=progress
+                    )
+
+                except Exception as e:
+                    update_job(
+                        job_id,
+                        chapter_progress={ch_num: "error"},
+                        log_message=f"Error editing Chapter {ch_num}",
+                        log_level="error",
+                        error_phase="Editing",
+                        error_message=str(e)
+                    )
 
-        update_job(
-            job_id,
-            phase_status={"Editing": "completed"},
-            log_message="All chapters polished",
-            log_level="success",
-            progress=80
-        )
+            update_job(
+                job_id,
+                phase_status={"Editing": "completed"},
+                log_message="All chapters polished",
+                log_level="success",
+                progress=80
+            )
+
+        # Chapters redone in this run invalidate later checkpoints
+        if orchestrator.state_manager.completed_tasks_count != completed_before:
+            resume = False
 
         # Phase 5: QA
         update_job(
@@ -601,7 +736,7 @@ async def process_manuscript_async(job_id: str, book_id: str, file_path: str, op
             progress=85
         )
 
-        orchestrator._run_qa()
+        await orchestrator.run_phase_async("qa", orchestrator._run_qa, resume)
 
         update_job(
             job_id,
@@ -620,7 +755,7 @@ async def process_manuscript_async(job_id: str, book_id: str, file_path: str, op
             progress=93
         )
 
-        orchestrator._run_learning()
+        await orchestrator.run_phase_async("learning", orchestrator._run_learning, resume)
 
         update_job(
             job_id,
@@ -1,8 +1,12 @@
 """Core system components including memory, orchestration, and safety."""
 
 from .memory.manuscript_memory import ManuscriptMemory
+from .memory.async_manuscript_memory import AsyncManuscriptMemory
 from .memory.long_term_memory import GhostwriterLongTermMemory
+from .memory.redis_pool import get_redis_client, get_redis_pool_stats, close_redis_pools
+from .memory.local_store import LocalStore, get_local_store, get_storage_client
 from .orchestration.state_manager import WorkflowStateManager, ChapterTask, TaskStatus, TaskType
+from .orchestration.async_state_manager import AsyncWorkflowStateManager
 from .orchestration.parallel_executor import ParallelExecutor
 from .orchestration.rate_limiter import RateLimiter, MultiProviderRateLimiter
 from .safety.guards import SafetyGuards, WorkflowHealthMonitor
@@ -10,10 +14,18 @@ from .safety.guards import SafetyGuards, WorkflowHealthMonitor
 __all__ = [
     # Memory
     "ManuscriptMemory",
+    "AsyncManuscriptMemory",
     "GhostwriterLongTermMemory",
+    "get_redis_client",
+    "get_redis_pool_stats",
+    "close_redis_pools",
+    "LocalStore",
+    "get_local_store",
+    "get_storage_client",
 
     # State management
     "WorkflowStateManager",
+    "AsyncWorkflowStateManager",
     "ChapterTask",
     "TaskStatus",
     "TaskType",
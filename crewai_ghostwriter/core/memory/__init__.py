@@ -1,6 +1,15 @@
 """Memory systems for short-term (Redis) and long-term (ChromaDB) storage."""
 
 from .manuscript_memory import ManuscriptMemory
+from .async_manuscript_memory import AsyncManuscriptMemory
+from .local_store import LocalStore, get_local_store, get_storage_client
 from .long_term_memory import GhostwriterLongTermMemory
 
-__all__ = ["ManuscriptMemory", "GhostwriterLongTermMemory"]
+__all__ = [
+    "ManuscriptMemory",
+    "AsyncManuscriptMemory",
+    "LocalStore",
+    "get_local_store",
+    "get_storage_client",
+    "GhostwriterLongTermMemory"
+]
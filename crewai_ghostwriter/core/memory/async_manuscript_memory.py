@@ -0,0 +1,360 @@
+"""
+Async Manuscript Memory
+redis.asyncio counterpart of ManuscriptMemory for use from coroutines,
+so storing chapters and flags doesn't block the event loop.
+"""
+
+from typing import Dict, List, Optional, Tuple
+import redis.asyncio as aioredis
+from .manuscript_memory import ManuscriptMemory
+from .async_support import AsyncWriteBehind, write_through, unlink_keys_async, expire_keys_async
+from .codec import ValueCodec, json_dumps, json_loads
+
+
+class AsyncManuscriptMemory(AsyncWriteBehind):
+    """
+    Manuscript memory backed by redis.asyncio.
+
+    Same semantics and Redis layout as ManuscriptMemory (the two can read
+    each other's data). Lookups such as get_chapter() and
+    get_unresolved_flags() are served from memory and stay synchronous;
+    methods that write, or read chapter history from Redis, are
+    coroutines.
+
+    Usage:
+        memory = await AsyncManuscriptMemory.create("my_book")
+        version = await memory.store_chapter(1, text, label="line_edit")
+        await memory.flag_cross_chapter_issue(3, 7, {"type": "continuity"})
+    """
+
+    def __init__(
+        self,
+        book_id: str,
+        redis_host: str = "localhost",
+        redis_port: int = 6379,
+        redis_client: Optional[aioredis.Redis] = None,
+        codec: Optional[ValueCodec] = None,
+        max_chapter_versions: Optional[int] = 20,
+        keyframe_interval: int = 10
+    ):
+        """
+        Initialize async manuscript memory (call load() before use).
+
+        Args:
+            book_id: Unique identifier for this book
+            redis_host: Redis server host
+            redis_port: Redis server port
+            redis_client: redis.asyncio client to use
+            codec: Codec for stored values (default: compress values over 1KB)
+            max_chapter_versions: Versions kept per chapter (None keeps all)
+            keyframe_interval: Max deltas between full chapter texts
+        """
+        super().__init__(
+            redis_client or aioredis.Redis(host=redis_host, port=redis_port, decode_responses=True)
+        )
+        self.book_id = book_id
+        self.max_chapter_versions = max_chapter_versions
+
+        # Pruning reads history, so it's done here with async reads
+        self._sync = ManuscriptMemory(
+            book_id,
+            redis_client=self._buffer,
+            codec=codec,
+            max_chapter_versions=None,
+            keyframe_interval=keyframe_interval,
+            load=False
+        )
+
+    @classmethod
+    async def create(cls, book_id: str, **kwargs) -> "AsyncManuscriptMemory":
+        """
+        Create a memory and load existing data from Redis.
+
+        Args:
+            book_id: Unique identifier for this book
+            **kwargs: Arguments for __init__
+
+        Returns:
+            Loaded AsyncManuscriptMemory
+        """
+        memory = cls(book_id, **kwargs)
+        await memory.load()
+        return memory
+
+    async def load(self):
+        """Load existing manuscript data from Redis in two round trips (plus a one-time migration)."""
+        async with self.redis.pipeline(transaction=False) as pipe:
+            self._sync._queue_load(pipe)
+            loaded = await pipe.execute()
+
+        chapter_keys = self._sync._chapter_keys(self._sync._chapters_to_load(loaded))
+        chapters = await self.redis.mget(chapter_keys) if chapter_keys else []
+
+        async with self.redis.pipeline(transaction=True) as pipe:
+            if self._sync._queue_migration(pipe, loaded, chapters):
+                await pipe.execute()
+        self._sync._restore(loaded, chapters)
+
+        seed = self._sync._flag_seq_seed(loaded)
+        if seed is not None:
+            await self.redis.set(self._sync._flag_key("seq"), seed, nx=True)
+
+    store_manuscript = write_through(ManuscriptMemory, "store_manuscript")
+    store_chapter_analysis = write_through(ManuscriptMemory, "store_chapter_analysis")
+    store_continuity_fact = write_through(ManuscriptMemory, "store_continuity_fact")
+    save_story_contract = write_through(ManuscriptMemory, "save_story_contract")
+    initialize_story_contract_from_manuscript = write_through(
+        ManuscriptMemory, "initialize_story_contract_from_manuscript"
+    )
+
+    async def flag_cross_chapter_issue(self, discovered_in: int, affects_chapter: int, issue: Dict) -> str:
+        """
+        Flag an issue in another chapter (see ManuscriptMemory.flag_cross_chapter_issue).
+
+        Args:
+            discovered_in: Chapter number where issue was discovered
+            affects_chapter: Chapter number that needs fixing
+            issue: Dictionary with 'type', 'detail', 'severity', etc.
+
+        Returns:
+            Flag ID for tracking
+        """
+        seq = await self.redis.incr(self._sync._flag_key("seq"))
+        flag_id = self._sync._add_flag(discovered_in, affects_chapter, issue, seq)
+        await self._flush()
+        return flag_id
+
+    async def flag_or_merge_issue(
+        self,
+        discovered_in: int,
+        affects_chapter: int,
+        issue: Dict
+    ) -> Tuple[str, bool]:
+        """
+        Flag an issue unless an open flag already describes it (see ManuscriptMemory.flag_or_merge_issue).
+
+        Args:
+            discovered_in: Chapter number where issue was discovered
+            affects_chapter: Chapter number that needs fixing
+            issue: Dictionary with 'type', 'detail', 'severity', etc.
+
+        Returns:
+            (flag_id, merged)
+        """
+        with self._sync.lock:
+            match = self._sync.flag_index.find_duplicate(
+                self._sync._dedupe_key(affects_chapter, issue), issue.get("detail", "")
+            )
+
+        if match is not None:
+            flag_id, similarity = match
+            open_key, records_key = self._sync._flag_key("open"), self._sync._flag_key("records")
+
+            async def merge(pipe) -> Optional[Dict]:
+                if await pipe.zscore(open_key, flag_id) is None:
+                    return None
+                flag = self._sync._merged_record(
+                    await pipe.hget(records_key, flag_id), discovered_in, issue, similarity
+                )
+                pipe.multi()
+                pipe.hset(records_key, flag_id, json_dumps(flag))
+                return flag
+
+            await self._flush()  # Earlier writes land before the merge reads
+            flag = await self.redis.transaction(merge, open_key, records_key, value_from_callable=True)
+            if self._sync._adopt_merge(flag_id, flag):
+                return flag_id, True
+
+        return await self.flag_cross_chapter_issue(discovered_in, affects_chapter, issue), False
+
+    async def resolve_flag(self, flag_id: str) -> bool:
+        """
+        Mark a flag as resolved in one WATCH transaction (see ManuscriptMemory.resolve_flag).
+
+        Args:
+            flag_id: The flag ID to resolve
+
+        Returns:
+            True if an open flag was resolved by this call
+        """
+        open_key, records_key = self._sync._flag_key("open"), self._sync._flag_key("records")
+
+        async def claim(pipe) -> Optional[Dict]:
+            if await pipe.zscore(open_key, flag_id) is None:
+                return None
+            record = self._sync._resolved_record(await pipe.hget(records_key, flag_id))
+            pipe.multi()
+            self._sync._queue_resolution(pipe, flag_id, record)
+            return record
+
+        await self._flush()  # Earlier writes land before the claim reads
+        record = await self.redis.transaction(claim, open_key, records_key, value_from_callable=True)
+        return self._sync._resolve_locally(flag_id, record) is not None
+
+    async def get_flags_for_chapter(self, chapter_number: int) -> List[Dict]:
+        """
+        Get all open flags that affect a specific chapter (see ManuscriptMemory.get_flags_for_chapter).
+
+        Args:
+            chapter_number: Chapter number to check
+
+        Returns:
+            List of open flags affecting this chapter, oldest first
+        """
+        await self._flush()  # Earlier writes land before the index is read
+        flag_ids = await self.redis.zrange(self._sync._flag_key(f"chapter:{chapter_number}"), 0, -1)
+        records = await self.redis.hmget(self._sync._flag_key("records"), flag_ids) if flag_ids else []
+        return self._sync._adopt_chapter_flags(records)
+
+    async def increment_iteration(self) -> int:
+        """
+        Increment and return the iteration counter.
+
+        Returns:
+            New iteration count
+        """
+        count = await self.redis.incr(f"book:{self.book_id}:iteration_count")
+        self._sync.context["iteration_count"] = int(count)
+        return self._sync.context["iteration_count"]
+
+    async def store_chapter(
+        self,
+        chapter_number: int,
+        chapter_text: str,
+        metadata: Optional[Dict] = None,
+        label: Optional[str] = None
+    ) -> int:
+        """
+        Store a chapter's text and metadata as a new version.
+
+        Args:
+            chapter_number: Chapter number (1 or higher)
+            chapter_text: The chapter content
+            metadata: Optional metadata (word count, scene count, etc.)
+            label: Optional name for the pass that produced this version
+
+        Returns:
+            Version number of the stored text
+        """
+        previous = self._sync.get_chapter(chapter_number)
+        previous_version = (previous or {}).get("version", 0)
+
+        version = self._sync.store_chapter(chapter_number, chapter_text, metadata, label)
+        await self._flush()
+
+        if version != previous_version and self.max_chapter_versions and version > self.max_chapter_versions:
+            versions, texts = await self._load_chapter_history(chapter_number)
+            oldest_kept = version - self.max_chapter_versions + 1
+            if self._sync._queue_prune(self._buffer, chapter_number, versions, texts, oldest_kept):
+                await self._flush()
+
+        return version
+
+    async def _load_chapter_history(self, chapter_number: int):
+        """Fetch a chapter's version records, text blobs and current text in one round trip."""
+        async with self.redis.pipeline(transaction=False) as pipe:
+            self._sync._queue_chapter_history(pipe, chapter_number)
+            loaded = await pipe.execute()
+        return self._sync._decode_chapter_history(chapter_number, *loaded)
+
+    async def get_chapter_versions(self, chapter_number: int) -> List[Dict]:
+        """
+        List the retained versions of a chapter.
+
+        Args:
+            chapter_number: Chapter number
+
+        Returns:
+            Version records, oldest first
+        """
+        versions = await self.redis.hgetall(self._sync._history_key(chapter_number, "versions"))
+        return sorted((json_loads(record) for record in versions.values()), key=lambda r: r["version"])
+
+    async def get_chapter_version(self, chapter_number: int, version: int) -> Optional[str]:
+        """
+        Get the text of a specific chapter version.
+
+        Args:
+            chapter_number: Chapter number
+            version: Version number
+
+        Returns:
+            Chapter text or None if the version isn't retained
+        """
+        current = self._sync.get_chapter(chapter_number)
+        if current and current.get("version") == version:
+            return current["text"]
+
+        versions, texts = await self._load_chapter_history(chapter_number)
+        record = versions.get(version)
+        if record is None:
+            return None
+        return self._sync._resolve_text(texts, record["content_hash"])
+
+    async def diff_chapter_versions(self, chapter_number: int, from_version: int, to_version: int) -> Optional[str]:
+        """
+        Get a unified diff between two chapter versions.
+
+        Args:
+            chapter_number: Chapter number
+            from_version: Older version number
+            to_version: Newer version number
+
+        Returns:
+            Unified diff text or None if either version isn't retained
+        """
+        old_text = await self.get_chapter_version(chapter_number, from_version)
+        new_text = await self.get_chapter_version(chapter_number, to_version)
+        if old_text is None or new_text is None:
+            return None
+        return self._sync._unified_diff(chapter_number, from_version, to_version, old_text, new_text)
+
+    async def rollback_chapter(self, chapter_number: int, version: int) -> Optional[int]:
+        """
+        Restore an earlier version of a chapter as a new version.
+
+        Args:
+            chapter_number: Chapter number
+            version: Version to restore
+
+        Returns:
+            New version number or None if the version isn't retained
+        """
+        versions, texts = await self._load_chapter_history(chapter_number)
+        record = versions.get(version)
+        if record is None:
+            return None
+
+        text = self._sync._resolve_text(texts, record["content_hash"])
+        if text is None:
+            return None
+        return await self.store_chapter(
+            chapter_number,
+            text,
+            metadata=record["metadata"],
+            label=f"rollback_to_v{version}"
+        )
+
+    async def clear(self):
+        """Clear all data for this book from memory and Redis."""
+        await self._flush()
+        await unlink_keys_async(self.redis, f"book:{self.book_id}:*")
+        self._sync._reset()
+
+    async def expire(self, ttl_seconds: int) -> int:
+        """
+        Let this book's Redis data age out after a TTL.
+
+        Args:
+            ttl_seconds: Time to live in seconds
+
+        Returns:
+            Number of keys given the TTL
+        """
+        await self._flush()
+        return await expire_keys_async(self.redis, f"book:{self.book_id}:*", ttl_seconds)
+
+    async def close(self):
+        """Flush pending writes and close the Redis connection."""
+        await self._flush()
+        await self.redis.aclose()
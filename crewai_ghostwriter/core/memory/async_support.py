@@ -0,0 +1,195 @@
+"""
+Write-behind plumbing for the async (redis.asyncio) memory and state classes.
+
+The async classes wrap the regular sync classes so both share one
+implementation of the in-memory logic. The wrapped object is given a
+CommandBuffer instead of a Redis client: its writes are recorded, then
+sent in one awaited MULTI/EXEC pipeline, so the event loop never blocks
+on Redis.
+"""
+
+import asyncio
+from typing import Any, Callable, List, Tuple
+
+
+# Commands the sync classes issue on their write paths
+WRITE_COMMANDS = {
+    "set", "delete", "unlink", "expire", "incr", "incrby",
+    "sadd", "srem", "hset", "hsetnx", "hdel", "zadd", "zrem",
+    "lpush", "rpush", "xadd"
+}
+
+
+class CommandBuffer:
+    """
+    Stand-in Redis client that records write commands instead of sending them.
+
+    Supports the pipeline() / execute() calls the sync classes make, so a
+    sync method's writes end up in the buffer in the order it issued them.
+    Reads raise, since their results can't be known until the buffer is sent.
+    """
+
+    def __init__(self):
+        """Initialize an empty buffer."""
+        self.commands: List[Tuple[str, tuple, dict]] = []
+
+    def pipeline(self, transaction: bool = True) -> "CommandBuffer":
+        """Pipelines record into the same buffer."""
+        return self
+
+    def execute(self) -> List[Any]:
+        """Nothing to execute until the buffer is flushed."""
+        return []
+
+    def take(self) -> List[Tuple[str, tuple, dict]]:
+        """
+        Remove and return the recorded commands.
+
+        Returns:
+            List of (command, args, kwargs) in issue order
+        """
+        commands, self.commands = self.commands, []
+        return commands
+
+    def __getattr__(self, name: str) -> Callable[..., None]:
+        """Record a write command."""
+        if name not in WRITE_COMMANDS:
+            raise RuntimeError(
+                f"Redis read '{name}' issued on a write-behind buffer; "
+                f"use the async method instead"
+            )
+
+        def record(*args, **kwargs):
+            self.commands.append((name, args, kwargs))
+
+        return record
+
+
+class AsyncWriteBehind:
+    """
+    Base for async wrappers around a sync memory/state object.
+
+    Reads (in-memory lookups) go straight to the wrapped object; methods
+    listed with write_through() run the sync logic, then await a flush of
+    the Redis writes it buffered.
+    """
+
+    def __init__(self, redis_client):
+        """
+        Initialize write-behind wrapper.
+
+        Args:
+            redis_client: redis.asyncio client
+        """
+        self.redis = redis_client
+        self._buffer = CommandBuffer()
+        self._flush_lock = asyncio.Lock()
+        self._sync = None  # Set by subclasses
+
+    async def _flush(self):
+        """
+        Send buffered writes in one MULTI/EXEC round trip.
+
+        Flushes run one at a time, so writes reach Redis in the order the
+        in-memory state changed. Callers queued behind a flush send their
+        commands together; a caller whose commands were already sent
+        returns once that flush has completed.
+        """
+        async with self._flush_lock:
+            commands = self._buffer.take()
+            if not commands:
+                return
+
+            async with self.redis.pipeline(transaction=True) as pipe:
+                for name, args, kwargs in commands:
+                    getattr(pipe, name)(*args, **kwargs)
+                await pipe.execute()
+
+    def __getattr__(self, name: str) -> Any:
+        """Delegate in-memory reads to the wrapped object."""
+        if name.startswith("__") or name == "_sync":
+            raise AttributeError(name)
+        return getattr(self._sync, name)
+
+
+async def scan_keys_async(client, pattern: str, batch_size: int = 500):
+    """
+    Async counterpart of redis_pool.scan_keys().
+
+    Args:
+        client: redis.asyncio client
+        pattern: Glob-style key pattern
+        batch_size: SCAN COUNT hint and batch length
+
+    Yields:
+        Lists of up to batch_size keys
+    """
+    batch = []
+    async for key in client.scan_iter(match=pattern, count=batch_size):
+        batch.append(key)
+        if len(batch) >= batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+async def unlink_keys_async(client, pattern: str, batch_size: int = 500) -> int:
+    """
+    Async counterpart of redis_pool.unlink_keys().
+
+    Args:
+        client: redis.asyncio client
+        pattern: Glob-style key pattern
+        batch_size: Keys per SCAN/UNLINK batch
+
+    Returns:
+        Number of keys removed
+    """
+    removed = 0
+    async for batch in scan_keys_async(client, pattern, batch_size):
+        removed += await client.unlink(*batch)
+    return removed
+
+
+async def expire_keys_async(client, pattern: str, ttl_seconds: int, batch_size: int = 500) -> int:
+    """
+    Async counterpart of redis_pool.expire_keys().
+
+    Args:
+        client: redis.asyncio client
+        pattern: Glob-style key pattern
+        ttl_seconds: Time to live in seconds
+        batch_size: Keys per SCAN/pipeline batch
+
+    Returns:
+        Number of keys given the TTL
+    """
+    expired = 0
+    async for batch in scan_keys_async(client, pattern, batch_size):
+        async with client.pipeline(transaction=False) as pipe:
+            for key in batch:
+                pipe.expire(key, ttl_seconds)
+            expired += sum(1 for ok in await pipe.execute() if ok)
+    return expired
+
+
+def write_through(sync_class: type, name: str):
+    """
+    Build an async method that runs a sync method and awaits its writes.
+
+    Args:
+        sync_class: Wrapped class (for the docstring)
+        name: Method name
+
+    Returns:
+        Coroutine function with the same arguments and return value
+    """
+    async def method(self, *args, **kwargs):
+        result = getattr(self._sync, name)(*args, **kwargs)
+        await self._flush()
+        return result
+
+    method.__name__ = name
+    method.__doc__ = getattr(sync_class, name).__doc__
+    return method
@@ -0,0 +1,73 @@
+"""
+Line deltas for chapter version history.
+Each editing pass is stored as the lines it changed relative to the
+previous version instead of a full copy of the chapter.
+"""
+
+import difflib
+import hashlib
+from typing import List, Tuple
+
+# [start line, end line, replacement text] against the base version
+DeltaOp = Tuple[int, int, str]
+
+
+def content_hash(text: str) -> str:
+    """
+    Get the content address of a chapter text.
+
+    Args:
+        text: Chapter text
+
+    Returns:
+        Hex SHA-256 digest
+    """
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def make_delta(base: str, text: str) -> List[DeltaOp]:
+    """
+    Compute the line edits that turn base into text.
+
+    Args:
+        base: Previous version of the chapter
+        text: New version of the chapter
+
+    Returns:
+        List of [start, end, replacement] ops over base lines
+    """
+    base_lines = base.splitlines(keepends=True)
+    new_lines = text.splitlines(keepends=True)
+    matcher = difflib.SequenceMatcher(None, base_lines, new_lines, autojunk=False)
+    return [
+        [i1, i2, "".join(new_lines[j1:j2])]
+        for tag, i1, i2, j1, j2 in matcher.get_opcodes()
+        if tag != "equal"
+    ]
+
+
+def apply_delta(base: str, ops: List[DeltaOp]) -> str:
+    """
+    Rebuild a version from its base and a delta from make_delta().
+
+    Args:
+        base: Base version of the chapter
+        ops: Delta ops
+
+    Returns:
+        Reconstructed chapter text
+    """
+    base_lines = base.splitlines(keepends=True)
+    parts = []
+    position = 0
+    for start, end, replacement in ops:
+        parts.extend(base_lines[position:start])
+        parts.append(replacement)
+        position = end
+    parts.extend(base_lines[position:])
+    return "".join(parts)
+
+
+def delta_size(ops: List[DeltaOp]) -> int:
+    """Approximate stored size of a delta in characters."""
+    return sum(len(replacement) + 16 for _, _, replacement in ops)
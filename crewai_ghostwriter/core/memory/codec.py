@@ -0,0 +1,222 @@
+"""
+Value codec for Redis storage.
+Compresses large JSON values (chapter text, task results) on write and
+decompresses them on read, so more books stay resident on one Redis.
+Serialization uses orjson when installed.
+"""
+
+import base64
+import json
+import threading
+import zlib
+from typing import Any, Dict, Optional, Tuple, Union
+
+try:
+    import zstandard
+except ImportError:  # zstd is optional; zlib ships with Python
+    zstandard = None
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; falls back to the json module
+    orjson = None
+
+
+# Compressed values are stored as "<algorithm>:<base85 payload>". JSON text
+# never starts with a letter other than t/f/n, so the markers can't collide
+# with uncompressed values written by older versions.
+COMPRESSED_PREFIXES = ("zstd:", "zlib:")
+
+
+def json_dumps(value: Any, sort_keys: bool = False) -> str:
+    """
+    Serialize a value to compact JSON text (with orjson if installed).
+
+    Args:
+        value: JSON-serializable value (non-string dict keys are stringified)
+        sort_keys: Sort object keys, for stable output
+
+    Returns:
+        JSON text
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_SORT_KEYS if sort_keys else 0)
+        try:
+            return orjson.dumps(value, option=option).decode("utf-8")
+        except TypeError:
+            pass  # e.g. integers over 64 bits, which the json module handles
+    return json.dumps(value, sort_keys=sort_keys, separators=(",", ":"))
+
+
+def json_loads(text: Union[str, bytes]) -> Any:
+    """
+    Deserialize JSON text (with orjson if installed).
+
+    Args:
+        text: JSON text
+
+    Returns:
+        Deserialized value
+    """
+    return orjson.loads(text) if orjson is not None else json.loads(text)
+
+
+class ValueCodec:
+    """
+    Transparent compression for values stored in Redis.
+
+    Values under the size threshold are stored as plain JSON. Larger ones
+    are compressed with zstd (if installed) or zlib and base85-encoded, since
+    the Redis clients run with decode_responses=True and need text values.
+
+    The codec also tracks raw vs stored size per key for the values it has
+    written or read, so callers can report a compression ratio.
+    """
+
+    def __init__(
+        self,
+        threshold: int = 1024,
+        algorithm: Optional[str] = None,
+        level: Optional[int] = None
+    ):
+        """
+        Initialize value codec.
+
+        Args:
+            threshold: Minimum serialized size in bytes to compress (default: 1024)
+            algorithm: "zstd", "zlib" or "none" (default: zstd if installed, else zlib)
+            level: Compression level (default: 3 for zstd, 6 for zlib)
+        """
+        if algorithm is None:
+            algorithm = "zstd" if zstandard is not None else "zlib"
+        if algorithm == "zstd" and zstandard is None:
+            raise ValueError("zstd compression requires the zstandard package")
+        if algorithm not in ("zstd", "zlib", "none"):
+            raise ValueError(f"Unknown compression algorithm: {algorithm}")
+
+        self.threshold = threshold
+        self.algorithm = algorithm
+        self.level = level if level is not None else (3 if algorithm == "zstd" else 6)
+        self.lock = threading.Lock()
+
+        self._sizes: Dict[str, Tuple[int, int]] = {}  # key → (raw bytes, stored bytes)
+
+    def compress(self, text: str) -> str:
+        """
+        Compress a serialized value if it's over the threshold.
+
+        Args:
+            text: Serialized value
+
+        Returns:
+            Text to store in Redis
+        """
+        raw = text.encode("utf-8")
+        if self.algorithm == "none" or len(raw) < self.threshold:
+            return text
+
+        if self.algorithm == "zstd":
+            payload = zstandard.ZstdCompressor(level=self.level).compress(raw)
+        else:
+            payload = zlib.compress(raw, self.level)
+
+        data = f"{self.algorithm}:{base64.b85encode(payload).decode('ascii')}"
+        # Incompressible values are kept as they are
+        return data if len(data) < len(raw) else text
+
+    def decompress(self, data: str) -> str:
+        """
+        Restore a value written by compress().
+
+        Args:
+            data: Text read from Redis (compressed or plain)
+
+        Returns:
+            Serialized value
+        """
+        if not data.startswith(COMPRESSED_PREFIXES):
+            return data
+
+        algorithm, payload = data.split(":", 1)
+        payload = base64.b85decode(payload)
+        if algorithm == "zstd":
+            if zstandard is None:
+                raise ValueError("Value is zstd-compressed but zstandard is not installed")
+            raw = zstandard.ZstdDecompressor().decompress(payload)
+        else:
+            raw = zlib.decompress(payload)
+        return raw.decode("utf-8")
+
+    def encode(self, value: Any, key: Optional[str] = None) -> str:
+        """
+        Serialize and compress a value.
+
+        Args:
+            value: JSON-serializable value
+            key: Redis key, for size accounting
+
+        Returns:
+            Text to store in Redis
+        """
+        text = json_dumps(value)
+        data = self.compress(text)
+        if key is not None:
+            self._track(key, text, data)
+        return data
+
+    def decode(self, data: str, key: Optional[str] = None) -> Any:
+        """
+        Decompress and deserialize a value.
+
+        Args:
+            data: Text read from Redis
+            key: Redis key, for size accounting
+
+        Returns:
+            Deserialized value
+        """
+        text = self.decompress(data)
+        if key is not None:
+            self._track(key, text, data)
+        return json_loads(text)
+
+    def _track(self, key: str, text: str, data: str):
+        """Record raw and stored size of a key's current value."""
+        sizes = (len(text.encode("utf-8")), len(data.encode("utf-8")))
+        with self.lock:
+            self._sizes[key] = sizes
+
+    def forget(self, key: Optional[str] = None):
+        """
+        Drop size accounting for a key (or all keys).
+
+        Args:
+            key: Redis key, or None to reset everything
+        """
+        with self.lock:
+            if key is None:
+                self._sizes.clear()
+            else:
+                self._sizes.pop(key, None)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get compression statistics for tracked values.
+
+        Returns:
+            Dictionary with raw/stored bytes and compression ratio
+        """
+        with self.lock:
+            raw_bytes = sum(raw for raw, _ in self._sizes.values())
+            stored_bytes = sum(stored for _, stored in self._sizes.values())
+            values = len(self._sizes)
+
+        return {
+            "algorithm": self.algorithm,
+            "serializer": "orjson" if orjson is not None else "json",
+            "threshold": self.threshold,
+            "values": values,
+            "raw_bytes": raw_bytes,
+            "stored_bytes": stored_bytes,
+            "compression_ratio": round(raw_bytes / stored_bytes, 2) if stored_bytes else 1.0
+        }
@@ -0,0 +1,183 @@
+"""
+Near-duplicate detection for cross-chapter flags.
+Agents often flag the same problem from several chapters in slightly
+different words; MinHash signatures over the issue detail, bucketed by
+locality-sensitive hashing, find such flags without comparing every pair.
+"""
+
+import hashlib
+import random
+import re
+from typing import Dict, Hashable, List, Optional, Set, Tuple
+
+# Character shingles cope better than word shingles with short, reworded details
+SHINGLE_SIZE = 4
+NUM_PERMUTATIONS = 64
+BANDS = 16  # 16 bands of 4 rows: pairs above ~0.5 similarity usually share a band
+DEFAULT_THRESHOLD = 0.8  # Distinct issues about the same chapters often score 0.5-0.7
+
+# Flag severities, most severe first
+SEVERITY_RANK = {"critical": 0, "high": 1, "medium": 2, "low": 3}
+
+_PRIME = (1 << 61) - 1
+_rng = random.Random(1729)  # Fixed seed: signatures must match across processes
+_PERMUTATIONS = [(_rng.randrange(1, _PRIME), _rng.randrange(0, _PRIME)) for _ in range(NUM_PERMUTATIONS)]
+
+Signature = Tuple[int, ...]
+
+
+def normalize(text: str) -> str:
+    """Lowercase text and collapse punctuation and whitespace to single spaces."""
+    return " ".join(re.findall(r"[a-z0-9]+", (text or "").lower()))
+
+
+def shingles(text: str, size: int = SHINGLE_SIZE) -> Set[str]:
+    """
+    Split normalized text into overlapping character shingles.
+
+    Args:
+        text: Text to shingle
+        size: Characters per shingle
+
+    Returns:
+        Set of shingles (the whole text if it's shorter than size)
+    """
+    normalized = normalize(text)
+    return {normalized[i:i + size] for i in range(max(1, len(normalized) - size + 1))}
+
+
+def minhash_signature(text: str) -> Signature:
+    """
+    Compute the MinHash signature of a text.
+
+    Args:
+        text: Text to sign
+
+    Returns:
+        NUM_PERMUTATIONS minimum hash values
+    """
+    hashes = [
+        int.from_bytes(hashlib.blake2b(shingle.encode("utf-8"), digest_size=8).digest(), "big")
+        for shingle in shingles(text)
+    ]
+    return tuple(min((a * h + b) % _PRIME for h in hashes) for a, b in _PERMUTATIONS)
+
+
+def estimate_similarity(first: Signature, second: Signature) -> float:
+    """
+    Estimate the Jaccard similarity of two texts from their signatures.
+
+    Args:
+        first: MinHash signature
+        second: MinHash signature
+
+    Returns:
+        Fraction of matching signature positions (0.0-1.0)
+    """
+    return sum(1 for a, b in zip(first, second) if a == b) / len(first)
+
+
+class FlagDedupeIndex:
+    """
+    LSH index of open flags for finding near-duplicates.
+
+    Flags are grouped by a key (e.g. affected chapter and issue type) and
+    only flags with the same key are compared. Each signature is split into
+    bands; flags sharing a band are candidates, so a lookup only compares
+    against a few candidates however many flags are open.
+
+    Texts shorter than one shingle (e.g. a flag with no detail) say nothing
+    about what the flag is, so they're never indexed or matched.
+    """
+
+    def __init__(self, threshold: float = DEFAULT_THRESHOLD):
+        """
+        Initialize dedupe index.
+
+        Args:
+            threshold: Minimum estimated similarity for a duplicate
+        """
+        self.threshold = threshold
+        self._signatures: Dict[str, Tuple[Hashable, Signature]] = {}  # flag_id → (key, signature)
+        self._buckets: Dict[Tuple[Hashable, int, Signature], Set[str]] = {}  # (key, band, rows) → flag IDs
+
+    @staticmethod
+    def _bands(signature: Signature) -> List[Tuple[int, Signature]]:
+        """Split a signature into (band number, rows) pairs."""
+        rows = len(signature) // BANDS
+        return [(band, signature[band * rows:(band + 1) * rows]) for band in range(BANDS)]
+
+    def add(self, flag_id: str, key: Hashable, text: str):
+        """
+        Index a flag.
+
+        Args:
+            flag_id: Flag ID
+            key: Group the flag is compared within
+            text: Text to compare (the issue detail)
+        """
+        self.remove(flag_id)
+        if not self.comparable(text):
+            return
+        signature = minhash_signature(text)
+        self._signatures[flag_id] = (key, signature)
+        for band, rows in self._bands(signature):
+            self._buckets.setdefault((key, band, rows), set()).add(flag_id)
+
+    @staticmethod
+    def comparable(text: str) -> bool:
+        """Whether a text is long enough to shingle."""
+        return len(normalize(text)) >= SHINGLE_SIZE
+
+    def remove(self, flag_id: str):
+        """
+        Drop a flag from the index (no-op if it isn't indexed).
+
+        Args:
+            flag_id: Flag ID
+        """
+        entry = self._signatures.pop(flag_id, None)
+        if entry is None:
+            return
+        key, signature = entry
+        for band, rows in self._bands(signature):
+            bucket = self._buckets.get((key, band, rows))
+            if bucket is not None:
+                bucket.discard(flag_id)
+                if not bucket:
+                    del self._buckets[(key, band, rows)]
+
+    def find_duplicate(self, key: Hashable, text: str) -> Optional[Tuple[str, float]]:
+        """
+        Find the indexed flag most similar to a text.
+
+        Args:
+            key: Group to search
+            text: Text to compare (the issue detail)
+
+        Returns:
+            (flag_id, similarity) of the best match at or above the
+            threshold, or None (always for texts too short to compare)
+        """
+        if not self.comparable(text):
+            return None
+        signature = minhash_signature(text)
+        candidates = set()
+        for band, rows in self._bands(signature):
+            candidates |= self._buckets.get((key, band, rows), set())
+
+        best = None
+        for flag_id in sorted(candidates):  # Sorted so ties resolve the same way everywhere
+            similarity = estimate_similarity(signature, self._signatures[flag_id][1])
+            if similarity >= self.threshold and (best is None or similarity > best[1]):
+                best = (flag_id, similarity)
+        return best
+
+    def clear(self):
+        """Remove every flag from the index."""
+        self._signatures.clear()
+        self._buckets.clear()
+
+    def __len__(self) -> int:
+        """Number of indexed flags."""
+        return len(self._signatures)
@@ -0,0 +1,608 @@
+"""
+Embedded, server-free storage backend.
+A SQLite (WAL mode) store that answers the Redis commands used by
+ManuscriptMemory, WorkflowStateManager and their helpers, for
+single-machine batch runs and CI without a Redis server.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Tuple, Union
+from .redis_pool import get_redis_client
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS strings (key TEXT PRIMARY KEY, value TEXT NOT NULL) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS hashes (
+    key TEXT NOT NULL, field TEXT NOT NULL, value TEXT NOT NULL,
+    PRIMARY KEY (key, field)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS sets (
+    key TEXT NOT NULL, member TEXT NOT NULL,
+    PRIMARY KEY (key, member)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS zsets (
+    key TEXT NOT NULL, member TEXT NOT NULL, score REAL NOT NULL,
+    PRIMARY KEY (key, member)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS zsets_by_score ON zsets (key, score, member);
+CREATE TABLE IF NOT EXISTS streams (
+    key TEXT NOT NULL, ms INTEGER NOT NULL, seq INTEGER NOT NULL, fields TEXT NOT NULL,
+    PRIMARY KEY (key, ms, seq)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS expiry (key TEXT PRIMARY KEY, expires_at REAL NOT NULL) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS expiry_by_time ON expiry (expires_at);
+"""
+
+TABLES = ("strings", "hashes", "sets", "zsets", "streams")
+
+
+_now = time.time
+
+
+def _stream_id(entry_id: str) -> Tuple[int, int]:
+    """Parse a stream entry ID ("ms-seq" or "ms")."""
+    ms, _, seq = entry_id.partition("-")
+    return int(ms), int(seq or 0)
+
+
+def _encode(value: Any) -> str:
+    """Store values as text, like Redis does for str/int/float."""
+    if isinstance(value, bool) or not isinstance(value, (str, int, float)):
+        raise TypeError(f"Invalid value type {type(value).__name__}; convert to str first")
+    return str(value)
+
+
+class LocalPipeline:
+    """
+    Queued commands for a LocalStore, run in one SQLite transaction.
+
+    Mirrors redis.client.Pipeline: commands return the pipeline, and
+    execute() returns their results in order. After watch() commands run
+    immediately until multi(), as in redis-py; LocalStore.transaction()
+    holds the write lock throughout, so watched keys can't change.
+    """
+
+    def __init__(self, store: "LocalStore"):
+        """
+        Initialize pipeline.
+
+        Args:
+            store: Store the commands run against
+        """
+        self.store = store
+        self.commands: List[Tuple[str, tuple, dict]] = []
+        self.watching = False
+
+    def __enter__(self) -> "LocalPipeline":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.commands = []
+        self.watching = False
+
+    def watch(self, *names: str):
+        """Run commands immediately until multi()."""
+        self.watching = True
+
+    def unwatch(self):
+        """Go back to queueing commands."""
+        self.watching = False
+
+    def multi(self):
+        """Start queueing the commands of the transaction."""
+        self.watching = False
+
+    def __getattr__(self, name: str):
+        """Queue a store command (or run it, while watching)."""
+        if not callable(getattr(LocalStore, name, None)) or name.startswith("_"):
+            raise AttributeError(name)
+        if self.watching:
+            return getattr(self.store, name)
+
+        def queue(*args, **kwargs):
+            self.commands.append((name, args, kwargs))
+            return self
+
+        return queue
+
+    def execute(self) -> List[Any]:
+        """
+        Run the queued commands atomically.
+
+        Returns:
+            List of command results
+        """
+        commands, self.commands = self.commands, []
+        with self.store._transaction():
+            return [getattr(self.store, name)(*args, **kwargs) for name, args, kwargs in commands]
+
+
+class LocalStore:
+    """
+    Redis-compatible key-value store on an embedded SQLite database.
+
+    Supports strings, hashes, sets and sorted sets with the redis-py
+    signatures (decode_responses=True: values come back as str) and
+    pipelines, so it can be passed anywhere a Redis client is accepted
+    by the memory and state classes. Lua scripts are not supported: use
+    the in-process rate limiter and result cache with this backend.
+
+    The database runs in WAL mode, so several processes on one machine
+    can share a file; every command or pipeline is one transaction.
+    Keys given a TTL with expire() are removed within about a second of
+    expiring.
+    """
+
+    def __init__(self, path: str = ":memory:", busy_timeout_ms: int = 5000):
+        """
+        Initialize local store.
+
+        Args:
+            path: Database file (default: in-memory, for tests)
+            busy_timeout_ms: Max wait for another process's write lock
+        """
+        if path != ":memory:":
+            directory = os.path.dirname(os.path.abspath(path))
+            os.makedirs(directory, exist_ok=True)
+
+        self.path = path
+        self.lock = threading.RLock()
+        self._depth = 0  # Nested transaction depth (pipelines, multi-row commands)
+        self._next_purge = 0.0  # Monotonic time of the next expired-key sweep
+
+        self.conn = sqlite3.connect(path, isolation_level=None, check_same_thread=False)
+        self.conn.execute(f"PRAGMA busy_timeout = {int(busy_timeout_ms)}")
+        if path != ":memory:":
+            self.conn.execute("PRAGMA journal_mode = WAL")
+            self.conn.execute("PRAGMA synchronous = NORMAL")
+        self.conn.executescript(SCHEMA)
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        """Run commands in one write transaction (reentrant)."""
+        with self.lock:
+            if self._depth == 0:
+                self._purge_expired()
+                self.conn.execute("BEGIN IMMEDIATE")
+            self._depth += 1
+            try:
+                yield self.conn
+            except BaseException:
+                self._depth -= 1
+                if self._depth == 0:
+                    self.conn.execute("ROLLBACK")
+                raise
+            self._depth -= 1
+            if self._depth == 0:
+                self.conn.execute("COMMIT")
+
+    def _query(self, sql: str, params: tuple = ()) -> List[tuple]:
+        """Run a read query."""
+        with self.lock:
+            if self._depth == 0:
+                self._purge_expired()
+            return self.conn.execute(sql, params).fetchall()
+
+    def _purge_expired(self):
+        """Delete keys whose TTL has passed (at most once a second)."""
+        if time.monotonic() < self._next_purge:
+            return
+        self._next_purge = time.monotonic() + 1.0
+
+        now = _now()
+        if not self.conn.execute("SELECT 1 FROM expiry WHERE expires_at <= ? LIMIT 1", (now,)).fetchone():
+            return
+
+        self.conn.execute("BEGIN IMMEDIATE")
+        expired = "SELECT key FROM expiry WHERE expires_at <= ?"
+        for table in TABLES + ("expiry",):
+            self.conn.execute(f"DELETE FROM {table} WHERE key IN ({expired})", (now,))
+        self.conn.execute("COMMIT")
+
+    def pipeline(self, transaction: bool = True) -> LocalPipeline:
+        """
+        Start a pipeline (always transactional).
+
+        Returns:
+            LocalPipeline
+        """
+        return LocalPipeline(self)
+
+    def transaction(self, func: Callable[[LocalPipeline], Any], *watches: str, value_from_callable: bool = False):
+        """
+        Run a read-modify-write callable atomically (redis-py's transaction()).
+
+        Args:
+            func: Callable taking the pipeline; it reads immediately, then
+                calls multi() and queues its writes
+            *watches: Keys read by func (the whole store is locked anyway)
+            value_from_callable: Return func's result instead of the writes'
+
+        Returns:
+            func's result or the queued commands' results
+        """
+        with self._transaction(), self.pipeline() as pipe:
+            pipe.watch(*watches)
+            value = func(pipe)
+            results = pipe.execute()
+            return value if value_from_callable else results
+
+    def ping(self) -> bool:
+        """Check the database is usable."""
+        self._query("SELECT 1")
+        return True
+
+    def close(self):
+        """Close the database."""
+        with self.lock:
+            self.conn.close()
+
+    # Keys
+
+    def keys(self, pattern: str = "*") -> List[str]:
+        """Get all keys matching a glob-style pattern."""
+        union = " UNION ".join(f"SELECT key FROM {table} WHERE key GLOB ?" for table in TABLES)
+        return [row[0] for row in self._query(union, (pattern,) * len(TABLES))]
+
+    def scan_iter(self, match: str = "*", count: int = 500) -> Iterator[str]:
+        """Iterate over keys matching a pattern, count keys per query."""
+        union = " UNION ".join(f"SELECT key FROM {table} WHERE key GLOB ? AND key > ?" for table in TABLES)
+        last = ""
+        while True:
+            rows = self._query(
+                f"SELECT key FROM ({union}) ORDER BY key LIMIT ?",
+                (match, last) * len(TABLES) + (count,)
+            )
+            for (key,) in rows:
+                yield key
+            if len(rows) < count:
+                return
+            last = rows[-1][0]
+
+    def exists(self, *names: str) -> int:
+        """Count how many of the keys exist."""
+        return sum(1 for name in names if self._type(name) is not None)
+
+    def _type(self, name: str) -> Optional[str]:
+        """Table holding a key, or None."""
+        for table in TABLES:
+            if self._query(f"SELECT 1 FROM {table} WHERE key = ? LIMIT 1", (name,)):
+                return table
+        return None
+
+    def delete(self, *names: str) -> int:
+        """Delete keys; returns how many existed."""
+        deleted = 0
+        with self._transaction() as conn:
+            for name in names:
+                existed = False
+                for table in TABLES:
+                    existed |= conn.execute(f"DELETE FROM {table} WHERE key = ?", (name,)).rowcount > 0
+                conn.execute("DELETE FROM expiry WHERE key = ?", (name,))
+                deleted += existed
+        return deleted
+
+    def unlink(self, *names: str) -> int:
+        """Delete keys (same as delete(); SQLite frees pages on commit)."""
+        return self.delete(*names)
+
+    def expire(self, name: str, time: int) -> bool:
+        """Set a key's time to live in seconds; False if the key doesn't exist."""
+        with self._transaction() as conn:
+            if self._type(name) is None:
+                return False
+            conn.execute(
+                "INSERT OR REPLACE INTO expiry (key, expires_at) VALUES (?, ?)",
+                (name, _now() + int(time))
+            )
+        return True
+
+    def ttl(self, name: str) -> int:
+        """Remaining time to live in seconds (-1 without a TTL, -2 if missing)."""
+        if self._type(name) is None:
+            return -2
+        rows = self._query("SELECT expires_at FROM expiry WHERE key = ?", (name,))
+        return max(0, round(rows[0][0] - _now())) if rows else -1
+
+    # Strings
+
+    def get(self, name: str) -> Optional[str]:
+        """Get a string value."""
+        rows = self._query("SELECT value FROM strings WHERE key = ?", (name,))
+        return rows[0][0] if rows else None
+
+    def mget(self, keys: Union[str, List[str]], *args: str) -> List[Optional[str]]:
+        """Get several string values in order."""
+        names = ([keys] if isinstance(keys, str) else list(keys)) + list(args)
+        values = {}
+        for start in range(0, len(names), 500):
+            chunk = names[start:start + 500]
+            placeholders = ",".join("?" * len(chunk))
+            values.update(self._query(f"SELECT key, value FROM strings WHERE key IN ({placeholders})", tuple(chunk)))
+        return [values.get(name) for name in names]
+
+    def set(self, name: str, value: Any, nx: bool = False, ex: Optional[int] = None) -> Optional[bool]:
+        """Set a string value (only if absent with nx=True, expiring after ex seconds)."""
+        with self._transaction() as conn:
+            if nx:
+                self._purge_key_if_expired(conn, name)
+                inserted = conn.execute(
+                    "INSERT OR IGNORE INTO strings (key, value) VALUES (?, ?)", (name, _encode(value))
+                ).rowcount
+                if not inserted:
+                    return None
+            else:
+                conn.execute("INSERT OR REPLACE INTO strings (key, value) VALUES (?, ?)", (name, _encode(value)))
+                conn.execute("DELETE FROM expiry WHERE key = ?", (name,))  # SET clears the TTL
+            if ex is not None:
+                conn.execute(
+                    "INSERT OR REPLACE INTO expiry (key, expires_at) VALUES (?, ?)", (name, _now() + int(ex))
+                )
+        return True
+
+    def _purge_key_if_expired(self, conn: sqlite3.Connection, name: str):
+        """Drop a key whose TTL has passed (purging is otherwise batched)."""
+        row = conn.execute("SELECT expires_at FROM expiry WHERE key = ?", (name,)).fetchone()
+        if row and row[0] <= _now():
+            for table in TABLES + ("expiry",):
+                conn.execute(f"DELETE FROM {table} WHERE key = ?", (name,))
+
+    def incr(self, name: str, amount: int = 1) -> int:
+        """Increment an integer value (keeps its TTL)."""
+        with self._transaction() as conn:
+            value = int(self.get(name) or 0) + amount
+            conn.execute("INSERT OR REPLACE INTO strings (key, value) VALUES (?, ?)", (name, str(value)))
+        return value
+
+    def incrby(self, name: str, amount: int = 1) -> int:
+        """Increment an integer value by amount."""
+        return self.incr(name, amount)
+
+    # Hashes
+
+    def hset(
+        self,
+        name: str,
+        key: Optional[str] = None,
+        value: Any = None,
+        mapping: Optional[Dict[str, Any]] = None
+    ) -> int:
+        """Set hash fields; returns how many were new."""
+        items = dict(mapping or {})
+        if key is not None:
+            items[key] = value
+
+        added = 0
+        with self._transaction() as conn:
+            for field, field_value in items.items():
+                field = _encode(field)
+                exists = conn.execute(
+                    "SELECT 1 FROM hashes WHERE key = ? AND field = ?", (name, field)
+                ).fetchone()
+                conn.execute(
+                    "INSERT OR REPLACE INTO hashes (key, field, value) VALUES (?, ?, ?)",
+                    (name, field, _encode(field_value))
+                )
+                added += exists is None
+        return added
+
+    def hsetnx(self, name: str, key: str, value: Any) -> bool:
+        """Set a hash field only if it doesn't exist."""
+        with self._transaction() as conn:
+            return conn.execute(
+                "INSERT OR IGNORE INTO hashes (key, field, value) VALUES (?, ?, ?)",
+                (name, _encode(key), _encode(value))
+            ).rowcount > 0
+
+    def hget(self, name: str, key: str) -> Optional[str]:
+        """Get a hash field."""
+        rows = self._query("SELECT value FROM hashes WHERE key = ? AND field = ?", (name, _encode(key)))
+        return rows[0][0] if rows else None
+
+    def hmget(self, name: str, keys: Union[Any, List[Any]], *args: Any) -> List[Optional[str]]:
+        """Get several hash fields in order."""
+        fields = [_encode(key) for key in ((list(keys) if isinstance(keys, (list, tuple)) else [keys]) + list(args))]
+        values = {}
+        for start in range(0, len(fields), 500):
+            chunk = fields[start:start + 500]
+            placeholders = ",".join("?" * len(chunk))
+            values.update(self._query(
+                f"SELECT field, value FROM hashes WHERE key = ? AND field IN ({placeholders})", (name, *chunk)
+            ))
+        return [values.get(field) for field in fields]
+
+    def hgetall(self, name: str) -> Dict[str, str]:
+        """Get all fields of a hash."""
+        return dict(self._query("SELECT field, value FROM hashes WHERE key = ?", (name,)))
+
+    def hdel(self, name: str, *keys: Any) -> int:
+        """Delete hash fields; returns how many existed."""
+        with self._transaction() as conn:
+            return sum(
+                conn.execute("DELETE FROM hashes WHERE key = ? AND field = ?", (name, _encode(key))).rowcount
+                for key in keys
+            )
+
+    def hlen(self, name: str) -> int:
+        """Count hash fields."""
+        return self._query("SELECT COUNT(*) FROM hashes WHERE key = ?", (name,))[0][0]
+
+    # Sets
+
+    def sadd(self, name: str, *values: Any) -> int:
+        """Add set members; returns how many were new."""
+        with self._transaction() as conn:
+            return sum(
+                conn.execute("INSERT OR IGNORE INTO sets (key, member) VALUES (?, ?)", (name, _encode(value))).rowcount
+                for value in values
+            )
+
+    def srem(self, name: str, *values: Any) -> int:
+        """Remove set members; returns how many existed."""
+        with self._transaction() as conn:
+            return sum(
+                conn.execute("DELETE FROM sets WHERE key = ? AND member = ?", (name, _encode(value))).rowcount
+                for value in values
+            )
+
+    def smembers(self, name: str) -> Set[str]:
+        """Get all set members."""
+        return {row[0] for row in self._query("SELECT member FROM sets WHERE key = ?", (name,))}
+
+    # Lists
+
+    def lrange(self, name: str, start: int, end: int) -> List[str]:
+        """Lists aren't stored, so like Redis for a missing key this is always empty."""
+        return []
+
+    # Sorted sets
+
+    def zadd(self, name: str, mapping: Dict[Any, float]) -> int:
+        """Add or update sorted set members; returns how many were new."""
+        added = 0
+        with self._transaction() as conn:
+            for member, score in mapping.items():
+                member = _encode(member)
+                exists = conn.execute(
+                    "SELECT 1 FROM zsets WHERE key = ? AND member = ?", (name, member)
+                ).fetchone()
+                conn.execute(
+                    "INSERT OR REPLACE INTO zsets (key, member, score) VALUES (?, ?, ?)",
+                    (name, member, float(score))
+                )
+                added += exists is None
+        return added
+
+    def zrem(self, name: str, *values: Any) -> int:
+        """Remove sorted set members; returns how many existed."""
+        with self._transaction() as conn:
+            return sum(
+                conn.execute("DELETE FROM zsets WHERE key = ? AND member = ?", (name, _encode(value))).rowcount
+                for value in values
+            )
+
+    def zrange(
+        self,
+        name: str,
+        start: int,
+        end: int,
+        withscores: bool = False
+    ) -> List[Union[str, Tuple[str, float]]]:
+        """Get sorted set members by rank (end inclusive, negatives from the end)."""
+        rows = self._query(
+            "SELECT member, score FROM zsets WHERE key = ? ORDER BY score, member", (name,)
+        )
+        rows = rows[start:end + 1 if end != -1 else None]
+        return [(member, score) for member, score in rows] if withscores else [member for member, _ in rows]
+
+    def zscore(self, name: str, value: Any) -> Optional[float]:
+        """Get a sorted set member's score (None if it isn't a member)."""
+        rows = self._query("SELECT score FROM zsets WHERE key = ? AND member = ?", (name, _encode(value)))
+        return rows[0][0] if rows else None
+
+    def zcard(self, name: str) -> int:
+        """Count sorted set members."""
+        return self._query("SELECT COUNT(*) FROM zsets WHERE key = ?", (name,))[0][0]
+
+    # Streams
+
+    def xadd(self, name: str, fields: Dict[str, Any]) -> str:
+        """Append a stream entry with an auto-generated ID; returns the ID."""
+        with self._transaction() as conn:
+            ms = int(_now() * 1000)
+            last = conn.execute(
+                "SELECT ms, seq FROM streams WHERE key = ? ORDER BY ms DESC, seq DESC LIMIT 1", (name,)
+            ).fetchone()
+            seq = 0
+            if last and ms <= last[0]:
+                ms, seq = last[0], last[1] + 1  # IDs never go backwards
+            conn.execute(
+                "INSERT INTO streams (key, ms, seq, fields) VALUES (?, ?, ?, ?)",
+                (name, ms, seq, json.dumps({field: _encode(value) for field, value in fields.items()}))
+            )
+        return f"{ms}-{seq}"
+
+    def xrange(self, name: str, min: str = "-", max: str = "+") -> List[Tuple[str, Dict[str, str]]]:
+        """Get stream entries between two IDs (inclusive), oldest first."""
+        low = (-1, -1) if min == "-" else _stream_id(min)
+        high = (2 ** 63 - 1, 2 ** 63 - 1) if max == "+" else _stream_id(max)
+        rows = self._query(
+            "SELECT ms, seq, fields FROM streams WHERE key = ? AND (ms, seq) >= (?, ?) AND (ms, seq) <= (?, ?) "
+            "ORDER BY ms, seq",
+            (name,) + low + high
+        )
+        return [(f"{ms}-{seq}", json.loads(fields)) for ms, seq, fields in rows]
+
+    def xlen(self, name: str) -> int:
+        """Count stream entries."""
+        return self._query("SELECT COUNT(*) FROM streams WHERE key = ?", (name,))[0][0]
+
+    def xtrim(self, name: str, maxlen: int, approximate: bool = True) -> int:
+        """Keep only the newest maxlen entries (always exact); returns how many were removed."""
+        with self._transaction() as conn:
+            return conn.execute(
+                "DELETE FROM streams WHERE key = ? AND (ms, seq) NOT IN "
+                "(SELECT ms, seq FROM streams WHERE key = ? ORDER BY ms DESC, seq DESC LIMIT ?)",
+                (name, name, int(maxlen))
+            ).rowcount
+
+    def register_script(self, script: str):
+        """Lua scripts need a Redis server."""
+        raise NotImplementedError(
+            "LocalStore can't run Redis Lua scripts; use the in-process "
+            "rate limiter and result cache with the sqlite storage backend"
+        )
+
+
+_stores: Dict[str, LocalStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_local_store(path: Optional[str] = None) -> LocalStore:
+    """
+    Get the process-wide LocalStore for a database file.
+
+    Args:
+        path: Database file (default: STORAGE_PATH or ./data/ghostwriter.db)
+
+    Returns:
+        Shared LocalStore
+    """
+    path = os.path.abspath(path or os.getenv("STORAGE_PATH", "./data/ghostwriter.db"))
+    with _stores_lock:
+        store = _stores.get(path)
+        if store is None:
+            store = LocalStore(path)
+            _stores[path] = store
+        return store
+
+
+def get_storage_client(
+    redis_host: Optional[str] = None,
+    redis_port: Optional[int] = None,
+    backend: Optional[str] = None,
+    path: Optional[str] = None
+):
+    """
+    Get the shared client for the configured storage backend.
+
+    Args:
+        redis_host: Redis server host (redis backend)
+        redis_port: Redis server port (redis backend)
+        backend: "redis" or "sqlite" (default: STORAGE_BACKEND or "redis")
+        path: Database file (sqlite backend)
+
+    Returns:
+        Pooled Redis client or LocalStore
+    """
+    backend = backend or os.getenv("STORAGE_BACKEND", "redis")
+    if backend == "redis":
+        return get_redis_client(redis_host, redis_port)
+    if backend == "sqlite":
+        return get_local_store(path)
+    raise ValueError(f"Unknown storage backend: {backend}")
@@ -3,11 +3,23 @@ Short-term memory system for manuscript processing.
 Stores context during single book processing including cross-chapter flags.
 """
 
+import difflib
+import hashlib
 import json
-from typing import Dict, List, Any, Optional
+import threading
+from bisect import insort
+from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime
 import redis
-from .story_contract import GlobalStoryContract
+from .story_contract import GlobalStoryContract, split_chapter_ranges
+from .codec import ValueCodec, json_dumps, json_loads
+from .local_store import get_storage_client
+from .redis_pool import unlink_keys, expire_keys
+from .chapter_history import content_hash, make_delta, apply_delta, delta_size
+from .flag_dedupe import FlagDedupeIndex, SEVERITY_RANK
+
+# Chapters books stored before the chapter registry existed could use
+LEGACY_CHAPTER_NUMBERS = range(1, 16)
 
 
 class ManuscriptMemory:
@@ -15,14 +27,25 @@ class ManuscriptMemory:
     Short-term memory for a single manuscript processing session.
 
     Key Features:
-    - Stores all 15 chapters in memory
+    - Stores every chapter in memory, any chapter count
+    - Chapter version history (delta storage, dedupe, rollback)
     - Cross-chapter flagging (Ch 15 can flag Ch 1 issue)
     - Dependency tracking
     - Task state management
     - Iteration counting
     """
 
-    def __init__(self, book_id: str, redis_host: str = "localhost", redis_port: int = 6379):
+    def __init__(
+        self,
+        book_id: str,
+        redis_host: str = "localhost",
+        redis_port: int = 6379,
+        redis_client: Optional[redis.Redis] = None,
+        codec: Optional[ValueCodec] = None,
+        max_chapter_versions: Optional[int] = 20,
+        keyframe_interval: int = 10,
+        load: bool = True
+    ):
         """
         Initialize manuscript memory.
 
@@ -30,62 +53,176 @@ class ManuscriptMemory:
             book_id: Unique identifier for this book
             redis_host: Redis server host
             redis_port: Redis server port
+            redis_client: Redis client or LocalStore to use (default: shared client for STORAGE_BACKEND)
+            codec: Codec for large values (default: compress values over 1KB)
+            max_chapter_versions: Versions kept per chapter (None keeps all)
+            keyframe_interval: Max deltas in a row before storing a full text
+            load: Load existing data from Redis (default: True)
         """
         self.book_id = book_id
-        self.redis = redis.Redis(
-            host=redis_host,
-            port=redis_port,
-            decode_responses=True
-        )
+        self.redis = redis_client or get_storage_client(redis_host, redis_port)
+        self.codec = codec or ValueCodec()
+        self.lock = threading.RLock()  # Guards in-memory state shared by worker threads
+        self.max_chapter_versions = max_chapter_versions
+        self.keyframe_interval = keyframe_interval
 
         # In-memory context (synced with Redis)
         self.context = {
             "manuscript": None,
             "chapters": {},  # chapter_num → chapter_text
             "chapter_analyses": {},  # chapter_num → analysis_data
-            "cross_chapter_flags": [],
+            "cross_chapter_flags": [],  # All flags, creation order
             "continuity_db": {},  # character/magic/timeline facts
             "task_states": {},  # task_id → status
             "iteration_count": 0
         }
 
+        # Chapter registry: stored chapter numbers in order
+        self.chapter_numbers: List[int] = []
+
+        # Flag indexes (flag_id → flag), kept in sync with the records
+        self._flags_by_id: Dict[str, Dict] = {}
+        self.open_flags: Dict[str, Dict] = {}
+        self.open_flags_by_chapter: Dict[int, Dict[str, Dict]] = {}
+        self.flag_index = FlagDedupeIndex()  # Near-duplicate lookup over open flags
+
         # Global Story Contract (coherence guardrails for parallel execution)
         self.story_contract = GlobalStoryContract(book_id)
 
         # Load existing data from Redis if available
-        self._load_from_redis()
+        if load:
+            self._load_from_redis()
 
     def _load_from_redis(self):
-        """Load existing manuscript data from Redis."""
+        """Load existing manuscript data from Redis in two round trips (plus a one-time migration)."""
+        pipe = self.redis.pipeline(transaction=False)
+        self._queue_load(pipe)
+        loaded = pipe.execute()
+
+        chapter_keys = self._chapter_keys(self._chapters_to_load(loaded))
+        chapters = self.redis.mget(chapter_keys) if chapter_keys else []
+
+        pipe = self.redis.pipeline()
+        if self._queue_migration(pipe, loaded, chapters):
+            pipe.execute()
+        self._restore(loaded, chapters)
+
+        seed = self._flag_seq_seed(loaded)
+        if seed is not None:
+            self.redis.set(self._flag_key("seq"), seed, nx=True)
+
+    def _queue_load(self, pipe):
+        """Queue the reads for a load: manuscript, chapter registry, flags, iteration count, contract, flag counter, legacy flags."""
+        pipe.get(f"book:{self.book_id}:manuscript")
+        pipe.zrange(self._chapters_key(), 0, -1)
+        pipe.hgetall(self._flag_key("records"))
+        pipe.get(f"book:{self.book_id}:iteration_count")
+        pipe.get(f"book:{self.book_id}:story_contract")
+        pipe.get(self._flag_key("seq"))
+        pipe.lrange(self._legacy_flags_key(), 0, -1)
+
+    @staticmethod
+    def _chapters_to_load(loaded: List[Any]) -> List[int]:
+        """Chapters in the registry, or the legacy fixed range when the registry is empty."""
+        return [int(n) for n in loaded[1]] or list(LEGACY_CHAPTER_NUMBERS)
+
+    def _legacy_flags_key(self) -> str:
+        """Redis list the flags were stored in before the indexed flag store."""
+        return f"book:{self.book_id}:flags"
+
+    def _queue_migration(self, pipe, loaded: List[Any], chapters: List[Optional[str]]) -> bool:
+        """
+        Queue the one-time migration of data stored in the pre-registry layout.
+
+        Chapters found under the legacy fixed range are added to the
+        registry, and flags in the legacy list become indexed records (the
+        list is then dropped). The migrated flags are added to loaded's
+        records, so the load doesn't have to read them again.
+
+        Args:
+            pipe: Pipeline to queue the writes on
+            loaded: Results of _queue_load's reads (updated in place)
+            chapters: Chapter values read for _chapters_to_load(loaded)
+
+        Returns:
+            True if anything needed migrating
+        """
+        migrated = False
+
+        if not loaded[1]:
+            found = [str(n) for n, data in zip(LEGACY_CHAPTER_NUMBERS, chapters) if data]
+            if found:
+                pipe.zadd(self._chapters_key(), {n: int(n) for n in found})
+                migrated = True
+
+        legacy_flags = loaded[6]
+        if legacy_flags:
+            records = loaded[2]
+            for data in legacy_flags:
+                flag = json_loads(data)
+                if flag["id"] in records:
+                    continue
+                score = datetime.fromisoformat(flag["created_at"]).timestamp()
+                pipe.hsetnx(self._flag_key("records"), flag["id"], data)
+                pipe.zadd(self._flag_key("open" if flag["status"] == "open" else "resolved"), {flag["id"]: score})
+                pipe.zadd(self._flag_key(f"chapter:{flag['affects_chapter']}"), {flag["id"]: score})
+                records[flag["id"]] = data
+            pipe.delete(self._legacy_flags_key())
+            loaded[6] = []
+            migrated = True
+
+        return migrated
+
+    @staticmethod
+    def _flag_seq_seed(loaded: List[Any]) -> Optional[int]:
+        """
+        Starting value for the flag ID counter of a book flagged before it existed.
+
+        Seeding it past the record count keeps new IDs clear of the old
+        count-based ones; returns None when no seeding is needed.
+        """
+        records, seq = loaded[2], loaded[5]
+        return len(records) if seq is None and records else None
+
+    def _chapter_keys(self, chapter_numbers) -> List[str]:
+        """Redis keys of the chapters in the registry."""
+        return [f"book:{self.book_id}:chapter:{n}" for n in chapter_numbers]
+
+    def _restore(self, loaded: List[Any], chapters: List[Optional[str]]):
+        """Rebuild in-memory context from raw Redis values."""
+        manuscript_data, _, records, count, contract_data = loaded[:5]
+
         # Load manuscript metadata
-        manuscript_key = f"book:{self.book_id}:manuscript"
-        manuscript_data = self.redis.get(manuscript_key)
         if manuscript_data:
-            self.context["manuscript"] = json.loads(manuscript_data)
+            self.context["manuscript"] = self.codec.decode(manuscript_data, f"book:{self.book_id}:manuscript")
 
-        # Load chapters
-        for i in range(1, 16):  # Chapters 1-15
-            chapter_key = f"book:{self.book_id}:chapter:{i}"
-            chapter_data = self.redis.get(chapter_key)
+        # Load chapters listed in the registry
+        chapter_numbers = self._chapters_to_load(loaded)
+        chapter_keys = self._chapter_keys(chapter_numbers)
+        for chapter_number, chapter_key, chapter_data in zip(chapter_numbers, chapter_keys, chapters):
             if chapter_data:
-                self.context["chapters"][i] = json.loads(chapter_data)
+                self.context["chapters"][chapter_number] = self.codec.decode(chapter_data, chapter_key)
+                self.chapter_numbers.append(chapter_number)
 
         # Load flags
-        flags_key = f"book:{self.book_id}:flags"
-        flags = self.redis.lrange(flags_key, 0, -1)
-        self.context["cross_chapter_flags"] = [json.loads(f) for f in flags]
+        flags = sorted(
+            (json_loads(data) for data in records.values()),
+            key=lambda f: f["created_at"]
+        )
+        for flag in flags:
+            self._index_flag(flag)
 
         # Load iteration count
-        iter_key = f"book:{self.book_id}:iteration_count"
-        count = self.redis.get(iter_key)
         self.context["iteration_count"] = int(count) if count else 0
 
         # Load story contract
-        contract_key = f"book:{self.book_id}:story_contract"
-        contract_data = self.redis.get(contract_key)
         if contract_data:
             self.story_contract.from_json(contract_data)
 
+    def _chapters_key(self) -> str:
+        """Redis sorted set of stored chapter numbers (scored by number)."""
+        return f"book:{self.book_id}:chapters"
+
     def store_manuscript(self, manuscript_data: Dict[str, Any]):
         """
         Store the original manuscript data.
@@ -95,33 +232,285 @@ class ManuscriptMemory:
         """
         self.context["manuscript"] = manuscript_data
         manuscript_key = f"book:{self.book_id}:manuscript"
-        self.redis.set(manuscript_key, json.dumps(manuscript_data))
+        self.redis.set(manuscript_key, self.codec.encode(manuscript_data, manuscript_key))
 
-    def store_chapter(self, chapter_number: int, chapter_text: str, metadata: Optional[Dict] = None):
+    def store_chapter(
+        self,
+        chapter_number: int,
+        chapter_text: str,
+        metadata: Optional[Dict] = None,
+        label: Optional[str] = None
+    ) -> int:
         """
-        Store a chapter's text and metadata.
+        Store a chapter's text and metadata as a new version.
+
+        The previous version stays retrievable: each version is stored once
+        by content hash, as a line delta against the version before it
+        (with a full text every keyframe_interval versions). A full text is
+        only copied into the history once a newer version replaces it in
+        the chapter key. Storing the current text again only updates the
+        metadata.
 
         Args:
-            chapter_number: Chapter number (1-15)
+            chapter_number: Chapter number (1 or higher)
             chapter_text: The chapter content
             metadata: Optional metadata (word count, scene count, etc.)
+            label: Optional name for the pass that produced this version
+
+        Returns:
+            Version number of the stored text
         """
-        chapter_data = {
-            "text": chapter_text,
-            "metadata": metadata or {},
-            "stored_at": datetime.now().isoformat()
-        }
+        # Versions are numbered from in-memory state, so workers take turns
+        with self.lock:
+            previous = self.context["chapters"].get(chapter_number)
+            text_hash = content_hash(chapter_text)
+            new_version = not (previous and previous.get("content_hash") == text_hash)
+
+            version = (previous or {}).get("version", 0) + (1 if new_version else 0)
+            depth = 0
+            blob = {"head": True}  # Full text: read from the chapter key while it's current
+            if new_version and previous and previous.get("version"):
+                depth = previous.get("delta_depth", 0) + 1
+                ops = make_delta(previous["text"], chapter_text)
+                if depth <= self.keyframe_interval and delta_size(ops) < len(chapter_text) // 2:
+                    blob = {"base": previous["content_hash"], "ops": ops}
+                else:
+                    depth = 0
+            elif not new_version:
+                depth = previous.get("delta_depth", 0)
+
+            chapter_data = {
+                "text": chapter_text,
+                "metadata": metadata or {},
+                "stored_at": datetime.now().isoformat(),
+                "version": version,
+                "content_hash": text_hash,
+                "delta_depth": depth
+            }
+
+            if chapter_number not in self.context["chapters"]:
+                insort(self.chapter_numbers, chapter_number)
+            self.context["chapters"][chapter_number] = chapter_data
+
+            chapter_key = f"book:{self.book_id}:chapter:{chapter_number}"
+            pipe = self.redis.pipeline()
+            pipe.set(chapter_key, self.codec.encode(chapter_data, chapter_key))
+            pipe.zadd(self._chapters_key(), {str(chapter_number): chapter_number})
+            if new_version:
+                record = {
+                    "version": version,
+                    "content_hash": text_hash,
+                    "label": label,
+                    "stored_at": chapter_data["stored_at"],
+                    "metadata": chapter_data["metadata"]
+                }
+                if previous and previous.get("version") and not previous.get("delta_depth"):
+                    # The replaced full text moves from the chapter key into the history
+                    pipe.hset(
+                        self._history_key(chapter_number, "texts"),
+                        previous["content_hash"],
+                        self.codec.encode({"text": previous["text"]})
+                    )
+                # Identical text stored earlier keeps its existing blob
+                pipe.hsetnx(self._history_key(chapter_number, "texts"), text_hash, self.codec.encode(blob))
+                pipe.hset(self._history_key(chapter_number, "versions"), version, json_dumps(record))
+            pipe.execute()
+
+            if new_version and self.max_chapter_versions and version > self.max_chapter_versions:
+                self._prune_chapter_versions(chapter_number, version - self.max_chapter_versions + 1)
+
+            return version
+
+    def _history_key(self, chapter_number: int, suffix: str) -> str:
+        """
+        Redis key for a chapter's version history.
+
+        book:{id}:chapter:<n>:versions maps version → record (content hash,
+        label, metadata); book:{id}:chapter:<n>:texts maps content hash →
+        full text, delta against another content hash, or {"head": true}
+        for a full text that's still current (kept in the chapter key).
+        """
+        return f"book:{self.book_id}:chapter:{chapter_number}:{suffix}"
+
+    def _load_chapter_history(self, chapter_number: int):
+        """Fetch a chapter's version records, text blobs and current text in one round trip."""
+        pipe = self.redis.pipeline(transaction=False)
+        self._queue_chapter_history(pipe, chapter_number)
+        return self._decode_chapter_history(chapter_number, *pipe.execute())
+
+    def _queue_chapter_history(self, pipe, chapter_number: int):
+        """Queue the reads of a chapter's history."""
+        pipe.hgetall(self._history_key(chapter_number, "versions"))
+        pipe.hgetall(self._history_key(chapter_number, "texts"))
+        pipe.get(f"book:{self.book_id}:chapter:{chapter_number}")
+
+    def _decode_chapter_history(
+        self,
+        chapter_number: int,
+        versions: Dict[str, str],
+        texts: Dict[str, str],
+        current: Optional[str]
+    ):
+        """Parse raw version records and text blobs, filling in the current full text."""
+        texts = {text_hash: self.codec.decode(blob) for text_hash, blob in texts.items()}
+        if current:
+            current = self.codec.decode(current, f"book:{self.book_id}:chapter:{chapter_number}")
+            if texts.get(current["content_hash"], {}).get("head"):
+                texts[current["content_hash"]] = {"text": current["text"]}
+        return {int(v): json_loads(record) for v, record in versions.items()}, texts
+
+    @staticmethod
+    def _resolve_text(texts: Dict[str, Dict], text_hash: str) -> Optional[str]:
+        """Rebuild a text by applying deltas from the nearest full text."""
+        deltas = []
+        blob = texts.get(text_hash)
+        while blob is not None and "base" in blob:
+            deltas.append(blob["ops"])
+            blob = texts.get(blob["base"])
+        if blob is None or "text" not in blob:  # A head pointer is only filled in while current
+            return None
+
+        text = blob["text"]
+        for ops in reversed(deltas):
+            text = apply_delta(text, ops)
+        return text
+
+    def _prune_chapter_versions(self, chapter_number: int, oldest_kept: int):
+        """Drop versions older than oldest_kept and the texts only they used."""
+        versions, texts = self._load_chapter_history(chapter_number)
+        pipe = self.redis.pipeline()
+        if self._queue_prune(pipe, chapter_number, versions, texts, oldest_kept):
+            pipe.execute()
+
+    def _queue_prune(
+        self,
+        pipe,
+        chapter_number: int,
+        versions: Dict[int, Dict],
+        texts: Dict[str, Dict],
+        oldest_kept: int
+    ) -> bool:
+        """Queue the writes that prune a chapter's history; returns False if nothing to prune."""
+        dropped = [v for v in versions if v < oldest_kept]
+        if not dropped:
+            return False
+
+        kept = {record["content_hash"] for v, record in versions.items() if v >= oldest_kept}
+
+        # Kept texts whose delta chain runs through a dropped text become full texts
+        rebased = {}
+        for text_hash in kept:
+            blob = texts.get(text_hash)
+            while blob is not None and "base" in blob:
+                if blob["base"] not in kept:
+                    rebased[text_hash] = {"text": self._resolve_text(texts, text_hash)}
+                    break
+                blob = texts.get(blob["base"])
+
+        unused = [text_hash for text_hash in texts if text_hash not in kept]
+
+        pipe.hdel(self._history_key(chapter_number, "versions"), *dropped)
+        for text_hash, blob in rebased.items():
+            pipe.hset(self._history_key(chapter_number, "texts"), text_hash, self.codec.encode(blob))
+        if unused:
+            pipe.hdel(self._history_key(chapter_number, "texts"), *unused)
+        return True
+
+    def get_chapter_versions(self, chapter_number: int) -> List[Dict]:
+        """
+        List the retained versions of a chapter.
+
+        Args:
+            chapter_number: Chapter number
+
+        Returns:
+            Version records (version, content_hash, label, stored_at,
+            metadata), oldest first
+        """
+        versions = self.redis.hgetall(self._history_key(chapter_number, "versions"))
+        return sorted((json_loads(record) for record in versions.values()), key=lambda r: r["version"])
 
-        self.context["chapters"][chapter_number] = chapter_data
-        chapter_key = f"book:{self.book_id}:chapter:{chapter_number}"
-        self.redis.set(chapter_key, json.dumps(chapter_data))
+    def get_chapter_version(self, chapter_number: int, version: int) -> Optional[str]:
+        """
+        Get the text of a specific chapter version.
+
+        Args:
+            chapter_number: Chapter number
+            version: Version number
+
+        Returns:
+            Chapter text or None if the version isn't retained
+        """
+        current = self.context["chapters"].get(chapter_number)
+        if current and current.get("version") == version:
+            return current["text"]
+
+        versions, texts = self._load_chapter_history(chapter_number)
+        record = versions.get(version)
+        if record is None:
+            return None
+        return self._resolve_text(texts, record["content_hash"])
+
+    def diff_chapter_versions(self, chapter_number: int, from_version: int, to_version: int) -> Optional[str]:
+        """
+        Get a unified diff between two chapter versions.
+
+        Args:
+            chapter_number: Chapter number
+            from_version: Older version number
+            to_version: Newer version number
+
+        Returns:
+            Unified diff text or None if either version isn't retained
+        """
+        old_text = self.get_chapter_version(chapter_number, from_version)
+        new_text = self.get_chapter_version(chapter_number, to_version)
+        if old_text is None or new_text is None:
+            return None
+        return self._unified_diff(chapter_number, from_version, to_version, old_text, new_text)
+
+    @staticmethod
+    def _unified_diff(chapter_number: int, from_version: int, to_version: int, old_text: str, new_text: str) -> str:
+        """Format a unified diff between two chapter texts."""
+        return "".join(difflib.unified_diff(
+            old_text.splitlines(keepends=True),
+            new_text.splitlines(keepends=True),
+            fromfile=f"chapter_{chapter_number}_v{from_version}",
+            tofile=f"chapter_{chapter_number}_v{to_version}"
+        ))
+
+    def rollback_chapter(self, chapter_number: int, version: int) -> Optional[int]:
+        """
+        Restore an earlier version of a chapter as a new version.
+
+        Args:
+            chapter_number: Chapter number
+            version: Version to restore
+
+        Returns:
+            New version number or None if the version isn't retained
+        """
+        versions, texts = self._load_chapter_history(chapter_number)
+        record = versions.get(version)
+        if record is None:
+            return None
+
+        text = self._resolve_text(texts, record["content_hash"])
+        if text is None:
+            return None
+        return self.store_chapter(
+            chapter_number,
+            text,
+            metadata=record["metadata"],
+            label=f"rollback_to_v{version}"
+        )
 
     def get_chapter(self, chapter_number: int) -> Optional[Dict]:
         """
         Retrieve a chapter's data.
 
         Args:
-            chapter_number: Chapter number (1-15)
+            chapter_number: Chapter number
 
         Returns:
             Chapter data dictionary or None if not found
@@ -133,21 +522,42 @@ class ManuscriptMemory:
         Get all stored chapters.
 
         Returns:
-            Dictionary mapping chapter numbers to chapter data
+            Dictionary mapping chapter numbers to chapter data, in chapter order
+        """
+        return {n: self.context["chapters"][n] for n in self.chapter_numbers}
+
+    def get_chapter_numbers(self) -> List[int]:
         """
-        return self.context["chapters"]
+        Get the numbers of all stored chapters.
+
+        Returns:
+            Sorted list of chapter numbers
+        """
+        return list(self.chapter_numbers)
+
+    def has_chapter(self, chapter_number: int) -> bool:
+        """
+        Check whether a chapter is stored.
+
+        Args:
+            chapter_number: Chapter number
+
+        Returns:
+            True if the chapter is in the registry
+        """
+        return chapter_number in self.context["chapters"]
 
     def store_chapter_analysis(self, chapter_number: int, analysis: Dict[str, Any]):
         """
         Store the analysis results for a chapter.
 
         Args:
-            chapter_number: Chapter number (1-15)
+            chapter_number: Chapter number
             analysis: Analysis results from Manuscript Strategist
         """
         self.context["chapter_analyses"][chapter_number] = analysis
         analysis_key = f"book:{self.book_id}:analysis:{chapter_number}"
-        self.redis.set(analysis_key, json.dumps(analysis))
+        self.redis.set(analysis_key, self.codec.encode(analysis, analysis_key))
 
     def flag_cross_chapter_issue(
         self,
@@ -181,7 +591,14 @@ class ManuscriptMemory:
                 }
             )
         """
-        flag_id = f"flag_{discovered_in}_to_{affects_chapter}_{len(self.context['cross_chapter_flags'])}"
+        # The sequence number comes from a server-side counter, so workers
+        # (threads or processes) flagging at the same time never share an ID
+        seq = self.redis.incr(self._flag_key("seq"))
+        return self._add_flag(discovered_in, affects_chapter, issue, seq)
+
+    def _add_flag(self, discovered_in: int, affects_chapter: int, issue: Dict[str, Any], seq: int) -> str:
+        """Index and store a new flag with a counter-assigned sequence number."""
+        flag_id = f"flag_{discovered_in}_to_{affects_chapter}_{seq}"
 
         flag = {
             "id": flag_id,
@@ -192,14 +609,173 @@ class ManuscriptMemory:
             "created_at": datetime.now().isoformat()
         }
 
-        self.context["cross_chapter_flags"].append(flag)
+        with self.lock:
+            self._index_flag(flag)
 
-        # Store in Redis list
-        flags_key = f"book:{self.book_id}:flags"
-        self.redis.lpush(flags_key, json.dumps(flag))
+        # Store the record and its indexes in one round trip
+        score = datetime.now().timestamp()
+        pipe = self.redis.pipeline()
+        pipe.hset(self._flag_key("records"), flag_id, json_dumps(flag))
+        pipe.zadd(self._flag_key("open"), {flag_id: score})
+        pipe.zadd(self._flag_key(f"chapter:{affects_chapter}"), {flag_id: score})
+        pipe.execute()
 
         return flag_id
 
+    def _flag_key(self, suffix: str) -> str:
+        """
+        Redis key for flag storage.
+
+        Flags are stored as individual records in the book:{id}:flags:records
+        hash (flag_id → JSON), indexed by status (flags:open, flags:resolved)
+        and by affected chapter (flags:chapter:<n>) in sorted sets scored by
+        creation time.
+        """
+        return f"book:{self.book_id}:flags:{suffix}"
+
+    def _index_flag(self, flag: Dict):
+        """Add a flag to the in-memory records and open indexes."""
+        flag_id = flag["id"]
+        flag = self._remember_flag(flag)
+        if flag["status"] == "open":
+            self.open_flags[flag_id] = flag
+            self.open_flags_by_chapter.setdefault(flag["affects_chapter"], {})[flag_id] = flag
+            self.flag_index.add(
+                flag_id,
+                self._dedupe_key(flag["affects_chapter"], flag["issue"]),
+                flag["issue"].get("detail", "")
+            )
+
+    def _remember_flag(self, flag: Dict) -> Dict:
+        """
+        Add a flag record to the in-memory flag list, or refresh the known copy.
+
+        Returns:
+            The one in-memory dict for this flag
+        """
+        known = self._flags_by_id.get(flag["id"])
+        if known is None:
+            self._flags_by_id[flag["id"]] = flag
+            self.context["cross_chapter_flags"].append(flag)
+            return flag
+        if known is not flag:
+            known.update(flag)
+        return known
+
+    @staticmethod
+    def _dedupe_key(affects_chapter: int, issue: Dict[str, Any]) -> Tuple[int, str]:
+        """Flags are only compared with open flags on the same chapter and of the same type."""
+        return affects_chapter, issue.get("type", "unknown")
+
+    def flag_or_merge_issue(
+        self,
+        discovered_in: int,
+        affects_chapter: int,
+        issue: Dict[str, Any]
+    ) -> Tuple[str, bool]:
+        """
+        Flag an issue, unless an open flag already describes it.
+
+        A near-duplicate (similar detail, same affected chapter and type)
+        is merged into the existing flag: the new report is recorded under
+        its "duplicates" and the flag's severity is raised if needed.
+
+        Candidates come from flag_index, which only knows the flags this
+        memory has loaded or created, so a duplicate of a flag another
+        process opened since may still be flagged separately. The merge
+        itself is a WATCH transaction on the stored record that only
+        applies while the flag is open; if another worker resolved it
+        meanwhile, the issue becomes a new flag.
+
+        Args:
+            discovered_in: Chapter number where issue was discovered
+            affects_chapter: Chapter number that needs fixing
+            issue: Dictionary with 'type', 'detail', 'severity', etc.
+
+        Returns:
+            (flag_id, merged): the new or existing flag's ID, and whether
+            the issue was merged into an existing flag
+        """
+        with self.lock:
+            match = self.flag_index.find_duplicate(
+                self._dedupe_key(affects_chapter, issue), issue.get("detail", "")
+            )
+
+        if match is not None:
+            flag_id, similarity = match
+
+            def merge(pipe) -> Optional[Dict]:
+                if pipe.zscore(self._flag_key("open"), flag_id) is None:
+                    return None
+                flag = self._merged_record(
+                    pipe.hget(self._flag_key("records"), flag_id), discovered_in, issue, similarity
+                )
+                pipe.multi()
+                pipe.hset(self._flag_key("records"), flag_id, json_dumps(flag))
+                return flag
+
+            flag = self.redis.transaction(
+                merge, self._flag_key("open"), self._flag_key("records"), value_from_callable=True
+            )
+            if self._adopt_merge(flag_id, flag):
+                return flag_id, True
+
+        return self.flag_cross_chapter_issue(discovered_in, affects_chapter, issue), False
+
+    @staticmethod
+    def _merged_record(
+        data: Optional[str],
+        discovered_in: int,
+        issue: Dict[str, Any],
+        similarity: float
+    ) -> Dict:
+        """Record a duplicate report on a stored flag record, raising its severity if needed."""
+        flag = json_loads(data)
+        flag.setdefault("duplicates", []).append({
+            "discovered_in": discovered_in,
+            "detail": issue.get("detail", ""),
+            "severity": issue.get("severity"),
+            "similarity": round(similarity, 2),
+            "created_at": datetime.now().isoformat()
+        })
+        severity = issue.get("severity")
+        if SEVERITY_RANK.get(severity, len(SEVERITY_RANK)) < SEVERITY_RANK.get(
+            flag["issue"].get("severity"), len(SEVERITY_RANK)
+        ):
+            flag["issue"] = dict(flag["issue"], severity=severity)
+        return flag
+
+    def _adopt_merge(self, flag_id: str, flag: Optional[Dict]) -> bool:
+        """
+        Update the local copy of a flag after a merge attempt.
+
+        Args:
+            flag_id: Flag the issue was merged into
+            flag: Stored record after the merge, or None if the flag was
+                no longer open
+
+        Returns:
+            True if the merge was applied
+        """
+        with self.lock:
+            if flag is None:
+                self._resolve_locally(flag_id, None)  # Resolved by another worker
+                return False
+            self._index_flag(flag)
+            return True
+
+    def get_flag(self, flag_id: str) -> Optional[Dict]:
+        """
+        Get a flag by ID.
+
+        Args:
+            flag_id: The flag ID
+
+        Returns:
+            Flag dictionary or None if not found
+        """
+        return self._flags_by_id.get(flag_id)
+
     def get_unresolved_flags(self) -> List[Dict]:
         """
         Get all flags that haven't been resolved yet.
@@ -207,51 +783,126 @@ class ManuscriptMemory:
         Returns:
             List of flag dictionaries with status='open'
         """
-        return [
-            f for f in self.context["cross_chapter_flags"]
-            if f["status"] == "open"
-        ]
+        return list(self.open_flags.values())
 
     def get_flags_for_chapter(self, chapter_number: int) -> List[Dict]:
         """
-        Get all flags that affect a specific chapter.
+        Get all open flags that affect a specific chapter.
+
+        Reads the chapter's flag index and records from Redis (two round
+        trips), so flags other workers opened, merged into or resolved since
+        this memory loaded are seen, and adopted by the in-memory indexes.
 
         Args:
             chapter_number: Chapter number to check
 
         Returns:
-            List of flags affecting this chapter
+            List of open flags affecting this chapter, oldest first
         """
-        return [
-            f for f in self.context["cross_chapter_flags"]
-            if f["affects_chapter"] == chapter_number and f["status"] == "open"
-        ]
+        flag_ids = self.redis.zrange(self._flag_key(f"chapter:{chapter_number}"), 0, -1)
+        records = self.redis.hmget(self._flag_key("records"), flag_ids) if flag_ids else []
+        return self._adopt_chapter_flags(records)
 
-    def resolve_flag(self, flag_id: str):
+    def _adopt_chapter_flags(self, records: List[Optional[str]]) -> List[Dict]:
+        """
+        Refresh the in-memory indexes from a chapter's stored flag records.
+
+        Args:
+            records: Stored records in chapter index order (None if missing)
+
+        Returns:
+            The in-memory copies of the open flags among them
+        """
+        flags = []
+        with self.lock:
+            for data in records:
+                if not data:
+                    continue
+                record = json_loads(data)
+                if record["status"] == "open":
+                    self._index_flag(record)
+                    flags.append(self.open_flags[record["id"]])
+                else:
+                    self._resolve_locally(record["id"], None)  # Resolved by another worker
+                    self._remember_flag(record)
+        return flags
+
+    def resolve_flag(self, flag_id: str) -> bool:
         """
         Mark a flag as resolved.
 
+        Claiming the flag (removing it from the open index) and storing it
+        as resolved is one WATCH transaction, so when workers (in any
+        process) resolve the same flag exactly one gets True, and a crash
+        can't leave a flag claimed but not resolved.
+
         Args:
             flag_id: The flag ID to resolve
-        """
-        for flag in self.context["cross_chapter_flags"]:
-            if flag["id"] == flag_id:
-                flag["status"] = "resolved"
-                flag["resolved_at"] = datetime.now().isoformat()
 
-                # Update in Redis
-                flags_key = f"book:{self.book_id}:flags"
-                all_flags = self.redis.lrange(flags_key, 0, -1)
-                self.redis.delete(flags_key)
+        Returns:
+            True if an open flag was resolved by this call
+        """
+        open_key, records_key = self._flag_key("open"), self._flag_key("records")
+
+        def claim(pipe) -> Optional[Dict]:
+            if pipe.zscore(open_key, flag_id) is None:
+                return None
+            record = self._resolved_record(pipe.hget(records_key, flag_id))
+            pipe.multi()
+            self._queue_resolution(pipe, flag_id, record)
+            return record
+
+        record = self.redis.transaction(claim, open_key, records_key, value_from_callable=True)
+        return self._resolve_locally(flag_id, record) is not None
+
+    @staticmethod
+    def _resolved_record(data: Optional[str]) -> Optional[Dict]:
+        """Mark a stored flag record resolved (None if the record is missing)."""
+        if not data:
+            return None
+        flag = json_loads(data)
+        flag["status"] = "resolved"
+        flag["resolved_at"] = datetime.now().isoformat()
+        return flag
+
+    def _resolve_locally(self, flag_id: str, record: Optional[Dict]) -> Optional[Dict]:
+        """
+        Drop a flag from the in-memory open indexes.
 
-                for f in all_flags:
-                    flag_dict = json.loads(f)
-                    if flag_dict["id"] == flag_id:
-                        flag_dict["status"] = "resolved"
-                        flag_dict["resolved_at"] = datetime.now().isoformat()
-                    self.redis.lpush(flags_key, json.dumps(flag_dict))
+        Args:
+            flag_id: The flag ID
+            record: Resolved flag record if this caller claimed it, else None
 
-                break
+        Returns:
+            The resolved flag, or None if this caller didn't claim it
+        """
+        with self.lock:
+            flag = self.open_flags.pop(flag_id, None)
+            if flag is not None:
+                chapter_flags = self.open_flags_by_chapter.get(flag["affects_chapter"], {})
+                chapter_flags.pop(flag_id, None)
+                if not chapter_flags:
+                    self.open_flags_by_chapter.pop(flag["affects_chapter"], None)
+                self.flag_index.remove(flag_id)
+
+            if record is None:
+                # Resolved elsewhere (or unknown); local copy is just out of date
+                if flag is not None:
+                    flag["status"] = "resolved"
+                return None
+
+            # Flags created by another process since this memory loaded are adopted
+            flag = self._flags_by_id.get(flag_id) or self._remember_flag(record)
+            flag["status"] = "resolved"
+            flag["resolved_at"] = record["resolved_at"]
+            return dict(flag)
+
+    def _queue_resolution(self, pipe, flag_id: str, record: Optional[Dict]):
+        """Queue a claimed flag's removal from the open index and its resolved record."""
+        pipe.zrem(self._flag_key("open"), flag_id)
+        if record is not None:
+            pipe.hset(self._flag_key("records"), flag_id, json_dumps(record))
+            pipe.zadd(self._flag_key("resolved"), {flag_id: datetime.now().timestamp()})
 
     def store_continuity_fact(self, category: str, key: str, value: Any):
         """
@@ -269,7 +920,7 @@ class ManuscriptMemory:
 
         # Store in Redis
         continuity_key = f"book:{self.book_id}:continuity:{category}"
-        self.redis.hset(continuity_key, key, json.dumps(value))
+        self.redis.hset(continuity_key, key, json_dumps(value))
 
     def get_continuity_facts(self, category: str) -> Dict:
         """
@@ -291,9 +942,9 @@ class ManuscriptMemory:
         Returns:
             New iteration count
         """
-        self.context["iteration_count"] += 1
+        # Server-side counter, so every worker's iterations count towards the guard
         iter_key = f"book:{self.book_id}:iteration_count"
-        self.redis.incr(iter_key)
+        self.context["iteration_count"] = int(self.redis.incr(iter_key))
         return self.context["iteration_count"]
 
     def get_iteration_count(self) -> int:
@@ -302,22 +953,44 @@ class ManuscriptMemory:
 
     def clear(self):
         """Clear all data for this book from memory and Redis."""
-        # Clear Redis keys
-        pattern = f"book:{self.book_id}:*"
-        keys = self.redis.keys(pattern)
-        if keys:
-            self.redis.delete(*keys)
+        # Incremental SCAN + UNLINK, so other jobs on a shared Redis aren't blocked
+        unlink_keys(self.redis, f"book:{self.book_id}:*")
 
-        # Clear in-memory context
-        self.context = {
-            "manuscript": None,
-            "chapters": {},
-            "chapter_analyses": {},
-            "cross_chapter_flags": [],
-            "continuity_db": {},
-            "task_states": {},
-            "iteration_count": 0
-        }
+        self._reset()
+
+    def expire(self, ttl_seconds: int) -> int:
+        """
+        Let this book's Redis data age out after a TTL.
+
+        Call when a book is finished; keys rewritten later (e.g. a
+        chapter stored again) lose their TTL, as with Redis SET.
+
+        Args:
+            ttl_seconds: Time to live in seconds
+
+        Returns:
+            Number of keys given the TTL
+        """
+        return expire_keys(self.redis, f"book:{self.book_id}:*", ttl_seconds)
+
+    def _reset(self):
+        """Clear in-memory context."""
+        with self.lock:
+            self.context = {
+                "manuscript": None,
+                "chapters": {},
+                "chapter_analyses": {},
+                "cross_chapter_flags": [],
+                "continuity_db": {},
+                "task_states": {},
+                "iteration_count": 0
+            }
+            self.chapter_numbers = []
+            self.codec.forget()
+            self._flags_by_id = {}
+            self.open_flags = {}
+            self.open_flags_by_chapter = {}
+            self.flag_index.clear()
 
     def get_story_contract(self) -> GlobalStoryContract:
         """
@@ -341,7 +1014,9 @@ class ManuscriptMemory:
         Extracts POV, voice, pacing rules from the existing manuscript.
         """
         # This is a placeholder - in production, would analyze manuscript
-        # For now, set some sensible defaults for romantasy
+        # For now, set some sensible defaults for romantasy, with the
+        # romance and magic ladders spread over however many chapters exist
+        num_chapters = self.chapter_numbers[-1] if self.chapter_numbers else 15
 
         self.story_contract.set_pov(
             pov_type="third_limited",
@@ -350,18 +1025,39 @@ class ManuscriptMemory:
             rules=["no head hopping within chapter", "clear POV transitions"]
         )
 
+        romance_levels = [
+            "antagonistic_tension",
+            "grudging_respect_and_banter",
+            "emotional_vulnerability",
+            "undeniable_attraction",
+            "commitment_and_HEA"
+        ]
         self.story_contract.set_romance_rules(
             romance_type="enemies_to_lovers",
-            escalation_ladder={
-                "chapters_1_3": "antagonistic_tension",
-                "chapters_4_6": "grudging_respect_and_banter",
-                "chapters_7_9": "emotional_vulnerability",
-                "chapters_10_12": "undeniable_attraction",
-                "chapters_13_15": "commitment_and_HEA"
-            },
+            escalation_ladder=dict(zip(
+                split_chapter_ranges(num_chapters, len(romance_levels)),
+                romance_levels
+            )),
             boundaries=["fade_to_black", "no_explicit_content"]
         )
 
+        magic_reveals = [
+            [
+                "magic exists in world",
+                "FMC has dormant power",
+                "basic magical concepts"
+            ],
+            [
+                "FMC power awakens",
+                "first successful magic use",
+                "power limitations revealed"
+            ],
+            [
+                "full powers manifested",
+                "true nature of magic revealed",
+                "connection to MMC powers"
+            ]
+        ]
         self.story_contract.set_magic_system(
             magic_type="elemental_with_cost",
             rules=[
@@ -374,28 +1070,74 @@ class ManuscriptMemory:
                 "can backfire if emotionally unstable",
                 "requires training to control"
             ],
-            reveal_schedule={
-                "chapters_1_5": [
-                    "magic exists in world",
-                    "FMC has dormant power",
-                    "basic magical concepts"
-                ],
-                "chapters_6_10": [
-                    "FMC power awakens",
-                    "first successful magic use",
-                    "power limitations revealed"
-                ],
-                "chapters_11_15": [
-                    "full powers manifested",
-                    "true nature of magic revealed",
-                    "connection to MMC powers"
-                ]
-            }
+            reveal_schedule=dict(zip(
+                split_chapter_ranges(num_chapters, len(magic_reveals)),
+                magic_reveals
+            ))
         )
 
         # Save to Redis
         self.save_story_contract()
 
+    def get_state_fingerprint(self) -> str:
+        """
+        Get a content hash of everything agent tools can read from this memory.
+
+        Covers chapter texts, chapter analyses, open flags and continuity
+        facts. Storage timestamps and flag IDs are ignored, so the same book
+        loaded again yields the same fingerprint.
+
+        Returns:
+            Hex SHA-256 digest
+        """
+        state = {
+            "chapters": {
+                str(ch_num): chapter["text"]
+                for ch_num, chapter in self.context["chapters"].items()
+            },
+            "analyses": {
+                str(ch_num): analysis
+                for ch_num, analysis in self.context["chapter_analyses"].items()
+            },
+            "flags": sorted(
+                json.dumps([f["discovered_in"], f["affects_chapter"], f["issue"]], sort_keys=True)
+                for f in self.get_unresolved_flags()
+            ),
+            "continuity": self.context["continuity_db"]
+        }
+        return hashlib.sha256(json.dumps(state, sort_keys=True).encode("utf-8")).hexdigest()
+
+    def get_chapter_context_fingerprint(self, chapter_number: int) -> str:
+        """
+        Get a content hash of the memory a chapter stage reads besides the chapter.
+
+        Covers the neighbouring chapters' texts (transitions), the chapter's
+        analysis, the open flags on the chapter and the continuity facts.
+        Flag IDs, reporting order and timestamps are ignored, so only a change
+        in what the agent sees changes the fingerprint.
+
+        Args:
+            chapter_number: Chapter number
+
+        Returns:
+            Hex SHA-256 digest
+        """
+        chapters = self.context["chapters"]
+        state = {
+            "neighbours": {
+                str(n): chapters[n]["text"]
+                for n in (chapter_number - 1, chapter_number + 1)
+                if n in chapters
+            },
+            "analysis": self.context["chapter_analyses"].get(chapter_number),
+            "flags": sorted(
+                json.dumps([f["discovered_in"], f["issue"]], sort_keys=True)
+                for f in self.get_flags_for_chapter(chapter_number)
+            ),
+            "continuity": self.context["continuity_db"]
+        }
+        return hashlib.sha256(json.dumps(state, sort_keys=True).encode("utf-8")).hexdigest()
+
     def get_memory_stats(self) -> Dict[str, Any]:
         """
         Get statistics about current memory usage.
@@ -410,5 +1152,6 @@ class ManuscriptMemory:
             "unresolved_flags": len(self.get_unresolved_flags()),
             "iteration_count": self.context["iteration_count"],
             "continuity_categories": list(self.context["continuity_db"].keys()),
-            "story_contract_version": self.story_contract.contract.get("version", "not_set")
+            "story_contract_version": self.story_contract.contract.get("version", "not_set"),
+            "compression": self.codec.get_stats()
         }
@@ -0,0 +1,227 @@
+"""
+Process-wide pooled Redis clients.
+Memory, workflow state, caches and the API server share one connection
+pool per Redis server instead of opening sockets per object or request.
+"""
+
+import os
+import threading
+import time
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+import redis
+
+
+class InstrumentedConnectionPool(redis.BlockingConnectionPool):
+    """
+    Blocking connection pool that records utilization.
+
+    When all max_connections are checked out, callers wait up to the pool
+    timeout for one to be released instead of failing immediately.
+    """
+
+    def __init__(self, *args, **kwargs):
+        """Initialize pool (same arguments as redis.BlockingConnectionPool)."""
+        self._stats_lock = threading.Lock()
+        self.in_use = 0
+        self.peak_in_use = 0
+        self.checkouts = 0
+        self.total_wait = 0.0
+        super().__init__(*args, **kwargs)
+
+    def get_connection(self, *args, **kwargs):
+        """Check out a connection, waiting if the pool is exhausted."""
+        start = time.monotonic()
+        connection = super().get_connection(*args, **kwargs)
+        with self._stats_lock:
+            self.in_use += 1
+            self.peak_in_use = max(self.peak_in_use, self.in_use)
+            self.checkouts += 1
+            self.total_wait += time.monotonic() - start
+        return connection
+
+    def release(self, connection):
+        """Return a connection to the pool."""
+        super().release(connection)
+        with self._stats_lock:
+            self.in_use = max(0, self.in_use - 1)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get pool utilization statistics.
+
+        Returns:
+            Dictionary with connection counts and checkout wait times
+        """
+        with self._stats_lock:
+            return {
+                "max_connections": self.max_connections,
+                "created_connections": len(self._connections),
+                "in_use": self.in_use,
+                "peak_in_use": self.peak_in_use,
+                "utilization": round(self.in_use / self.max_connections, 3),
+                "checkouts": self.checkouts,
+                "avg_wait_ms": round(self.total_wait / self.checkouts * 1000, 3) if self.checkouts else 0.0
+            }
+
+
+_pools: Dict[Tuple[str, int, int, bool], InstrumentedConnectionPool] = {}
+_pools_lock = threading.Lock()
+
+
+def get_redis_client(
+    host: Optional[str] = None,
+    port: Optional[int] = None,
+    db: int = 0,
+    decode_responses: bool = True,
+    max_connections: Optional[int] = None,
+    socket_timeout: Optional[float] = None,
+    socket_connect_timeout: Optional[float] = None,
+    pool_timeout: Optional[float] = None,
+    health_check_interval: Optional[int] = None
+) -> redis.Redis:
+    """
+    Get a Redis client backed by the process-wide pool for a server.
+
+    Clients are cheap; the pool is created on first use for each
+    (host, port, db, decode_responses) and shared afterwards, so pool
+    settings passed after that are ignored. Unset settings come from the
+    environment: REDIS_HOST, REDIS_PORT, REDIS_MAX_CONNECTIONS (50),
+    REDIS_SOCKET_TIMEOUT (5s), REDIS_CONNECT_TIMEOUT (2s),
+    REDIS_POOL_TIMEOUT (10s), REDIS_HEALTH_CHECK_INTERVAL (30s).
+    Sockets use TCP keepalive.
+
+    Args:
+        host: Redis server host
+        port: Redis server port
+        db: Database number
+        decode_responses: Return str instead of bytes (default: True)
+        max_connections: Max sockets in the pool
+        socket_timeout: Read/write timeout in seconds
+        socket_connect_timeout: Connect timeout in seconds
+        pool_timeout: Max wait for a free connection in seconds
+        health_check_interval: Ping idle connections older than this (seconds)
+
+    Returns:
+        Redis client using the shared pool
+    """
+    host = host or os.getenv("REDIS_HOST", "localhost")
+    port = int(port or os.getenv("REDIS_PORT", "6379"))
+    key = (host, port, db, decode_responses)
+
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None:
+            pool = InstrumentedConnectionPool(
+                host=host,
+                port=port,
+                db=db,
+                decode_responses=decode_responses,
+                max_connections=max_connections or int(os.getenv("REDIS_MAX_CONNECTIONS", "50")),
+                timeout=pool_timeout or float(os.getenv("REDIS_POOL_TIMEOUT", "10")),
+                socket_timeout=socket_timeout or float(os.getenv("REDIS_SOCKET_TIMEOUT", "5")),
+                socket_connect_timeout=(
+                    socket_connect_timeout or float(os.getenv("REDIS_CONNECT_TIMEOUT", "2"))
+                ),
+                socket_keepalive=True,
+                health_check_interval=(
+                    health_check_interval or int(os.getenv("REDIS_HEALTH_CHECK_INTERVAL", "30"))
+                )
+            )
+            _pools[key] = pool
+
+    return redis.Redis(connection_pool=pool)
+
+
+def scan_keys(client, pattern: str, batch_size: int = 500) -> Iterator[List[str]]:
+    """
+    Iterate over keys matching a pattern in batches, using SCAN.
+
+    Unlike KEYS, SCAN walks the keyspace incrementally, so other clients
+    of a shared Redis aren't blocked while a book's keys are collected.
+
+    Args:
+        client: Redis client or LocalStore
+        pattern: Glob-style key pattern (e.g. "book:{id}:*")
+        batch_size: SCAN COUNT hint and batch length
+
+    Yields:
+        Lists of up to batch_size keys
+    """
+    batch = []
+    for key in client.scan_iter(match=pattern, count=batch_size):
+        batch.append(key)
+        if len(batch) >= batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def unlink_keys(client, pattern: str, batch_size: int = 500) -> int:
+    """
+    Delete keys matching a pattern without blocking Redis.
+
+    Keys are found with SCAN and removed with UNLINK, which frees their
+    memory in a background thread.
+
+    Args:
+        client: Redis client or LocalStore
+        pattern: Glob-style key pattern
+        batch_size: Keys per SCAN/UNLINK batch
+
+    Returns:
+        Number of keys removed
+    """
+    removed = 0
+    for batch in scan_keys(client, pattern, batch_size):
+        removed += client.unlink(*batch)
+    return removed
+
+
+def expire_keys(client, pattern: str, ttl_seconds: int, batch_size: int = 500) -> int:
+    """
+    Set a TTL on keys matching a pattern.
+
+    Args:
+        client: Redis client or LocalStore
+        pattern: Glob-style key pattern
+        ttl_seconds: Time to live in seconds
+        batch_size: Keys per SCAN/pipeline batch
+
+    Returns:
+        Number of keys given the TTL
+    """
+    expired = 0
+    for batch in scan_keys(client, pattern, batch_size):
+        pipe = client.pipeline(transaction=False)
+        for key in batch:
+            pipe.expire(key, ttl_seconds)
+        expired += sum(1 for ok in pipe.execute() if ok)
+    return expired
+
+
+def get_redis_pool_stats() -> Dict[str, Dict[str, Any]]:
+    """
+    Get utilization statistics for every shared pool.
+
+    Returns:
+        Dictionary mapping "host:port/db" to pool stats
+    """
+    with _pools_lock:
+        pools = dict(_pools)
+
+    stats = {}
+    for (host, port, db, decode_responses), pool in pools.items():
+        name = f"{host}:{port}/{db}" + ("" if decode_responses else " (bytes)")
+        stats[name] = pool.get_stats()
+    return stats
+
+
+def close_redis_pools():
+    """Disconnect and forget all shared pools (e.g. on shutdown)."""
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+
+    for pool in pools:
+        pool.disconnect()
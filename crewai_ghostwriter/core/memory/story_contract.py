@@ -5,9 +5,55 @@ Prevents voice drift, pacing inconsistency, and magic reveal timing issues
 when chapters are processed in parallel.
 """
 
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime
+from bisect import bisect_right
+import hashlib
 import json
+from .codec import json_dumps, json_loads
+
+
+def parse_chapter_range(key: str) -> Optional[Tuple[int, float]]:
+    """
+    Parse a contract ladder key into an inclusive chapter range.
+
+    Args:
+        key: "chapters_4_6", "chapters_40_plus" or "chapter_7"
+
+    Returns:
+        (start, end) tuple, end is infinity for open ranges; None if the
+        key isn't a chapter range
+    """
+    parts = key.split("_")
+    if parts[0] not in ("chapter", "chapters") or not parts[1:] or not parts[1].isdigit():
+        return None
+
+    start = int(parts[1])
+    if len(parts) == 2:
+        return start, start
+    if parts[2] == "plus":
+        return start, float("inf")
+    if parts[2].isdigit():
+        return start, int(parts[2])
+    return None
+
+
+def split_chapter_ranges(num_chapters: int, stages: int) -> List[str]:
+    """
+    Split chapters 1..num_chapters into evenly sized ladder ranges.
+
+    Args:
+        num_chapters: Number of chapters in the book
+        stages: Number of ladder stages
+
+    Returns:
+        Range keys, e.g. ["chapters_1_5", "chapters_6_10", "chapters_11_15"]
+    """
+    total = max(num_chapters, stages)
+    return [
+        f"chapters_{i * total // stages + 1}_{(i + 1) * total // stages}"
+        for i in range(stages)
+    ]
 
 
 class GlobalStoryContract:
@@ -139,6 +185,9 @@ class GlobalStoryContract:
             "version": "1.0"
         }
 
+        # Parsed ladder ranges per contract section (rebuilt on change)
+        self._range_indexes: Dict[str, Tuple[List[int], List[str]]] = {}
+
     def set_pov(self, pov_type: str, perspective: str, tense: str, rules: List[str]):
         """
         Set POV and technical rules.
@@ -279,17 +328,9 @@ class GlobalStoryContract:
         Returns:
             Dictionary with allowed status and reason
         """
-        # Determine which range chapter falls into
-        if 1 <= chapter_number <= 3:
-            allowed_level = self.contract["romance"]["escalation_ladder"]["chapters_1_3"]
-        elif 4 <= chapter_number <= 6:
-            allowed_level = self.contract["romance"]["escalation_ladder"]["chapters_4_6"]
-        elif 7 <= chapter_number <= 9:
-            allowed_level = self.contract["romance"]["escalation_ladder"]["chapters_7_9"]
-        elif 10 <= chapter_number <= 12:
-            allowed_level = self.contract["romance"]["escalation_ladder"]["chapters_10_12"]
-        else:
-            allowed_level = self.contract["romance"]["escalation_ladder"]["chapters_13_15"]
+        ladder = self.contract["romance"]["escalation_ladder"]
+        key = self._find_chapter_range("romance", ladder, chapter_number)
+        allowed_level = ladder[key] if key else None
 
         # Simple keyword matching (could be more sophisticated)
         if "kiss" in proposed_action.lower():
@@ -328,12 +369,9 @@ class GlobalStoryContract:
                 }
 
         # Check reveal schedule
-        if 1 <= chapter_number <= 5:
-            allowed = self.contract["magic"]["reveal_schedule"]["chapters_1_5"]
-        elif 6 <= chapter_number <= 10:
-            allowed = self.contract["magic"]["reveal_schedule"]["chapters_6_10"]
-        else:
-            allowed = self.contract["magic"]["reveal_schedule"]["chapters_11_15"]
+        schedule = self.contract["magic"]["reveal_schedule"]
+        key = self._find_chapter_range("magic", schedule, chapter_number)
+        allowed = schedule[key] if key else []
 
         return {
             "allowed": True,
@@ -341,6 +379,43 @@ class GlobalStoryContract:
             "allowed_reveals": allowed
         }
 
+    def _find_chapter_range(
+        self,
+        section: str,
+        ladder: Dict[str, Any],
+        chapter_number: int
+    ) -> Optional[str]:
+        """
+        Find the ladder range in effect for a chapter by binary search.
+
+        A chapter before the first range uses the first one; a chapter past
+        the end of a range (gap or beyond the last range) uses the latest
+        range that has started.
+
+        Args:
+            section: Contract section the ladder belongs to (cache key)
+            ladder: Range key → value mapping
+            chapter_number: Chapter to look up
+
+        Returns:
+            Matching range key or None if the ladder has no ranges
+        """
+        index = self._range_indexes.get(section)
+        if index is None:
+            ranges = sorted(
+                (parsed[0], key) for key, parsed in
+                ((key, parse_chapter_range(key)) for key in ladder)
+                if parsed is not None
+            )
+            index = ([start for start, _ in ranges], [key for _, key in ranges])
+            self._range_indexes[section] = index
+
+        starts, keys = index
+        if not keys:
+            return None
+        position = bisect_right(starts, chapter_number) - 1
+        return keys[max(position, 0)]
+
     def get_contract_summary(self) -> str:
         """
         Get human-readable contract summary.
@@ -387,17 +462,37 @@ class GlobalStoryContract:
     def from_dict(self, data: Dict):
         """Import contract from dictionary."""
         self.contract = data.copy()
+        self._range_indexes.clear()
 
     def to_json(self) -> str:
-        """Export contract as JSON."""
-        return json.dumps(self.contract, indent=2)
+        """Export contract as compact JSON."""
+        return json_dumps(self.contract)
 
     def from_json(self, json_str: str):
         """Import contract from JSON."""
-        self.contract = json.loads(json_str)
+        self.contract = json_loads(json_str)
+        self._range_indexes.clear()
+
+    def get_fingerprint(self) -> str:
+        """
+        Get a content hash of the contract rules.
+
+        Includes the version but ignores timestamps, so an identical contract
+        rebuilt for a rerun has the same fingerprint.
+
+        Returns:
+            "<version>:<hex digest>"
+        """
+        rules = {
+            key: value for key, value in self.contract.items()
+            if key not in ("created_at", "last_updated")
+        }
+        digest = hashlib.sha256(json.dumps(rules, sort_keys=True).encode("utf-8")).hexdigest()
+        return f"{self.contract.get('version')}:{digest[:16]}"
 
     def _update_timestamp(self):
         """Update last modified timestamp."""
         self.contract["last_updated"] = datetime.now().isoformat()
+        self._range_indexes.clear()
         if not self.contract["created_at"]:
             self.contract["created_at"] = self.contract["last_updated"]
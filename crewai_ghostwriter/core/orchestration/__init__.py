@@ -1,22 +1,48 @@
 """Workflow orchestration with dependency tracking and parallel execution."""
 
 from .state_manager import WorkflowStateManager, ChapterTask, TaskStatus, TaskType
-from .rate_limiter import RateLimiter, MultiProviderRateLimiter, RateLimitedTask
-from .parallel_executor import ParallelExecutor, MockTaskExecutor
+from .async_state_manager import AsyncWorkflowStateManager
+from .rate_limiter import (
+    RateLimiter,
+    RedisRateLimiter,
+    MultiProviderRateLimiter,
+    RateLimitedTask,
+    estimate_tokens,
+    get_token_usage
+)
+from .retry import RetryPolicy, RetryBudget, is_retryable, get_retry_after
+from .result_cache import TaskResultCache, RedisTaskResultCache, make_cache_key
+from .parallel_executor import ParallelExecutor, PipelineStage, MockTaskExecutor
 
 __all__ = [
     # State management
     "WorkflowStateManager",
+    "AsyncWorkflowStateManager",
     "ChapterTask",
     "TaskStatus",
     "TaskType",
 
     # Rate limiting
     "RateLimiter",
+    "RedisRateLimiter",
     "MultiProviderRateLimiter",
     "RateLimitedTask",
+    "estimate_tokens",
+    "get_token_usage",
+
+    # Retries
+    "RetryPolicy",
+    "RetryBudget",
+    "is_retryable",
+    "get_retry_after",
+
+    # Result caching
+    "TaskResultCache",
+    "RedisTaskResultCache",
+    "make_cache_key",
 
     # Parallel execution
     "ParallelExecutor",
+    "PipelineStage",
     "MockTaskExecutor"
 ]
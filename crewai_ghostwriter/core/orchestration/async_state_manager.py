@@ -0,0 +1,209 @@
+"""
+Async Workflow State Manager
+redis.asyncio counterpart of WorkflowStateManager for use inside the
+executor's coroutines, so state transitions don't block the event loop.
+"""
+
+import secrets
+from typing import Any, Dict, List, Optional
+import redis.asyncio as aioredis
+from .state_manager import WorkflowStateManager, COMPACT_EVERY, EVENT_RETENTION, COMPACTION_LOCK_SECONDS
+from ..memory.async_support import AsyncWriteBehind, write_through, unlink_keys_async, expire_keys_async
+from ..memory.codec import ValueCodec
+
+
+class AsyncWorkflowStateManager(AsyncWriteBehind):
+    """
+    Workflow state manager backed by redis.asyncio.
+
+    Same semantics and Redis layout as WorkflowStateManager (the two can
+    read each other's state). Lookups such as get_ready_tasks() and
+    get_task() are served from memory and stay synchronous; methods that
+    persist state are coroutines that return once Redis has the write.
+    Results of loaded tasks are fetched with await get_task_result().
+
+    Usage:
+        state = await AsyncWorkflowStateManager.create("my_book")
+        await state.mark_task_started(task.id)
+        await state.mark_task_complete(task.id, result)
+    """
+
+    def __init__(
+        self,
+        book_id: str,
+        redis_host: str = "localhost",
+        redis_port: int = 6379,
+        redis_client: Optional[aioredis.Redis] = None,
+        codec: Optional[ValueCodec] = None,
+        compact_every: int = COMPACT_EVERY,
+        event_retention: int = EVENT_RETENTION
+    ):
+        """
+        Initialize async workflow state manager (call load() before use).
+
+        Args:
+            book_id: Unique identifier for this book
+            redis_host: Redis server host
+            redis_port: Redis server port
+            redis_client: redis.asyncio client to use
+            codec: Codec for task records (default: compress values over 1KB)
+            compact_every: Events between compactions (0 disables automatic compaction)
+            event_retention: Events kept in the stream after compaction
+        """
+        super().__init__(
+            redis_client or aioredis.Redis(host=redis_host, port=redis_port, decode_responses=True)
+        )
+        self.book_id = book_id
+        self.compact_every = compact_every
+
+        # Compaction reads the event log, so it's done here with async reads
+        self._sync = WorkflowStateManager(
+            book_id,
+            redis_client=self._buffer,
+            codec=codec,
+            load=False,
+            compact_every=0,
+            event_retention=event_retention
+        )
+        self._sync._result_loader = None  # Result blobs are fetched by get_task_result()
+
+    @classmethod
+    async def create(cls, book_id: str, **kwargs) -> "AsyncWorkflowStateManager":
+        """
+        Create a manager and load existing state from Redis.
+
+        Args:
+            book_id: Unique identifier for this book
+            **kwargs: Arguments for __init__
+
+        Returns:
+            Loaded AsyncWorkflowStateManager
+        """
+        state = cls(book_id, **kwargs)
+        await state.load()
+        return state
+
+    async def load(self):
+        """Load existing workflow state from Redis in two round trips."""
+        async with self.redis.pipeline(transaction=False) as pipe:
+            self._sync._queue_load(pipe)
+            task_ids, count, phases, compacted_through, events = await pipe.execute()
+
+        task_ids = sorted(task_ids)
+        snapshots = await self.redis.mget(self._sync._task_keys(task_ids)) if task_ids else []
+        pending = self._sync._restore(task_ids, snapshots, count, phases, compacted_through, events)
+
+        if self.compact_every and pending >= self.compact_every:
+            await self.compact()
+
+    async def _flush(self):
+        """Write buffered commands, compacting once enough events were logged."""
+        await super()._flush()
+        if self.compact_every and self._sync._events_logged >= self.compact_every:
+            await self.compact()
+
+    add_task = write_through(WorkflowStateManager, "add_task")
+    add_flag = write_through(WorkflowStateManager, "add_flag")
+    mark_task_started = write_through(WorkflowStateManager, "mark_task_started")
+    mark_task_complete = write_through(WorkflowStateManager, "mark_task_complete")
+    mark_task_failed = write_through(WorkflowStateManager, "mark_task_failed")
+    requeue_expired_tasks = write_through(WorkflowStateManager, "requeue_expired_tasks")
+    mark_phase_complete = write_through(WorkflowStateManager, "mark_phase_complete")
+    initialize_standard_workflow = write_through(WorkflowStateManager, "initialize_standard_workflow")
+
+    async def get_task_result(self, task_id: str) -> Optional[Any]:
+        """
+        Get a task's result, fetching its blob if not loaded yet.
+
+        Args:
+            task_id: Task ID
+
+        Returns:
+            Result data or None
+        """
+        task = self._sync.get_task(task_id)
+        if task is None:
+            return None
+        if task.result is None and task.result_ref:
+            blob_key = self._sync._blob_key(task.result_ref)
+            data = await self.redis.get(blob_key)
+            task.result = self._sync.codec.decode(data, blob_key) if data else None
+        return task.result
+
+    async def compact(self) -> int:
+        """
+        Fold logged events into the per-task snapshots and trim the log.
+
+        Returns:
+            Number of events folded (0 if another worker is compacting)
+        """
+        lock_key = self._key("events:compacting")
+        token = secrets.token_hex(16)
+        if not await self.redis.set(lock_key, token, nx=True, ex=COMPACTION_LOCK_SECONDS):
+            return 0
+
+        try:
+            async with self.redis.pipeline(transaction=False) as pipe:
+                pipe.get(self._key("events:compacted_through"))
+                pipe.xrange(self._key("events"))
+                compacted_through, events = await pipe.execute()
+
+            pending = self._sync._pending_events(events, compacted_through)
+            if not pending:
+                return 0
+
+            task_ids = sorted({fields["task"] for _, fields in pending})
+            snapshots = await self.redis.mget(self._sync._task_keys(task_ids))
+
+            async with self.redis.pipeline(transaction=True) as pipe:
+                self._sync._queue_compaction(pipe, task_ids, snapshots, pending)
+                await pipe.execute()
+
+            self._sync._events_logged = 0
+            return len(pending)
+        finally:
+            # Compare-and-delete, so a successor's lock (ours expired) is kept
+            async def release(pipe):
+                held = await pipe.get(lock_key) == token
+                pipe.multi()
+                if held:
+                    pipe.delete(lock_key)
+
+            await self.redis.transaction(release, lock_key)
+
+    async def get_timeline(self, task_id: Optional[str] = None) -> List[Dict]:
+        """
+        Replay the retained task events (see WorkflowStateManager.get_timeline).
+
+        Args:
+            task_id: Only return events for this task (default: all tasks)
+
+        Returns:
+            Events oldest first
+        """
+        await self._flush()
+        return self._sync._timeline(await self.redis.xrange(self._key("events")), task_id)
+
+    async def clear(self):
+        """Clear all workflow state for this book."""
+        await self._flush()
+        await unlink_keys_async(self.redis, f"workflow:{self.book_id}:*")
+        self._sync._reset()
+
+    async def expire(self, ttl_seconds: int) -> int:
+        """
+        Let this book's workflow state age out after a TTL.
+
+        Args:
+            ttl_seconds: Time to live in seconds
+
+        Returns:
+            Number of keys given the TTL
+        """
+        await self._flush()
+        return await expire_keys_async(self.redis, f"workflow:{self.book_id}:*", ttl_seconds)
+
+    async def close(self):
+        """Flush pending writes and close the Redis connection."""
+        await self._flush()
+        await self.redis.aclose()
@@ -1,26 +1,71 @@
 """
 Parallel Executor for concurrent task execution with dependency tracking.
-Enables 4-5x speedup through wave-based parallel processing.
+Enables 4-5x speedup through dependency-driven parallel processing.
 """
 
 import asyncio
-from typing import List, Dict, Any, Callable, Optional, Awaitable
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Callable, Deque, Iterable, Optional, Awaitable, Set, Union, Tuple
 from datetime import datetime
+import functools
+import inspect
 import time
 
-from .rate_limiter import MultiProviderRateLimiter, RateLimitedTask
+from .rate_limiter import MultiProviderRateLimiter, RateLimitedTask, get_token_usage
+from .result_cache import TaskResultCache
+from .retry import RetryPolicy, RetryBudget
 from .state_manager import WorkflowStateManager, ChapterTask, TaskStatus
 
 
+class PipelineStage:
+    """One per-chapter stage of a pipelined run (e.g. expand, edit, validate)."""
+
+    def __init__(
+        self,
+        name: str,
+        task_executor: Callable[[int], Union[Any, Awaitable[Any]]],
+        provider: str = "openai",
+        token_estimator: Optional[Callable[[int], int]] = None,
+        model: Optional[str] = None,
+        cache_key: Optional[Callable[[int], Optional[str]]] = None,
+        retry_policy: Optional[RetryPolicy] = None
+    ):
+        """
+        Initialize pipeline stage.
+
+        Args:
+            name: Stage name (used in results and progress callbacks)
+            task_executor: Function that takes a chapter number (sync functions
+                run on the worker pool)
+            provider: API provider for rate limiting
+            token_estimator: Optional function estimating a chapter's tokens
+            model: Optional model name for per-model TPM budgets
+            cache_key: Optional function returning a chapter's result cache key
+            retry_policy: Optional retry policy (defaults to the executor's)
+        """
+        self.name = name
+        self.task_executor = task_executor
+        self.provider = provider
+        self.token_estimator = token_estimator
+        self.model = model
+        self.cache_key = cache_key
+        self.retry_policy = retry_policy
+
+
 class ParallelExecutor:
     """
-    Executes tasks in parallel waves based on dependency graph.
+    Executes tasks in parallel based on dependency graph.
 
     Key Features:
-    - Wave-based execution (independent tasks run concurrently)
-    - Rate limiting per API provider
+    - Ready-queue scheduling (each task starts as soon as its dependencies complete)
+    - Per-chapter pipelines (chapter N moves to its next stage without a global barrier)
+    - Wave-based execution (kept for comparison)
+    - Bounded worker pool for blocking calls (e.g. Crew.kickoff())
+    - Rate limiting per API provider (RPM and TPM admission)
+    - Content-addressed result cache (hits skip the API call and rate limits)
     - Progress tracking
-    - Error handling and retry logic
+    - Retries with exponential backoff, jitter, Retry-After and a global budget
     - Performance metrics
     """
 
@@ -29,44 +74,250 @@ class ParallelExecutor:
         state_manager: WorkflowStateManager,
         max_concurrent: int = 5,
         rate_limiter: Optional[MultiProviderRateLimiter] = None,
-        verbose: bool = True
+        verbose: bool = True,
+        result_cache: Optional[TaskResultCache] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        retry_policies: Optional[Dict[str, RetryPolicy]] = None,
+        retry_budget: Optional[RetryBudget] = None
     ):
         """
         Initialize parallel executor.
 
         Args:
-            state_manager: WorkflowStateManager instance
+            state_manager: WorkflowStateManager (or AsyncWorkflowStateManager) instance
             max_concurrent: Max concurrent tasks (default: 5)
             rate_limiter: Optional rate limiter (creates default if None)
             verbose: Whether to print progress
+            result_cache: Optional cache for results of tasks given a cache key
+            retry_policy: Default retry policy (creates default if None)
+            retry_policies: Optional per-task-type policies (e.g. {"expand": ...})
+            retry_budget: Retry budget shared by all tasks (creates default if None)
         """
         self.state = state_manager
         self.max_concurrent = max_concurrent
         self.rate_limiter = rate_limiter or MultiProviderRateLimiter()
         self.verbose = verbose
+        self.result_cache = result_cache
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.retry_policies = retry_policies or {}
+        self.retry_budget = retry_budget or RetryBudget()
+
+        # Chapters that failed (after retries) in the last batch/pipeline run
+        self.last_failures: Dict[int, BaseException] = {}
+
+        # Worker pool for blocking task executors (created lazily)
+        self._worker_pool: Optional[ThreadPoolExecutor] = None
 
         # Metrics
         self.metrics = {
             "total_tasks": 0,
             "completed_tasks": 0,
             "failed_tasks": 0,
+            "skipped_tasks": 0,  # Never ran because a dependency failed
+            "cached_tasks": 0,  # Served from the result cache
+            "retries": 0,
             "total_time": 0,
             "wave_times": []
         }
 
+    def _get_worker_pool(self) -> ThreadPoolExecutor:
+        """Get (or lazily create) the bounded worker pool."""
+        if self._worker_pool is None:
+            self._worker_pool = ThreadPoolExecutor(
+                max_workers=self.max_concurrent,
+                thread_name_prefix="ghostwriter-worker"
+            )
+        return self._worker_pool
+
+    async def run_blocking(self, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        Run a blocking callable on the worker pool without stalling the event loop.
+
+        Crew.kickoff() is synchronous, so calling it directly from a coroutine
+        serializes every "parallel" chapter. Offloading it here lets up to
+        max_concurrent kickoffs run at the same time.
+
+        Args:
+            func: Blocking callable (e.g. crew.kickoff)
+            *args: Positional arguments for func
+            **kwargs: Keyword arguments for func
+
+        Returns:
+            Return value of func
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._get_worker_pool(),
+            functools.partial(func, *args, **kwargs)
+        )
+
+    async def _invoke(self, task_executor: Callable[..., Any], arg: Any) -> Any:
+        """
+        Invoke an async executor directly, or a sync one on the worker pool.
+
+        A sync wrapper that returns a coroutine (e.g. lambda ch: run(ch))
+        has its result awaited too.
+        """
+        if asyncio.iscoroutinefunction(task_executor):
+            return await task_executor(arg)
+        result = await self.run_blocking(task_executor, arg)
+        if inspect.isawaitable(result):
+            result = await result
+        return result
+
+    async def _persist(self, update: Callable[..., Any], *args: Any):
+        """
+        Apply a state update without blocking the event loop.
+
+        Updates of an async state manager (AsyncWorkflowStateManager) are
+        awaited; a sync WorkflowStateManager's Redis round trip runs in a
+        thread (not the kickoff worker pool, which may be full), so
+        concurrent tasks' transitions don't serialize the scheduler.
+
+        Args:
+            update: State manager method (e.g. self.state.mark_task_started)
+            *args: Arguments for the update
+        """
+        if asyncio.iscoroutinefunction(update):
+            await update(*args)
+        else:
+            await asyncio.to_thread(update, *args)
+
+    def _next_retry_delay(
+        self,
+        attempt: int,
+        error: Exception,
+        policy: RetryPolicy,
+        label: str
+    ) -> Optional[float]:
+        """Get the wait before retrying a failed attempt, or None to give up."""
+        if not policy.should_retry(attempt, error):
+            return None
+        if not self.retry_budget.try_acquire():
+            if self.verbose:
+                print(f"⛔ Retry budget exhausted, giving up on {label}")
+            return None
+
+        delay = policy.get_delay(attempt, error)
+        self.metrics["retries"] += 1
+        if self.verbose:
+            print(
+                f"🔁 {label} failed ({type(error).__name__}), "
+                f"retry {attempt}/{policy.max_attempts - 1} in {delay:.1f}s"
+            )
+        return delay
+
+    async def run_with_retry(
+        self,
+        attempt_fn: Callable[[], Awaitable[Any]],
+        label: str,
+        retry_policy: Optional[RetryPolicy] = None
+    ) -> Any:
+        """
+        Run an attempt, retrying transient failures.
+
+        Retryable errors (429, timeouts, 5xx) are retried after the policy's
+        backoff or the provider's Retry-After hint, while attempts and the
+        global retry budget last. Fatal errors are raised immediately.
+
+        Args:
+            attempt_fn: Coroutine function performing one attempt
+            label: Task label for progress output
+            retry_policy: Policy to use (defaults to the executor's)
+
+        Returns:
+            Result of the first successful attempt
+        """
+        policy = retry_policy or self.retry_policy
+        attempt = 1
+
+        while True:
+            try:
+                return await attempt_fn()
+            except Exception as e:
+                delay = self._next_retry_delay(attempt, e, policy, label)
+                if delay is None:
+                    raise
+
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    def call_with_retry(
+        self,
+        func: Callable[[], Any],
+        label: str,
+        retry_policy: Optional[RetryPolicy] = None
+    ) -> Any:
+        """
+        Blocking variant of run_with_retry for synchronous callers.
+
+        Args:
+            func: Callable performing one attempt (e.g. a phase's crew kickoff)
+            label: Task label for progress output
+            retry_policy: Policy to use (defaults to the executor's)
+
+        Returns:
+            Result of the first successful attempt
+        """
+        policy = retry_policy or self.retry_policy
+        attempt = 1
+
+        while True:
+            try:
+                return func()
+            except Exception as e:
+                delay = self._next_retry_delay(attempt, e, policy, label)
+                if delay is None:
+                    raise
+
+            time.sleep(delay)
+            attempt += 1
+
+    def _cache_lookup(self, key: Optional[str]) -> Tuple[bool, Any]:
+        """Look up a cached result; (False, None) without a key or cache."""
+        if key is None or self.result_cache is None:
+            return False, None
+
+        hit, result = self.result_cache.get(key)
+        if hit:
+            self.metrics["cached_tasks"] += 1
+        return hit, result
+
+    def _cache_store(self, key: Optional[str], result: Any):
+        """Cache a result (CrewAI outputs are stored as their raw text)."""
+        if key is not None and self.result_cache is not None:
+            self.result_cache.put(key, getattr(result, "raw", result))
+
+    def shutdown(self, wait: bool = True):
+        """
+        Shut down the worker pool.
+
+        Args:
+            wait: Whether to wait for running workers to finish
+        """
+        if self._worker_pool is not None:
+            self._worker_pool.shutdown(wait=wait)
+            self._worker_pool = None
+
     async def execute_wave(
         self,
         tasks: List[ChapterTask],
-        task_executor: Callable[[ChapterTask], Awaitable[Any]],
-        provider: str = "openai"
+        task_executor: Callable[[ChapterTask], Union[Any, Awaitable[Any]]],
+        provider: str = "openai",
+        token_estimator: Optional[Callable[[ChapterTask], int]] = None,
+        model: Optional[str] = None,
+        cache_key: Optional[Callable[[ChapterTask], Optional[str]]] = None
     ) -> List[Any]:
         """
         Execute a wave of independent tasks in parallel.
 
         Args:
             tasks: List of ChapterTask objects to execute
-            task_executor: Async function that executes a task
+            task_executor: Function that executes a task (sync functions run on the worker pool)
             provider: API provider for rate limiting
+            token_estimator: Optional function estimating a task's tokens for TPM admission
+            model: Optional model name for per-model TPM budgets
+            cache_key: Optional function returning a result cache key (None to bypass)
 
         Returns:
             List of task results
@@ -83,7 +334,7 @@ class ParallelExecutor:
 
         # Create async tasks
         async_tasks = [
-            self._execute_single_task(task, task_executor, provider)
+            self._execute_single_task(task, task_executor, provider, token_estimator, model, cache_key)
             for task in tasks
         ]
 
@@ -101,45 +352,72 @@ class ParallelExecutor:
     async def _execute_single_task(
         self,
         task: ChapterTask,
-        task_executor: Callable[[ChapterTask], Awaitable[Any]],
-        provider: str
+        task_executor: Callable[[ChapterTask], Union[Any, Awaitable[Any]]],
+        provider: str,
+        token_estimator: Optional[Callable[[ChapterTask], int]] = None,
+        model: Optional[str] = None,
+        cache_key: Optional[Callable[[ChapterTask], Optional[str]]] = None
     ) -> Any:
         """
         Execute a single task with rate limiting.
 
         Args:
             task: ChapterTask to execute
-            task_executor: Async function to execute
+            task_executor: Function to execute (sync functions run on the worker pool)
             provider: API provider
+            token_estimator: Optional function estimating the task's tokens
+            model: Optional model name for per-model TPM budgets
+            cache_key: Optional function returning a result cache key (None to bypass)
 
         Returns:
             Task result
         """
         self.metrics["total_tasks"] += 1
 
+        # Unchanged inputs: reuse the cached result without an API call
+        key = cache_key(task) if cache_key else None
+        hit, cached = self._cache_lookup(key)
+        if hit:
+            await self._persist(self.state.mark_task_complete, task.id, cached)
+            self.metrics["completed_tasks"] += 1
+
+            if self.verbose:
+                print(f"♻️  Cached: {task.id}")
+
+            return cached
+
         # Mark task as started
-        self.state.mark_task_started(task.id)
+        await self._persist(self.state.mark_task_started, task.id)
 
-        try:
-            # Rate-limited execution
-            async with RateLimitedTask(self.rate_limiter, provider):
+        async def attempt() -> Any:
+            # Rate-limited execution (TPM admission on the estimate,
+            # reconciled with reported usage on exit); retries are re-admitted
+            tokens = token_estimator(task) if token_estimator else 0
+            async with RateLimitedTask(self.rate_limiter, provider, tokens, model) as slot:
                 if self.verbose:
                     print(f"▶️  Starting: {task.id}")
 
-                result = await task_executor(task)
+                result = await self._invoke(task_executor, task)
+                slot.report_usage(get_token_usage(result))
+                return result
 
-                # Mark as complete
-                self.state.mark_task_complete(task.id, result)
-                self.metrics["completed_tasks"] += 1
+        try:
+            policy = self.retry_policies.get(task.task_type.value)
+            result = await self.run_with_retry(attempt, task.id, policy)
+            self._cache_store(key, result)
 
-                if self.verbose:
-                    print(f"✅ Completed: {task.id}")
+            # Mark as complete
+            await self._persist(self.state.mark_task_complete, task.id, result)
+            self.metrics["completed_tasks"] += 1
 
-                return result
+            if self.verbose:
+                print(f"✅ Completed: {task.id}")
+
+            return result
 
         except Exception as e:
             # Mark as failed
-            self.state.mark_task_failed(task.id, str(e))
+            await self._persist(self.state.mark_task_failed, task.id, str(e))
             self.metrics["failed_tasks"] += 1
 
             if self.verbose:
@@ -149,26 +427,85 @@ class ParallelExecutor:
 
     async def execute_workflow(
         self,
-        task_executor: Callable[[ChapterTask], Awaitable[Any]],
-        provider: str = "openai"
+        task_executor: Callable[[ChapterTask], Union[Any, Awaitable[Any]]],
+        provider: str = "openai",
+        mode: str = "dag",
+        token_estimator: Optional[Callable[[ChapterTask], int]] = None,
+        model: Optional[str] = None,
+        cache_key: Optional[Callable[[ChapterTask], Optional[str]]] = None
     ) -> Dict[str, Any]:
         """
-        Execute entire workflow in dependency-aware waves.
+        Execute entire workflow respecting task dependencies.
 
         Args:
-            task_executor: Async function to execute each task
+            task_executor: Function to execute each task (sync functions run on the worker pool)
             provider: API provider for rate limiting
+            mode: "dag" starts each task as soon as its dependencies complete;
+                "wave" waits for a whole wave before starting the next
+            token_estimator: Optional function estimating a task's tokens for TPM admission
+            model: Optional model name for per-model TPM budgets
+            cache_key: Optional function returning a result cache key (None to bypass)
 
         Returns:
             Execution metrics and results
         """
+        if mode not in ("dag", "wave"):
+            raise ValueError(f"mode must be 'dag' or 'wave', got '{mode}'")
+
         workflow_start = time.time()
 
         if self.verbose:
             print("\n" + "=" * 60)
-            print("🚀 PARALLEL WORKFLOW EXECUTION")
+            print(f"🚀 PARALLEL WORKFLOW EXECUTION ({mode} scheduler)")
             print("=" * 60)
 
+        if mode == "wave":
+            all_results = await self._execute_waves(task_executor, provider, token_estimator, model, cache_key)
+        else:
+            all_results = await self._execute_ready_queue(task_executor, provider, token_estimator, model, cache_key)
+
+        workflow_time = time.time() - workflow_start
+        self.metrics["total_time"] = workflow_time
+
+        if self.verbose:
+            print(f"\n{'='*60}")
+            print("✅ WORKFLOW COMPLETE")
+            print(f"{'='*60}")
+            print(f"Total time: {workflow_time:.1f}s")
+            print(f"Completed: {self.metrics['completed_tasks']}/{self.metrics['total_tasks']}")
+            print(f"Failed: {self.metrics['failed_tasks']}")
+            if self.metrics["skipped_tasks"]:
+                print(f"Skipped (failed dependencies): {self.metrics['skipped_tasks']}")
+            if self.metrics["wave_times"]:
+                print(f"Average wave time: {sum(self.metrics['wave_times'])/len(self.metrics['wave_times']):.1f}s")
+
+        return {
+            "results": all_results,
+            "metrics": self.metrics.copy(),
+            "state": self.state.get_workflow_stats()
+        }
+
+    async def _execute_waves(
+        self,
+        task_executor: Callable[[ChapterTask], Union[Any, Awaitable[Any]]],
+        provider: str,
+        token_estimator: Optional[Callable[[ChapterTask], int]] = None,
+        model: Optional[str] = None,
+        cache_key: Optional[Callable[[ChapterTask], Optional[str]]] = None
+    ) -> Dict[str, Any]:
+        """
+        Execute the workflow wave by wave (barrier between waves).
+
+        Args:
+            task_executor: Function to execute each task
+            provider: API provider for rate limiting
+            token_estimator: Optional function estimating a task's tokens
+            model: Optional model name for per-model TPM budgets
+            cache_key: Optional function returning a result cache key (None to bypass)
+
+        Returns:
+            Dictionary mapping task IDs to results
+        """
         # Get tasks organized by wave
         waves = self.state.get_tasks_by_wave()
 
@@ -190,36 +527,111 @@ class ParallelExecutor:
                 print(f"{'='*60}")
 
             # Execute wave
-            results = await self.execute_wave(wave_tasks, task_executor, provider)
+            results = await self.execute_wave(wave_tasks, task_executor, provider, token_estimator, model, cache_key)
 
             # Store results
             for task, result in zip(wave_tasks, results):
                 if not isinstance(result, Exception):
                     all_results[task.id] = result
 
-        workflow_time = time.time() - workflow_start
-        self.metrics["total_time"] = workflow_time
+        return all_results
+
+    async def _execute_ready_queue(
+        self,
+        task_executor: Callable[[ChapterTask], Union[Any, Awaitable[Any]]],
+        provider: str,
+        token_estimator: Optional[Callable[[ChapterTask], int]] = None,
+        model: Optional[str] = None,
+        cache_key: Optional[Callable[[ChapterTask], Optional[str]]] = None
+    ) -> Dict[str, Any]:
+        """
+        Execute the workflow with a completion-triggered ready queue.
+
+        Each task is dispatched the moment all of its dependencies are
+        COMPLETE, so one slow chapter only delays its own downstream tasks.
+        At most max_concurrent tasks are in flight at once.
+
+        Args:
+            task_executor: Function to execute each task
+            provider: API provider for rate limiting
+            token_estimator: Optional function estimating a task's tokens
+            model: Optional model name for per-model TPM budgets
+            cache_key: Optional function returning a result cache key (None to bypass)
+
+        Returns:
+            Dictionary mapping task IDs to results
+        """
+        tasks = self.state.tasks
+
+        # The state manager keeps unmet-dependency counters and a ready set
+        # up to date as tasks complete or are added, so dispatch decisions
+        # are O(1) per transition. Already-complete tasks (e.g. from a
+        # previous run) count as satisfied and are not rerun; failed ones
+        # with satisfied dependencies are retried.
+        ready: Deque[str] = deque()
+        queued: Set[str] = set()  # IDs waiting in ready (a task replaced while queued reappears)
+
+        def enqueue(task_ids: Iterable[str]):
+            for task_id in task_ids:
+                if task_id not in queued:
+                    queued.add(task_id)
+                    ready.append(task_id)
+
+        enqueue(task.id for task in self.state.get_ready_tasks())
+        enqueue(
+            task_id for task_id, task in tasks.items()
+            if task.status == TaskStatus.FAILED and self.state.get_unmet_dependency_count(task_id) == 0
+        )
 
         if self.verbose:
-            print(f"\n{'='*60}")
-            print("✅ WORKFLOW COMPLETE")
-            print(f"{'='*60}")
-            print(f"Total time: {workflow_time:.1f}s")
-            print(f"Completed: {self.metrics['completed_tasks']}/{self.metrics['total_tasks']}")
-            print(f"Failed: {self.metrics['failed_tasks']}")
-            print(f"Average wave time: {sum(self.metrics['wave_times'])/len(self.metrics['wave_times']):.1f}s")
+            print(f"\n📊 Workflow Analysis:")
+            print(f"   Total tasks: {sum(1 for task in tasks.values() if task.status != TaskStatus.COMPLETE)}")
+            print(f"   Initially ready: {len(ready)}")
+            print(f"   Max concurrent: {self.max_concurrent}")
 
-        return {
-            "results": all_results,
-            "metrics": self.metrics.copy(),
-            "state": self.state.get_workflow_stats()
-        }
+        all_results = {}
+        running: Dict[asyncio.Task, str] = {}
+
+        while ready or running:
+            # Fill free worker slots from the ready queue
+            while ready and len(running) < self.max_concurrent:
+                task_id = ready.popleft()
+                queued.discard(task_id)
+                future = asyncio.create_task(
+                    self._execute_single_task(
+                        tasks[task_id], task_executor, provider, token_estimator, model, cache_key
+                    )
+                )
+                running[future] = task_id
+
+            done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+
+            for future in done:
+                task_id = running.pop(future)
+                if future.exception() is None:
+                    all_results[task_id] = future.result()
+
+            # Dependents whose last dependency just completed, fix tasks
+            # flagged mid-run and fix passes reopened for new flags
+            enqueue(task.id for task in self.state.get_ready_tasks())
+
+        # Tasks left waiting had a dependency that failed
+        self.metrics["skipped_tasks"] += sum(
+            1 for task in tasks.values()
+            if task.status in (TaskStatus.PENDING, TaskStatus.BLOCKED, TaskStatus.READY)
+        )
+
+        return all_results
 
     async def execute_chapter_batch(
         self,
         chapter_numbers: List[int],
-        task_executor: Callable[[int], Awaitable[Any]],
-        provider: str = "openai"
+        task_executor: Callable[[int], Union[Any, Awaitable[Any]]],
+        provider: str = "openai",
+        token_estimator: Optional[Callable[[int], int]] = None,
+        model: Optional[str] = None,
+        cache_key: Optional[Callable[[int], Optional[str]]] = None,
+        retry_policy: Optional[RetryPolicy] = None
     ) -> Dict[int, Any]:
         """
         Execute tasks for multiple chapters in parallel.
@@ -228,22 +640,47 @@ class ParallelExecutor:
 
         Args:
             chapter_numbers: List of chapter numbers to process
-            task_executor: Async function that takes chapter number
+            task_executor: Function that takes chapter number. Async functions
+                are awaited; sync (blocking) functions run on the worker pool.
             provider: API provider
+            token_estimator: Optional function estimating a chapter's tokens
+                (prompt + max output) for TPM admission
+            model: Optional model name for per-model TPM budgets
+            cache_key: Optional function returning a result cache key (None to bypass)
+            retry_policy: Optional retry policy (defaults to the executor's)
 
         Returns:
-            Dictionary mapping chapter numbers to results
+            Dictionary mapping chapter numbers to results. Chapters that still
+            fail after retries are left out and recorded in last_failures.
         """
         if self.verbose:
             print(f"\n🔀 Batch processing {len(chapter_numbers)} chapters...")
 
+        # Bound in-flight chapters to max_concurrent (on top of provider limits)
+        slots = asyncio.Semaphore(self.max_concurrent)
+
         # Create wrapper tasks
         async def execute_chapter(ch_num: int) -> Any:
-            async with RateLimitedTask(self.rate_limiter, provider):
+            key = cache_key(ch_num) if cache_key else None
+            hit, cached = self._cache_lookup(key)
+            if hit:
+                if self.verbose:
+                    print(f"♻️  Chapter {ch_num} cached")
+                return cached
+
+            async def attempt() -> Any:
+                tokens = token_estimator(ch_num) if token_estimator else 0
+                async with RateLimitedTask(self.rate_limiter, provider, tokens, model) as slot:
+                    result = await self._invoke(task_executor, ch_num)
+                    slot.report_usage(get_token_usage(result))
+                    return result
+
+            async with slots:
                 if self.verbose:
                     print(f"▶️  Processing Chapter {ch_num}...")
 
-                result = await task_executor(ch_num)
+                result = await self.run_with_retry(attempt, f"Chapter {ch_num}", retry_policy)
+                self._cache_store(key, result)
 
                 if self.verbose:
                     print(f"✅ Chapter {ch_num} complete")
@@ -258,19 +695,141 @@ class ParallelExecutor:
 
         # Build result dictionary
         result_dict = {}
+        self.last_failures = {}
         for ch_num, result in zip(chapter_numbers, results):
             if not isinstance(result, Exception):
                 result_dict[ch_num] = result
             else:
-                if self.verbose:
-                    print(f"❌ Chapter {ch_num} failed: {result}")
+                self.last_failures[ch_num] = result
+                self.metrics["failed_tasks"] += 1
+
+        self._report_failures()
 
         return result_dict
 
+    async def execute_chapter_pipeline(
+        self,
+        chapter_numbers: List[int],
+        stages: List[PipelineStage],
+        on_progress: Optional[Callable[[int, str, str], None]] = None,
+        completed: Optional[Dict[int, Dict[str, Any]]] = None
+    ) -> Dict[int, Dict[str, Any]]:
+        """
+        Run each chapter through all stages, without barriers between stages.
+
+        Chapter N starts its next stage as soon as its own previous stage
+        finishes, instead of waiting for every chapter to finish the phase.
+        Up to max_concurrent chapters are in flight; a chapter keeps its slot
+        until its last stage, so early chapters finish first.
+
+        Args:
+            chapter_numbers: Chapter numbers to process (in priority order)
+            stages: Ordered stages each chapter goes through
+            on_progress: Optional callback (chapter, stage name, status) where
+                status is "running", "completed" or "error"
+            completed: Optional {chapter: {stage name: result}} for stages
+                finished by an earlier run; they are skipped and their
+                results reused
+
+        Returns:
+            Dictionary mapping chapter numbers to {stage name: result} for the
+            stages that completed (a failed stage stops that chapter)
+        """
+        if self.verbose:
+            stage_names = " → ".join(stage.name for stage in stages)
+            print(f"\n🔀 Pipelining {len(chapter_numbers)} chapters ({stage_names})...")
+
+        slots = asyncio.Semaphore(self.max_concurrent)
+        completed = completed or {}
+        all_results: Dict[int, Dict[str, Any]] = {
+            ch_num: dict(completed.get(ch_num, {})) for ch_num in chapter_numbers
+        }
+
+        def report(ch_num: int, stage: PipelineStage, status: str):
+            if on_progress:
+                on_progress(ch_num, stage.name, status)
+
+        async def run_chapter(ch_num: int):
+            async with slots:
+                for stage in stages:
+                    if stage.name in all_results[ch_num]:
+                        continue
+
+                    report(ch_num, stage, "running")
+                    if self.verbose:
+                        print(f"▶️  Chapter {ch_num}: {stage.name}")
+
+                    try:
+                        result = await self.execute_chapter_stage(ch_num, stage)
+                    except Exception as e:
+                        report(ch_num, stage, "error")
+                        failures[ch_num] = e
+                        raise
+
+                    all_results[ch_num][stage.name] = result
+                    report(ch_num, stage, "completed")
+
+                if self.verbose:
+                    print(f"✅ Chapter {ch_num} finished all stages")
+
+        failures: Dict[int, BaseException] = {}
+        await asyncio.gather(
+            *[run_chapter(ch) for ch in chapter_numbers],
+            return_exceptions=True
+        )
+
+        self.last_failures = failures
+        self.metrics["failed_tasks"] += len(failures)
+        self._report_failures()
+
+        return all_results
+
+    async def execute_chapter_stage(self, ch_num: int, stage: PipelineStage) -> Any:
+        """
+        Run one stage for one chapter.
+
+        A cached result is returned as is; otherwise the stage runs under
+        the provider's rate limits (admitted by its token estimate) and is
+        retried on transient errors, and the result is cached.
+
+        Args:
+            ch_num: Chapter number
+            stage: Stage to run
+
+        Returns:
+            Stage result
+        """
+        key = stage.cache_key(ch_num) if stage.cache_key else None
+        hit, result = self._cache_lookup(key)
+        if hit:
+            return result
+
+        async def attempt() -> Any:
+            tokens = stage.token_estimator(ch_num) if stage.token_estimator else 0
+            async with RateLimitedTask(self.rate_limiter, stage.provider, tokens, stage.model) as slot:
+                result = await self._invoke(stage.task_executor, ch_num)
+                slot.report_usage(get_token_usage(result))
+                return result
+
+        result = await self.run_with_retry(attempt, f"Chapter {ch_num} {stage.name}", stage.retry_policy)
+        self._cache_store(key, result)
+        return result
+
+    def _report_failures(self):
+        """Warn about chapters that failed after retries (always printed)."""
+        if not self.last_failures:
+            return
+
+        print(f"⚠️  {len(self.last_failures)} chapter(s) failed after retries:")
+        for ch_num, error in sorted(self.last_failures.items()):
+            print(f"   ❌ Chapter {ch_num}: {type(error).__name__}: {error}")
+
     def get_metrics(self) -> Dict[str, Any]:
         """Get execution metrics."""
         return {
             **self.metrics,
+            "result_cache_stats": self.result_cache.get_stats() if self.result_cache else None,
+            "retry_budget_stats": self.retry_budget.get_stats(),
             "rate_limiter_stats": self.rate_limiter.get_all_stats(),
             "workflow_stats": self.state.get_workflow_stats()
         }
@@ -321,14 +880,16 @@ class MockTaskExecutor:
     Simulates task execution with configurable delay.
     """
 
-    def __init__(self, delay_seconds: float = 1.0):
+    def __init__(self, delay_seconds: float = 1.0, task_delays: Optional[Dict[str, float]] = None):
         """
         Initialize mock executor.
 
         Args:
             delay_seconds: Simulated task duration
+            task_delays: Optional per-task durations (task ID → seconds)
         """
         self.delay = delay_seconds
+        self.task_delays = task_delays or {}
         self.executed_tasks = []
 
     async def execute(self, task: ChapterTask) -> str:
@@ -342,5 +903,19 @@ class MockTaskExecutor:
             Result string
         """
         self.executed_tasks.append(task.id)
-        await asyncio.sleep(self.delay)
+        await asyncio.sleep(self.task_delays.get(task.id, self.delay))
+        return f"Result for {task.id}"
+
+    def execute_blocking(self, task: ChapterTask) -> str:
+        """
+        Simulate a blocking task (like Crew.kickoff()) that holds its thread.
+
+        Args:
+            task: ChapterTask to execute
+
+        Returns:
+            Result string
+        """
+        self.executed_tasks.append(task.id)
+        time.sleep(self.task_delays.get(task.id, self.delay))
         return f"Result for {task.id}"
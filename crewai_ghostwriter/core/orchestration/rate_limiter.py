@@ -4,27 +4,133 @@ Prevents exceeding API rate limits (e.g., 30 RPM for OpenAI).
 """
 
 import asyncio
+import hashlib
+import threading
 import time
-from typing import Dict, Optional
-from datetime import datetime, timedelta
-from collections import deque
+from typing import Any, Dict, List, Optional, Tuple
+import redis
+
+
+# Rough English average; good enough for admission control, which is
+# reconciled against actual usage afterwards
+CHARS_PER_TOKEN = 4
+
+
+def estimate_tokens(text: str, max_output_tokens: int = 0) -> int:
+    """
+    Estimate the tokens a request will consume before dispatch.
+
+    Args:
+        text: Full prompt text (task description, chapter, context)
+        max_output_tokens: Max tokens the model may generate
+
+    Returns:
+        Estimated prompt + output tokens
+    """
+    return len(text or "") // CHARS_PER_TOKEN + max_output_tokens
+
+
+def get_token_usage(result: Any) -> Optional[int]:
+    """
+    Extract actual token usage from a task result, if it reports any.
+
+    Understands CrewAI outputs (result.token_usage.total_tokens) and plain
+    dictionaries with a "total_tokens" entry.
+
+    Args:
+        result: Task result
+
+    Returns:
+        Total tokens used, or None if unknown
+    """
+    usage = getattr(result, "token_usage", None)
+    if usage is None and isinstance(result, dict):
+        usage = result.get("token_usage", result)
+    if usage is None:
+        return None
+    if isinstance(usage, dict):
+        total = usage.get("total_tokens")
+    else:
+        total = getattr(usage, "total_tokens", None)
+    return int(total) if total is not None else None
+
+
+class GCRAWindow:
+    """
+    Generic Cell Rate Algorithm (GCRA) state for one rate window.
+
+    Equivalent to a token bucket holding `limit` tokens that refills at
+    limit/period tokens per second, but stored as a single number: the
+    theoretical arrival time (TAT) of the next request. Memory is O(1)
+    regardless of the limit.
+    """
+
+    def __init__(self, limit: int, period: float):
+        """
+        Initialize window.
+
+        Args:
+            limit: Max requests per period (also the burst size)
+            period: Window length in seconds
+        """
+        self.limit = limit
+        self.period = period
+        self.emission_interval = period / limit  # Seconds per token
+        self.tat = 0.0
+
+    def earliest(self, now: float, cost: float = 1) -> float:
+        """
+        Earliest time a request of the given cost conforms.
+
+        Args:
+            now: Current time
+            cost: Tokens the request consumes
+
+        Returns:
+            Timestamp at which the request may start (>= now)
+        """
+        # A request conforms once the bucket has room for `cost` tokens
+        allow_at = max(self.tat, now) + cost * self.emission_interval - self.period
+        return max(now, allow_at)
+
+    def commit(self, at: float, cost: float = 1):
+        """
+        Record a request granted at time `at`.
+
+        Args:
+            at: Grant time returned by earliest()
+            cost: Tokens the request consumes
+        """
+        self.tat = max(self.tat, at) + cost * self.emission_interval
+
+    def used(self, now: float) -> int:
+        """Tokens currently consumed (requests counted against the window)."""
+        outstanding = max(0.0, self.tat - now)
+        return min(self.limit, int(-(-outstanding // self.emission_interval)))
 
 
 class RateLimiter:
     """
-    Token bucket rate limiter for API calls.
+    GCRA (token bucket) rate limiter for API calls.
 
     Supports multiple rate limits:
     - Requests per minute (RPM)
     - Requests per day (RPD)
+    - Tokens per minute (TPM), admitted on an estimate and reconciled
+      against actual usage afterwards
     - Concurrent requests limit
+
+    Permits are granted in FIFO order. Waiting callers reserve their grant
+    time under a short lock and then sleep outside it, so one waiter never
+    serializes the others. State is constant-size for every window.
     """
 
     def __init__(
         self,
         max_requests_per_minute: int = 30,
         max_requests_per_day: Optional[int] = None,
-        max_concurrent: int = 5
+        max_concurrent: int = 5,
+        max_tokens_per_minute: Optional[int] = None
     ):
         """
         Initialize rate limiter.
@@ -33,78 +139,145 @@ class RateLimiter:
             max_requests_per_minute: Max requests per minute (default: 30)
             max_requests_per_day: Max requests per day (optional)
             max_concurrent: Max concurrent requests (default: 5)
+            max_tokens_per_minute: Max tokens per minute (optional)
         """
         self.max_rpm = max_requests_per_minute
         self.max_rpd = max_requests_per_day
+        self.max_tpm = max_tokens_per_minute
         self.max_concurrent = max_concurrent
 
-        # Track request timestamps
-        self.requests_minute = deque()  # Last minute of requests
-        self.requests_day = deque()  # Last day of requests
+        # Constant-size GCRA state per window
+        self.minute_window = GCRAWindow(max_requests_per_minute, 60)
+        self.day_window = GCRAWindow(max_requests_per_day, 86400) if max_requests_per_day else None
+        self.token_window = GCRAWindow(max_tokens_per_minute, 60) if max_tokens_per_minute else None
+
+        # Semaphore for concurrent limit (bound to the running event loop)
+        self.semaphore: Optional[asyncio.Semaphore] = None
+        self._semaphore_loop: Optional[asyncio.AbstractEventLoop] = None
+
+        # Guards reservations only; never held across an await
+        self.lock = threading.Lock()
+
+        # Counters
+        self.total_requests = 0
+        self.total_wait_time = 0.0
+        self.total_tokens_estimated = 0
+        self.total_tokens_actual = 0
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        """Get the concurrency semaphore for the running event loop."""
+        loop = asyncio.get_running_loop()
+        if self.semaphore is None or self._semaphore_loop is not loop:
+            self.semaphore = asyncio.Semaphore(self.max_concurrent)
+            self._semaphore_loop = loop
+        return self.semaphore
+
+    def _windows(self, tokens: int = 0) -> List[Tuple[GCRAWindow, float]]:
+        """Active windows paired with the cost this request charges to each."""
+        windows = [(self.minute_window, 1)]
+        if self.day_window:
+            windows.append((self.day_window, 1))
+        if self.token_window and tokens > 0:
+            windows.append((self.token_window, tokens))
+        return windows
+
+    def reserve(self, now: Optional[float] = None, tokens: int = 0) -> float:
+        """
+        Reserve the next permit and return how long the caller must wait.
 
-        # Semaphore for concurrent limit
-        self.semaphore = asyncio.Semaphore(max_concurrent)
+        Reservations are handed out in call order, so grant times are FIFO.
 
-        # Lock for thread safety
-        self.lock = asyncio.Lock()
+        Args:
+            now: Current monotonic time (defaults to time.monotonic())
+            tokens: Estimated tokens (prompt + max output) for the TPM window
 
-    async def acquire(self):
+        Returns:
+            Seconds to wait before the request may start
         """
-        Acquire permission to make a request.
-        Blocks until rate limit allows the request.
+        with self.lock:
+            now = time.monotonic() if now is None else now
+            windows = self._windows(tokens)
+
+            grant_at = max(window.earliest(now, cost) for window, cost in windows)
+            for window, cost in windows:
+                window.commit(grant_at, cost)
+
+            self.total_requests += 1
+            self.total_tokens_estimated += tokens
+            return grant_at - now
+
+    async def reserve_async(self, tokens: int = 0) -> float:
         """
-        async with self.lock:
-            now = time.time()
+        Reserve the next permit from a coroutine.
 
-            # Wait for RPM limit
-            await self._wait_for_rpm(now)
+        In-process reservations only take a short lock, so this just calls
+        reserve(); subclasses that reserve over the network override it.
 
-            # Wait for RPD limit (if set)
-            if self.max_rpd:
-                await self._wait_for_rpd(now)
+        Args:
+            tokens: Estimated tokens (prompt + max output) for the TPM window
 
-            # Record this request
-            self.requests_minute.append(now)
-            if self.max_rpd:
-                self.requests_day.append(now)
+        Returns:
+            Seconds to wait before the request may start
+        """
+        return self.reserve(tokens=tokens)
 
-        # Acquire concurrent slot (will block if at max_concurrent)
-        await self.semaphore.acquire()
+    async def reconcile_async(self, estimated_tokens: int, actual_tokens: int):
+        """
+        Correct the TPM window from a coroutine (see reconcile()).
 
-    def release(self):
-        """Release the concurrent slot."""
-        self.semaphore.release()
-
-    async def _wait_for_rpm(self, now: float):
-        """Wait if we've exceeded requests per minute."""
-        # Remove requests older than 1 minute
-        one_minute_ago = now - 60
-        while self.requests_minute and self.requests_minute[0] < one_minute_ago:
-            self.requests_minute.popleft()
-
-        # If at limit, wait until oldest request expires
-        if len(self.requests_minute) >= self.max_rpm:
-            oldest = self.requests_minute[0]
-            wait_time = 60 - (now - oldest) + 0.1  # Add 0.1s buffer
-            if wait_time > 0:
-                print(f"⏳ Rate limit: waiting {wait_time:.1f}s (RPM: {self.max_rpm})")
-                await asyncio.sleep(wait_time)
+        Args:
+            estimated_tokens: Tokens charged at admission
+            actual_tokens: Tokens the provider reported
+        """
+        self.reconcile(estimated_tokens, actual_tokens)
+
+    def reconcile(self, estimated_tokens: int, actual_tokens: int):
+        """
+        Correct the TPM window once actual usage is known.
+
+        Under-estimates are charged, over-estimates are refunded, so the
+        next admissions see the real budget.
 
-    async def _wait_for_rpd(self, now: float):
-        """Wait if we've exceeded requests per day."""
-        # Remove requests older than 1 day
-        one_day_ago = now - 86400
-        while self.requests_day and self.requests_day[0] < one_day_ago:
-            self.requests_day.popleft()
-
-        # If at limit, wait until oldest request expires
-        if len(self.requests_day) >= self.max_rpd:
-            oldest = self.requests_day[0]
-            wait_time = 86400 - (now - oldest) + 1  # Add 1s buffer
+        Args:
+            estimated_tokens: Tokens charged at admission
+            actual_tokens: Tokens the provider reported
+        """
+        with self.lock:
+            self.total_tokens_actual += actual_tokens
+            if self.token_window:
+                delta = actual_tokens - estimated_tokens
+                self.token_window.tat += delta * self.token_window.emission_interval
+
+    async def acquire(self, tokens: int = 0):
+        """
+        Acquire permission to make a request.
+        Blocks until rate limit allows the request.
+
+        Args:
+            tokens: Estimated tokens (prompt + max output) for the TPM window
+        """
+        # Take a concurrent slot first so the request is recorded when it
+        # can actually be dispatched
+        semaphore = self._get_semaphore()
+        await semaphore.acquire()
+
+        try:
+            wait_time = await self.reserve_async(tokens=tokens)
             if wait_time > 0:
-                hours = wait_time / 3600
-                print(f"⏳ Daily rate limit: waiting {hours:.1f}h (RPD: {self.max_rpd})")
+                self.total_wait_time += wait_time
+                if wait_time >= 3600:
+                    print(f"⏳ Daily rate limit: waiting {wait_time / 3600:.1f}h (RPD: {self.max_rpd})")
+                elif wait_time >= 1:
+                    print(f"⏳ Rate limit: waiting {wait_time:.1f}s (RPM: {self.max_rpm})")
                 await asyncio.sleep(wait_time)
+        except BaseException:
+            semaphore.release()
+            raise
+
+    def release(self):
+        """Release the concurrent slot."""
+        if self.semaphore is not None:
+            self.semaphore.release()
 
     def get_stats(self) -> Dict[str, int]:
         """
@@ -113,17 +286,11 @@ class RateLimiter:
         Returns:
             Dictionary with current usage stats
         """
-        now = time.time()
-
-        # Count requests in last minute
-        one_minute_ago = now - 60
-        rpm_count = sum(1 for t in self.requests_minute if t > one_minute_ago)
+        now = time.monotonic()
 
-        # Count requests in last day
-        rpd_count = 0
-        if self.max_rpd:
-            one_day_ago = now - 86400
-            rpd_count = sum(1 for t in self.requests_day if t > one_day_ago)
+        rpm_count = self.minute_window.used(now)
+        rpd_count = self.day_window.used(now) if self.day_window else 0
+        tpm_count = self.token_window.used(now) if self.token_window else 0
 
         return {
             "requests_last_minute": rpm_count,
@@ -132,66 +299,408 @@ class RateLimiter:
             "requests_last_day": rpd_count,
             "rpd_limit": self.max_rpd or 0,
             "rpd_available": max(0, (self.max_rpd or 0) - rpd_count),
+            "tokens_last_minute": tpm_count,
+            "tpm_limit": self.max_tpm or 0,
+            "tpm_available": max(0, (self.max_tpm or 0) - tpm_count),
             "concurrent_limit": self.max_concurrent,
-            "concurrent_available": self.semaphore._value
+            "concurrent_available": (
+                self.semaphore._value if self.semaphore is not None else self.max_concurrent
+            ),
+            "total_requests": self.total_requests,
+            "total_wait_time": round(self.total_wait_time, 2),
+            "total_tokens_estimated": self.total_tokens_estimated,
+            "total_tokens_actual": self.total_tokens_actual
+        }
+
+
+# Atomic multi-window GCRA reservation, evaluated server-side.
+# KEYS[i]: TAT key per window (milliseconds)
+# ARGV: emission_interval_ms, period_ms, cost for each window, in KEYS order
+# Returns: wait in milliseconds (string, to keep sub-ms precision)
+GCRA_RESERVE_SCRIPT = """
+local t = redis.call('TIME')
+local now = tonumber(t[1]) * 1000 + tonumber(t[2]) / 1000
+local grant = now
+local tats = {}
+for i = 1, #KEYS do
+    local interval = tonumber(ARGV[3 * i - 2])
+    local period = tonumber(ARGV[3 * i - 1])
+    local cost = tonumber(ARGV[3 * i])
+    local tat = tonumber(redis.call('GET', KEYS[i]) or '0')
+    tats[i] = tat
+    local allow_at = math.max(tat, now) + cost * interval - period
+    if allow_at > grant then
+        grant = allow_at
+    end
+end
+for i = 1, #KEYS do
+    local interval = tonumber(ARGV[3 * i - 2])
+    local cost = tonumber(ARGV[3 * i])
+    local new_tat = math.max(tats[i], grant) + cost * interval
+    redis.call('SET', KEYS[i], tostring(new_tat), 'PX', math.ceil(new_tat - now) + 1000)
+end
+return tostring(grant - now)
+"""
+
+# Shift a window's TAT after actual usage is known (no-op if expired).
+# KEYS[1]: TAT key; ARGV[1]: delta in milliseconds (may be negative)
+GCRA_ADJUST_SCRIPT = """
+local tat = redis.call('GET', KEYS[1])
+if not tat then
+    return 0
+end
+local ttl = redis.call('PTTL', KEYS[1])
+local new_tat = tonumber(tat) + tonumber(ARGV[1])
+redis.call('SET', KEYS[1], tostring(new_tat), 'PX', math.max(1, ttl + math.ceil(tonumber(ARGV[1]))))
+return 1
+"""
+
+
+class RedisRateLimiter(RateLimiter):
+    """
+    GCRA rate limiter whose RPM/RPD state lives in Redis.
+
+    Every process (orchestrators, API jobs, uvicorn workers) using the same
+    key shares one budget. Reservations run as a single Lua script using the
+    Redis server clock, so they are atomic and immune to client clock skew.
+
+    The concurrent-request limit stays per process.
+    """
+
+    def __init__(
+        self,
+        redis_client: redis.Redis,
+        key: str,
+        max_requests_per_minute: int = 30,
+        max_requests_per_day: Optional[int] = None,
+        max_concurrent: int = 5,
+        max_tokens_per_minute: Optional[int] = None
+    ):
+        """
+        Initialize Redis-backed rate limiter.
+
+        Args:
+            redis_client: Redis client
+            key: Budget key (e.g. "openai:<api key hash>"); limiters with
+                the same key share one budget
+            max_requests_per_minute: Max requests per minute (default: 30)
+            max_requests_per_day: Max requests per day (optional)
+            max_concurrent: Max concurrent requests in this process (default: 5)
+            max_tokens_per_minute: Max tokens per minute (optional)
+        """
+        super().__init__(
+            max_requests_per_minute=max_requests_per_minute,
+            max_requests_per_day=max_requests_per_day,
+            max_concurrent=max_concurrent,
+            max_tokens_per_minute=max_tokens_per_minute
+        )
+        self.redis = redis_client
+        self.key = key
+        self._reserve_script = self.redis.register_script(GCRA_RESERVE_SCRIPT)
+        self._adjust_script = self.redis.register_script(GCRA_ADJUST_SCRIPT)
+
+    def _window_key(self, window: GCRAWindow) -> str:
+        """Redis TAT key for a window."""
+        if window is self.minute_window:
+            return f"ratelimit:{self.key}:rpm"
+        if window is self.day_window:
+            return f"ratelimit:{self.key}:rpd"
+        return f"ratelimit:{self.key}:tpm"
+
+    def _window_keys(self) -> Dict[str, GCRAWindow]:
+        """Map Redis TAT keys to their window definitions."""
+        windows = [self.minute_window, self.day_window, self.token_window]
+        return {
+            self._window_key(window): window
+            for window in windows if window is not None
         }
 
+    def reserve(self, now: Optional[float] = None, tokens: int = 0) -> float:
+        """
+        Reserve the next permit in the shared budget.
+
+        Args:
+            now: Ignored; the Redis server clock is used
+            tokens: Estimated tokens (prompt + max output) for the TPM window
+
+        Returns:
+            Seconds to wait before the request may start
+        """
+        windows = self._windows(tokens)
+        args = []
+        for window, cost in windows:
+            args.extend([window.emission_interval * 1000, window.period * 1000, cost])
+
+        wait_ms = float(self._reserve_script(
+            keys=[self._window_key(window) for window, _ in windows],
+            args=args
+        ))
+
+        with self.lock:
+            self.total_requests += 1
+            self.total_tokens_estimated += tokens
+        return max(0.0, wait_ms / 1000)
+
+    async def reserve_async(self, tokens: int = 0) -> float:
+        """
+        Reserve the next permit in the shared budget without blocking the event loop.
+
+        The script call runs in a worker thread.
+
+        Args:
+            tokens: Estimated tokens (prompt + max output) for the TPM window
+
+        Returns:
+            Seconds to wait before the request may start
+        """
+        return await asyncio.to_thread(self.reserve, tokens=tokens)
+
+    async def reconcile_async(self, estimated_tokens: int, actual_tokens: int):
+        """
+        Correct the shared TPM window without blocking the event loop.
+
+        Args:
+            estimated_tokens: Tokens charged at admission
+            actual_tokens: Tokens the provider reported
+        """
+        await asyncio.to_thread(self.reconcile, estimated_tokens, actual_tokens)
+
+    def reconcile(self, estimated_tokens: int, actual_tokens: int):
+        """
+        Correct the shared TPM window once actual usage is known.
+
+        Args:
+            estimated_tokens: Tokens charged at admission
+            actual_tokens: Tokens the provider reported
+        """
+        with self.lock:
+            self.total_tokens_actual += actual_tokens
+        if self.token_window:
+            delta_ms = (actual_tokens - estimated_tokens) * self.token_window.emission_interval * 1000
+            self._adjust_script(keys=[self._window_key(self.token_window)], args=[delta_ms])
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        Get current (shared) rate limiter statistics.
+
+        Returns:
+            Dictionary with current usage stats
+        """
+        windows = self._window_keys()
+        pipe = self.redis.pipeline(transaction=False)
+        pipe.time()
+        for key in windows:
+            pipe.get(key)
+        server_time, *tats = pipe.execute()
+        now_ms = server_time[0] * 1000 + server_time[1] / 1000
+
+        used = {}
+        for (key, window), tat in zip(windows.items(), tats):
+            outstanding = max(0.0, float(tat or 0) - now_ms) / 1000
+            used[key] = min(window.limit, int(-(-outstanding // window.emission_interval)))
+
+        rpm_count = used[f"ratelimit:{self.key}:rpm"]
+        rpd_count = used.get(f"ratelimit:{self.key}:rpd", 0)
+        tpm_count = used.get(f"ratelimit:{self.key}:tpm", 0)
+
+        stats = super().get_stats()
+        stats.update({
+            "backend": "redis",
+            "key": self.key,
+            "requests_last_minute": rpm_count,
+            "rpm_available": max(0, self.max_rpm - rpm_count),
+            "requests_last_day": rpd_count,
+            "rpd_available": max(0, (self.max_rpd or 0) - rpd_count),
+            "tokens_last_minute": tpm_count,
+            "tpm_available": max(0, (self.max_tpm or 0) - tpm_count)
+        })
+        return stats
+
 
 class MultiProviderRateLimiter:
     """
     Rate limiter that handles multiple API providers.
 
-    Each provider (OpenAI, Anthropic) has its own limits.
+    Each provider (OpenAI, Anthropic) has its own limits. Models can
+    additionally carry their own TPM budget, since providers enforce token
+    limits per model.
+
+    With a Redis client the budgets are shared by every process using the
+    same Redis instance, keyed per provider and per API key (hashed).
     """
 
-    def __init__(self):
-        """Initialize with default provider limits."""
-        self.limiters = {
-            "openai": RateLimiter(
-                max_requests_per_minute=30,
-                max_concurrent=5
-            ),
-            "anthropic": RateLimiter(
-                max_requests_per_minute=50,
-                max_concurrent=5
-            ),
-            "default": RateLimiter(
-                max_requests_per_minute=30,
-                max_concurrent=5
-            )
+    # provider → (requests per minute, max concurrent, tokens per minute)
+    DEFAULT_LIMITS = {
+        "openai": (30, 5, None),
+        "anthropic": (50, 5, None),
+        "default": (30, 5, None)
+    }
+
+    # model → (provider, tokens per minute)
+    DEFAULT_MODEL_LIMITS = {
+        "gpt-4o": ("openai", 30000),
+        "gpt-4o-mini": ("openai", 200000),
+        "anthropic/claude-sonnet-4-5": ("anthropic", 30000)
+    }
+
+    def __init__(
+        self,
+        redis_client: Optional[redis.Redis] = None,
+        api_keys: Optional[Dict[str, str]] = None,
+        tokens_per_minute: Optional[Dict[str, int]] = None,
+        model_tokens_per_minute: Optional[Dict[str, int]] = None
+    ):
+        """
+        Initialize with default provider limits.
+
+        Args:
+            redis_client: Optional Redis client for shared, cross-process budgets
+            api_keys: Optional provider → API key map; each key gets its own
+                shared budget (only a hash of the key is stored)
+            tokens_per_minute: Optional provider → TPM overrides
+            model_tokens_per_minute: Optional model → TPM overrides
+        """
+        self.redis = redis_client
+        self.key_ids = {
+            provider: hashlib.sha256(api_key.encode()).hexdigest()[:16]
+            for provider, api_key in (api_keys or {}).items() if api_key
         }
+        tokens_per_minute = tokens_per_minute or {}
+        model_tokens_per_minute = model_tokens_per_minute or {}
+
+        self.limiters = {}
+        for provider, (rpm, concurrent, tpm) in self.DEFAULT_LIMITS.items():
+            self.limiters[provider] = self._create_limiter(
+                f"{provider}:{self.key_ids.get(provider, 'shared')}",
+                max_requests_per_minute=rpm,
+                max_concurrent=concurrent,
+                max_tokens_per_minute=tokens_per_minute.get(provider, tpm)
+            )
+
+        self.model_limiters = {}
+        for model, (provider, tpm) in self.DEFAULT_MODEL_LIMITS.items():
+            self.set_model_limit(model, model_tokens_per_minute.get(model, tpm), provider)
+
+    def _create_limiter(self, key: str, **limits) -> RateLimiter:
+        """Create an in-process or Redis-backed limiter."""
+        if self.redis is None:
+            return RateLimiter(**limits)
+        return RedisRateLimiter(self.redis, key=key, **limits)
 
-    async def acquire(self, provider: str = "default"):
+    def set_model_limit(self, model: str, tokens_per_minute: int, provider: str = "default"):
+        """
+        Set (or replace) the TPM budget for a model.
+
+        Args:
+            model: Model name as passed to acquire()
+            tokens_per_minute: Max tokens per minute for this model
+            provider: Provider the model belongs to
+        """
+        provider_limiter = self.limiters.get(provider, self.limiters["default"])
+        self.model_limiters[model] = self._create_limiter(
+            f"{provider}:{self.key_ids.get(provider, 'shared')}:model:{model}",
+            max_requests_per_minute=provider_limiter.max_rpm,
+            max_concurrent=provider_limiter.max_concurrent,
+            max_tokens_per_minute=tokens_per_minute
+        )
+
+    async def acquire(self, provider: str = "default", tokens: int = 0, model: Optional[str] = None):
         """
         Acquire permission for a specific provider.
 
         Args:
             provider: API provider name ("openai", "anthropic", "default")
+            tokens: Estimated tokens (prompt + max output) for TPM admission
+            model: Optional model name with its own TPM budget
         """
         limiter = self.limiters.get(provider, self.limiters["default"])
-        await limiter.acquire()
+        await limiter.acquire(tokens)
+
+        model_limiter = self.model_limiters.get(model)
+        if model_limiter:
+            try:
+                await model_limiter.acquire(tokens)
+            except BaseException:
+                limiter.release()
+                raise
 
-    def release(self, provider: str = "default"):
+    def release(self, provider: str = "default", model: Optional[str] = None):
         """
         Release permission for a specific provider.
 
         Args:
             provider: API provider name
+            model: Model name passed to acquire()
         """
+        model_limiter = self.model_limiters.get(model)
+        if model_limiter:
+            model_limiter.release()
+
         limiter = self.limiters.get(provider, self.limiters["default"])
         limiter.release()
 
+    def reconcile(
+        self,
+        provider: str,
+        estimated_tokens: int,
+        actual_tokens: int,
+        model: Optional[str] = None
+    ):
+        """
+        Correct provider and model TPM budgets with actual usage.
+
+        Args:
+            provider: API provider name
+            estimated_tokens: Tokens charged at admission
+            actual_tokens: Tokens the provider reported
+            model: Model name passed to acquire()
+        """
+        limiter = self.limiters.get(provider, self.limiters["default"])
+        limiter.reconcile(estimated_tokens, actual_tokens)
+
+        model_limiter = self.model_limiters.get(model)
+        if model_limiter:
+            model_limiter.reconcile(estimated_tokens, actual_tokens)
+
+    async def reconcile_async(
+        self,
+        provider: str,
+        estimated_tokens: int,
+        actual_tokens: int,
+        model: Optional[str] = None
+    ):
+        """
+        Correct provider and model TPM budgets from a coroutine (see reconcile()).
+
+        Args:
+            provider: API provider name
+            estimated_tokens: Tokens charged at admission
+            actual_tokens: Tokens the provider reported
+            model: Model name passed to acquire()
+        """
+        limiter = self.limiters.get(provider, self.limiters["default"])
+        await limiter.reconcile_async(estimated_tokens, actual_tokens)
+
+        model_limiter = self.model_limiters.get(model)
+        if model_limiter:
+            await model_limiter.reconcile_async(estimated_tokens, actual_tokens)
+
     def get_all_stats(self) -> Dict[str, Dict]:
         """
         Get stats for all providers.
 
         Returns:
-            Dictionary mapping provider names to their stats
+            Dictionary mapping provider names (and "model:<name>") to their stats
         """
-        return {
+        stats = {
             provider: limiter.get_stats()
             for provider, limiter in self.limiters.items()
         }
+        stats.update({
+            f"model:{model}": limiter.get_stats()
+            for model, limiter in self.model_limiters.items()
+        })
+        return stats
 
 
 class RateLimitedTask:
@@ -199,33 +708,62 @@ class RateLimitedTask:
     Context manager for rate-limited task execution.
 
     Usage:
-        async with RateLimitedTask(rate_limiter, "openai"):
+        async with RateLimitedTask(rate_limiter, "openai", tokens=6000, model="gpt-4o") as slot:
             result = await expensive_api_call()
+            slot.report_usage(result.token_usage.total_tokens)
     """
 
-    def __init__(self, rate_limiter: RateLimiter, provider: str = "default"):
+    def __init__(
+        self,
+        rate_limiter: RateLimiter,
+        provider: str = "default",
+        tokens: int = 0,
+        model: Optional[str] = None
+    ):
         """
         Initialize rate-limited task.
 
         Args:
             rate_limiter: RateLimiter or MultiProviderRateLimiter instance
             provider: API provider name (for MultiProviderRateLimiter)
+            tokens: Estimated tokens (prompt + max output) for TPM admission
+            model: Optional model name (for MultiProviderRateLimiter)
         """
         self.rate_limiter = rate_limiter
         self.provider = provider
+        self.tokens = tokens
+        self.model = model
+        self.actual_tokens: Optional[int] = None
+
+    def report_usage(self, actual_tokens: Optional[int]):
+        """
+        Report actual token usage; reconciled on exit.
+
+        Args:
+            actual_tokens: Tokens the provider reported (None if unknown)
+        """
+        self.actual_tokens = actual_tokens
 
     async def __aenter__(self):
         """Acquire rate limit permission."""
         if isinstance(self.rate_limiter, MultiProviderRateLimiter):
-            await self.rate_limiter.acquire(self.provider)
+            await self.rate_limiter.acquire(self.provider, self.tokens, self.model)
         else:
-            await self.rate_limiter.acquire()
+            await self.rate_limiter.acquire(self.tokens)
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        """Release rate limit permission."""
-        if isinstance(self.rate_limiter, MultiProviderRateLimiter):
-            self.rate_limiter.release(self.provider)
-        else:
-            self.rate_limiter.release()
+        """Reconcile token usage and release rate limit permission."""
+        try:
+            if self.actual_tokens is not None:
+                if isinstance(self.rate_limiter, MultiProviderRateLimiter):
+                    await self.rate_limiter.reconcile_async(self.provider, self.tokens, self.actual_tokens, self.model)
+                else:
+                    await self.rate_limiter.reconcile_async(self.tokens, self.actual_tokens)
+        finally:
+            # The slot is released even if reconciling is cancelled or fails
+            if isinstance(self.rate_limiter, MultiProviderRateLimiter):
+                self.rate_limiter.release(self.provider, self.model)
+            else:
+                self.rate_limiter.release()
         return False
@@ -0,0 +1,308 @@
+"""
+Content-addressed cache for agent task results.
+Reruns of a book (or of a phase after an unrelated tweak) reuse identical
+outputs instead of paying for the same LLM calls again.
+"""
+
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+import redis
+from ..memory.codec import ValueCodec
+
+
+def make_cache_key(
+    task_type: str,
+    chapter_text: str,
+    contract_version: str,
+    prompt_template: str,
+    model: str,
+    memory_state: str
+) -> str:
+    """
+    Build a content address for a task result.
+
+    Any change in the inputs folded into the key yields a different key, so
+    there is nothing to invalidate. Results are only as fresh as
+    memory_state is complete: memory the agent reads but the fingerprint
+    leaves out can change without a miss.
+
+    Args:
+        task_type: Task type (e.g. "expand")
+        chapter_text: Text of the chapter being worked on
+        contract_version: Story contract version/fingerprint
+        prompt_template: Task prompt given to the agent
+        model: Model name
+        memory_state: Fingerprint of the other memory the agent's tools read
+            (e.g. neighbouring chapters, open flags, continuity facts)
+
+    Returns:
+        Hex SHA-256 digest
+    """
+    payload = json.dumps(
+        [task_type, chapter_text, contract_version, prompt_template, model, memory_state],
+        ensure_ascii=False
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class TaskResultCache:
+    """
+    Size-bounded, in-process LRU cache of JSON-serializable task results.
+
+    Entries are evicted least-recently-used first once either max_entries
+    or max_bytes (stored size, after compression) is exceeded.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1000,
+        max_bytes: int = 64 * 1024 * 1024,
+        codec: Optional[ValueCodec] = None
+    ):
+        """
+        Initialize result cache.
+
+        Args:
+            max_entries: Max cached results (default: 1000)
+            max_bytes: Max total stored size (default: 64MB)
+            codec: Codec for large results (default: compress values over 1KB)
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.codec = codec or ValueCodec()
+        self.lock = threading.Lock()
+
+        self._entries: "OrderedDict[str, Tuple[str, int]]" = OrderedDict()  # key → (stored value, size)
+        self._bytes = 0
+
+        # Metrics
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.evictions = 0
+
+    def _record(self, hit: bool):
+        """Count a lookup."""
+        with self.lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def _load(self, key: str) -> Optional[str]:
+        """Get a serialized entry and mark it most recently used."""
+        with self.lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+            return entry[0]
+
+    def _save(self, key: str, data: str) -> int:
+        """Store a serialized entry and evict; returns entries evicted."""
+        size = len(data.encode("utf-8"))
+        evicted = 0
+
+        with self.lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes -= old[1]
+
+            self._entries[key] = (data, size)
+            self._bytes += size
+
+            while self._entries and (
+                len(self._entries) > self.max_entries or self._bytes > self.max_bytes
+            ):
+                _, (_, old_size) = self._entries.popitem(last=False)
+                self._bytes -= old_size
+                evicted += 1
+
+        return evicted
+
+    def get(self, key: str) -> Tuple[bool, Any]:
+        """
+        Look up a cached result.
+
+        Args:
+            key: Cache key from make_cache_key()
+
+        Returns:
+            (hit, result) tuple; result is None on a miss
+        """
+        data = self._load(key)
+        self._record(data is not None)
+        if data is None:
+            return False, None
+        return True, self.codec.decode(data)
+
+    def put(self, key: str, result: Any) -> bool:
+        """
+        Cache a result.
+
+        Args:
+            key: Cache key from make_cache_key()
+            result: JSON-serializable result
+
+        Returns:
+            True if stored, False if the result can't be serialized
+        """
+        try:
+            data = self.codec.encode(result)
+        except (TypeError, ValueError):
+            return False
+
+        evicted = self._save(key, data)
+        with self.lock:
+            self.stores += 1
+            self.evictions += evicted
+        return True
+
+    def _usage(self) -> Tuple[int, int]:
+        """Current (entries, bytes)."""
+        with self.lock:
+            return len(self._entries), self._bytes
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dictionary with hit/miss counts and current size
+        """
+        entries, size = self._usage()
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+            "stores": self.stores,
+            "evictions": self.evictions,
+            "entries": entries,
+            "bytes": size,
+            "max_entries": self.max_entries,
+            "max_bytes": self.max_bytes
+        }
+
+
+# Store an entry, then evict least-recently-used entries over budget.
+# KEYS: lru zset, sizes hash, byte counter, clock counter
+# ARGV: entry key prefix, cache key, serialized result, max_entries, max_bytes
+# Returns: number of entries evicted
+CACHE_PUT_SCRIPT = """
+local prefix = ARGV[1]
+local key = ARGV[2]
+local size = string.len(ARGV[3])
+local old = tonumber(redis.call('HGET', KEYS[2], key) or '0')
+redis.call('SET', prefix .. key, ARGV[3])
+redis.call('HSET', KEYS[2], key, size)
+redis.call('INCRBY', KEYS[3], size - old)
+redis.call('ZADD', KEYS[1], redis.call('INCR', KEYS[4]), key)
+local evicted = 0
+while true do
+    local count = redis.call('ZCARD', KEYS[1])
+    local bytes = tonumber(redis.call('GET', KEYS[3]) or '0')
+    if count <= tonumber(ARGV[4]) and bytes <= tonumber(ARGV[5]) then
+        break
+    end
+    local oldest = redis.call('ZRANGE', KEYS[1], 0, 0)[1]
+    if not oldest then
+        break
+    end
+    local oldest_size = tonumber(redis.call('HGET', KEYS[2], oldest) or '0')
+    redis.call('DEL', prefix .. oldest)
+    redis.call('HDEL', KEYS[2], oldest)
+    redis.call('ZREM', KEYS[1], oldest)
+    redis.call('DECRBY', KEYS[3], oldest_size)
+    evicted = evicted + 1
+end
+return evicted
+"""
+
+# Fetch an entry and mark it most recently used.
+# KEYS: lru zset, clock counter; ARGV: entry key prefix, cache key
+CACHE_GET_SCRIPT = """
+local data = redis.call('GET', ARGV[1] .. ARGV[2])
+if data then
+    redis.call('ZADD', KEYS[1], redis.call('INCR', KEYS[2]), ARGV[2])
+end
+return data
+"""
+
+
+class RedisTaskResultCache(TaskResultCache):
+    """
+    LRU task result cache stored in Redis.
+
+    Shared by every process using the same namespace and survives restarts,
+    so rerunning a book in a new job hits results from the previous one.
+    Stores and evictions run as Lua scripts, so concurrent writers keep
+    the size bounds exact. Hit/miss counters are per process.
+    """
+
+    def __init__(
+        self,
+        redis_client: redis.Redis,
+        namespace: str = "default",
+        max_entries: int = 1000,
+        max_bytes: int = 256 * 1024 * 1024,
+        codec: Optional[ValueCodec] = None
+    ):
+        """
+        Initialize Redis-backed result cache.
+
+        Args:
+            redis_client: Redis client
+            namespace: Cache namespace (caches with the same namespace share entries)
+            max_entries: Max cached results (default: 1000)
+            max_bytes: Max total stored size (default: 256MB)
+            codec: Codec for large results (default: compress values over 1KB)
+        """
+        super().__init__(max_entries=max_entries, max_bytes=max_bytes, codec=codec)
+        self.redis = redis_client
+        self.namespace = namespace
+        self._put_script = self.redis.register_script(CACHE_PUT_SCRIPT)
+        self._get_script = self.redis.register_script(CACHE_GET_SCRIPT)
+
+    def _key(self, suffix: str) -> str:
+        """Redis key within this cache's namespace."""
+        return f"taskcache:{self.namespace}:{suffix}"
+
+    def _load(self, key: str) -> Optional[str]:
+        """Get a serialized entry and mark it most recently used."""
+        return self._get_script(
+            keys=[self._key("lru"), self._key("clock")],
+            args=[self._key("entry:"), key]
+        )
+
+    def _save(self, key: str, data: str) -> int:
+        """Store a serialized entry and evict; returns entries evicted."""
+        return int(self._put_script(
+            keys=[self._key("lru"), self._key("sizes"), self._key("bytes"), self._key("clock")],
+            args=[self._key("entry:"), key, data, self.max_entries, self.max_bytes]
+        ))
+
+    def _usage(self) -> Tuple[int, int]:
+        """Current (entries, bytes) across all processes."""
+        pipe = self.redis.pipeline(transaction=False)
+        pipe.zcard(self._key("lru"))
+        pipe.get(self._key("bytes"))
+        entries, size = pipe.execute()
+        return entries, int(size or 0)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dictionary with hit/miss counts and current (shared) size
+        """
+        stats = super().get_stats()
+        stats.update({
+            "backend": "redis",
+            "namespace": self.namespace
+        })
+        return stats
@@ -0,0 +1,222 @@
+"""
+Retry policies for transient provider errors.
+Backs off exponentially with jitter, honors Retry-After hints and stops
+at a global retry budget so a provider outage can't retry forever.
+"""
+
+import asyncio
+import random
+import threading
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, Optional
+
+
+# 408 timeout, 409 conflict, 425 too early, 429 rate limited, 5xx server
+# errors and 529 (Anthropic overloaded) are worth retrying; anything else
+# (bad request, auth, not found, validation) fails the same way every time
+RETRYABLE_STATUS_CODES = {408, 409, 425, 429, 500, 502, 503, 504, 529}
+
+# Exception class names used by provider SDKs/litellm for transient errors
+RETRYABLE_ERROR_NAMES = (
+    "RateLimitError",
+    "Timeout",
+    "APIConnectionError",
+    "ServiceUnavailableError",
+    "InternalServerError",
+    "OverloadedError"
+)
+
+
+def get_status_code(error: BaseException) -> Optional[int]:
+    """
+    Extract an HTTP status code from a provider exception, if present.
+
+    Args:
+        error: Exception raised by a task
+
+    Returns:
+        Status code or None
+    """
+    for source in (error, getattr(error, "response", None)):
+        for attr in ("status_code", "status", "http_status"):
+            code = getattr(source, attr, None)
+            if isinstance(code, int):
+                return code
+    return None
+
+
+def get_retry_after(error: BaseException) -> Optional[float]:
+    """
+    Extract a provider Retry-After hint in seconds, if present.
+
+    Understands a retry_after attribute and the retry-after-ms /
+    retry-after response headers (seconds or HTTP date).
+
+    Args:
+        error: Exception raised by a task
+
+    Returns:
+        Seconds to wait or None
+    """
+    retry_after = getattr(error, "retry_after", None)
+    if isinstance(retry_after, (int, float)):
+        return max(0.0, float(retry_after))
+
+    headers = getattr(getattr(error, "response", None), "headers", None) or {}
+    headers = {str(name).lower(): value for name, value in headers.items()}
+    value = headers.get("retry-after-ms")
+    if value is not None:
+        try:
+            return max(0.0, float(value) / 1000)
+        except ValueError:
+            pass
+
+    value = headers.get("retry-after")
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+def is_retryable(error: BaseException) -> bool:
+    """
+    Decide whether an error is transient (429, timeouts, 5xx) or fatal.
+
+    Args:
+        error: Exception raised by a task
+
+    Returns:
+        True if retrying may succeed
+    """
+    code = get_status_code(error)
+    if code is not None:
+        return code in RETRYABLE_STATUS_CODES
+
+    if isinstance(error, (asyncio.TimeoutError, TimeoutError, ConnectionError)):
+        return True
+
+    return any(name in type(error).__name__ for name in RETRYABLE_ERROR_NAMES)
+
+
+class RetryPolicy:
+    """
+    Exponential backoff with full jitter.
+
+    Attempt n (1-based) that fails with a retryable error waits a random
+    time in [0, min(max_delay, base_delay * 2^(n-1))] before the next
+    attempt. A Retry-After hint from the provider takes precedence.
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 4,
+        base_delay: float = 2.0,
+        max_delay: float = 60.0,
+        jitter: bool = True
+    ):
+        """
+        Initialize retry policy.
+
+        Args:
+            max_attempts: Total attempts including the first (default: 4)
+            base_delay: Backoff for the first retry in seconds (default: 2)
+            max_delay: Cap on exponential backoff in seconds (default: 60)
+            jitter: Randomize delays so workers don't retry in lockstep
+        """
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.jitter = jitter
+
+    def get_delay(self, attempt: int, error: Optional[BaseException] = None) -> float:
+        """
+        Get the wait before retrying after a failed attempt.
+
+        Args:
+            attempt: Number of the attempt that failed (1-based)
+            error: The error, checked for a Retry-After hint
+
+        Returns:
+            Seconds to wait
+        """
+        retry_after = get_retry_after(error) if error is not None else None
+        if retry_after is not None:
+            # Honor the hint; a little jitter keeps waiters from stampeding
+            return retry_after + (random.uniform(0, self.base_delay) if self.jitter else 0)
+
+        backoff = min(self.max_delay, self.base_delay * (2 ** (attempt - 1)))
+        return random.uniform(0, backoff) if self.jitter else backoff
+
+    def should_retry(self, attempt: int, error: BaseException) -> bool:
+        """
+        Check whether a failed attempt may be retried under this policy.
+
+        Args:
+            attempt: Number of the attempt that failed (1-based)
+            error: The error
+
+        Returns:
+            True if attempts remain and the error is retryable
+        """
+        return attempt < self.max_attempts and is_retryable(error)
+
+
+class RetryBudget:
+    """
+    Global cap on retries shared by all tasks of an executor.
+
+    Stops a systemic failure (outage, exhausted quota) from multiplying
+    every task's cost by max_attempts.
+    """
+
+    def __init__(self, max_retries: Optional[int] = 100):
+        """
+        Initialize retry budget.
+
+        Args:
+            max_retries: Total retries allowed (None for unlimited)
+        """
+        self.max_retries = max_retries
+        self.lock = threading.Lock()
+        self.used = 0
+        self.denied = 0
+
+    def try_acquire(self) -> bool:
+        """
+        Take one retry from the budget.
+
+        Returns:
+            True if a retry is allowed
+        """
+        with self.lock:
+            if self.max_retries is not None and self.used >= self.max_retries:
+                self.denied += 1
+                return False
+            self.used += 1
+            return True
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get retry budget statistics.
+
+        Returns:
+            Dictionary with used, remaining and denied retries
+        """
+        with self.lock:
+            return {
+                "max_retries": self.max_retries,
+                "used": self.used,
+                "remaining": (
+                    self.max_retries - self.used
+                    if self.max_retries is not None else None
+                ),
+                "denied": self.denied
+            }
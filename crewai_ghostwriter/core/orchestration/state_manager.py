@@ -3,11 +3,31 @@ Workflow state manager with dependency tracking.
 Manages task states, dependencies, and ensures proper execution order.
 """
 
-import json
-from typing import Dict, List, Any, Optional, Set
+import hashlib
+import secrets
+import sys
+import threading
+import time
+from typing import Dict, List, Any, Callable, Optional, Set
 from datetime import datetime
 from enum import Enum
 import redis
+from ..memory.codec import ValueCodec, json_dumps, json_loads
+from ..memory.flag_dedupe import SEVERITY_RANK
+from ..memory.local_store import get_storage_client
+from ..memory.redis_pool import unlink_keys, expire_keys
+
+
+# A worker that dies mid-task never finishes it, so an IN_PROGRESS task is
+# treated as abandoned once its lease runs out (long chapter kickoffs fit).
+DEFAULT_LEASE_SECONDS = 1800
+
+# Task transitions are appended to a per-book event stream; every
+# COMPACT_EVERY events they're folded into per-task snapshots, and the
+# newest EVENT_RETENTION events are kept as a replayable timeline.
+COMPACT_EVERY = 200
+EVENT_RETENTION = 1000
+COMPACTION_LOCK_SECONDS = 60
 
 
 class TaskStatus(Enum):
@@ -29,8 +49,35 @@ class TaskType(Enum):
     VALIDATE = "validate"  # QA validation
 
 
+def _flag_priority(flag: Dict) -> int:
+    """Sort key ordering flags by severity, so fix tasks address the worst first."""
+    return SEVERITY_RANK.get(flag["issue"].get("severity"), len(SEVERITY_RANK))
+
+
+def _to_timestamp(value: Optional[Any]) -> Optional[float]:
+    """Epoch seconds from a stored timestamp (older records hold ISO strings)."""
+    if value is None or isinstance(value, (int, float)):
+        return value
+    return datetime.fromisoformat(value).timestamp()
+
+
 class ChapterTask:
-    """Represents a task to be performed on a chapter."""
+    """
+    Represents a task to be performed on a chapter.
+
+    Slotted, with epoch-second timestamps and an interned ID, since a
+    workflow holds several tasks per chapter and serializes one on every
+    transition.
+
+    The result lives in a separate content-addressed blob referenced by
+    result_ref; tasks loaded from Redis fetch it on first access, so
+    status and dependency queries never load chapter-sized payloads.
+    """
+
+    __slots__ = (
+        "_id", "chapter_number", "task_type", "status", "dependencies", "flags", "metadata",
+        "created_at", "started_at", "completed_at", "result_ref", "_result", "_result_loader"
+    )
 
     def __init__(
         self,
@@ -45,33 +92,47 @@ class ChapterTask:
         Initialize a chapter task.
 
         Args:
-            chapter_number: Chapter number (1-15)
+            chapter_number: Chapter number
             task_type: Type of task
             status: Current status
             dependencies: List of task IDs this task depends on
             flags: Cross-chapter flags to address
             metadata: Additional task metadata
         """
+        self._id = sys.intern(f"{task_type.value}_{chapter_number}")
         self.chapter_number = chapter_number
         self.task_type = task_type
         self.status = status
-        self.dependencies = dependencies or []
+        self.dependencies = [sys.intern(dep_id) for dep_id in dependencies or []]
         self.flags = flags or []
         self.metadata = metadata or {}
-        self.created_at = datetime.now().isoformat()
-        self.started_at = None
-        self.completed_at = None
-        self.result = None
+        self.created_at: Optional[float] = time.time()
+        self.started_at: Optional[float] = None
+        self.completed_at: Optional[float] = None
+        self.result_ref = None  # Content hash of the result blob
+        self._result = None
+        self._result_loader: Optional[Callable[[str], Any]] = None
 
     @property
     def id(self) -> str:
-        """Generate task ID."""
-        return f"{self.task_type.value}_{self.chapter_number}"
+        """Task ID ("<task_type>_<chapter_number>")."""
+        return self._id
+
+    @property
+    def result(self) -> Optional[Any]:
+        """Task result (fetched from its blob on first access)."""
+        if self._result is None and self.result_ref and self._result_loader:
+            self._result = self._result_loader(self.result_ref)
+        return self._result
+
+    @result.setter
+    def result(self, value: Optional[Any]):
+        self._result = value
 
     def to_dict(self) -> Dict:
         """Convert to dictionary for serialization."""
         return {
-            "id": self.id,
+            "id": self._id,
             "chapter_number": self.chapter_number,
             "task_type": self.task_type.value,
             "status": self.status.value,
@@ -81,7 +142,7 @@ class ChapterTask:
             "created_at": self.created_at,
             "started_at": self.started_at,
             "completed_at": self.completed_at,
-            "result": self.result
+            "result_ref": self.result_ref
         }
 
     @classmethod
@@ -95,10 +156,11 @@ class ChapterTask:
             flags=data.get("flags", []),
             metadata=data.get("metadata", {})
         )
-        task.created_at = data.get("created_at")
-        task.started_at = data.get("started_at")
-        task.completed_at = data.get("completed_at")
-        task.result = data.get("result")
+        task.created_at = _to_timestamp(data.get("created_at"))
+        task.started_at = _to_timestamp(data.get("started_at"))
+        task.completed_at = _to_timestamp(data.get("completed_at"))
+        task.result_ref = data.get("result_ref")
+        task.result = data.get("result")  # Records written before result blobs
         return task
 
 
@@ -109,12 +171,37 @@ class WorkflowStateManager:
     Key Features:
     - Tracks all tasks and their states
     - Manages dependencies between tasks
-    - Automatically creates fix tasks from cross-chapter flags
+    - Automatically creates fix tasks from cross-chapter flags (one per chapter)
     - Returns only ready tasks (dependencies satisfied)
     - Detects circular dependencies
+    - Checkpoints tasks and phases so interrupted runs can resume
+
+    Dependency bookkeeping is incremental: a dependents index and a
+    per-task count of unmet dependencies are updated on every add and
+    status transition, so ready lookups cost O(1) per transition and
+    wave layering is O(V+E).
+
+    Task transitions are appended to a per-book Redis Stream as small
+    events rather than rewriting whole task records; results are written
+    once under their own key. Loading replays the events logged since the
+    last compaction on top of the per-task snapshots.
+
+    Safe to share between worker threads: mutations hold a lock, and the
+    completed task count is a server-side counter, so workers in other
+    processes don't overwrite each other's progress.
     """
 
-    def __init__(self, book_id: str, redis_host: str = "localhost", redis_port: int = 6379):
+    def __init__(
+        self,
+        book_id: str,
+        redis_host: str = "localhost",
+        redis_port: int = 6379,
+        redis_client: Optional[redis.Redis] = None,
+        codec: Optional[ValueCodec] = None,
+        load: bool = True,
+        compact_every: int = COMPACT_EVERY,
+        event_retention: int = EVENT_RETENTION
+    ):
         """
         Initialize workflow state manager.
 
@@ -122,40 +209,372 @@ class WorkflowStateManager:
             book_id: Unique identifier for this book
             redis_host: Redis server host
             redis_port: Redis server port
+            redis_client: Redis client or LocalStore to use (default: shared client for STORAGE_BACKEND)
+            codec: Codec for task records (default: compress values over 1KB)
+            load: Load existing state from Redis (default: True)
+            compact_every: Events between compactions (0 disables automatic compaction)
+            event_retention: Events kept in the stream after compaction
         """
         self.book_id = book_id
-        self.redis = redis.Redis(
-            host=redis_host,
-            port=redis_port,
-            decode_responses=True
-        )
+        self.redis = redis_client or get_storage_client(redis_host, redis_port)
+        self.codec = codec or ValueCodec()
+        self.lock = threading.RLock()
+        self.compact_every = compact_every
+        self.event_retention = event_retention
+        self._events_logged = 0  # Events this instance logged since it last compacted
+        self._result_loader: Optional[Callable[[str], Any]] = self._load_result
 
         self.tasks: Dict[str, ChapterTask] = {}
         self.flags: List[Dict] = []
         self.completed_tasks_count = 0
-        self.tasks_by_wave: Dict[int, List[str]] = {}
+        self.tasks_by_wave: Dict[int, List[str]] = {}  # Cached layering, reset on add_task
+        self.completed_phases: Dict[str, Dict] = {}  # phase → {"completed_at", "result"}
+
+        # Dependency index
+        self._dependents: Dict[str, Set[str]] = {}  # task_id → IDs of tasks depending on it
+        self._unmet_deps: Dict[str, int] = {}  # task_id → dependencies not yet COMPLETE
+        self._ready: Dict[str, None] = {}  # Ordered set: unmet == 0 and PENDING/BLOCKED
 
         # Load existing state from Redis
-        self._load_from_redis()
+        if load:
+            self._load_from_redis()
 
     def _load_from_redis(self):
-        """Load existing workflow state from Redis."""
-        # Load tasks
-        tasks_key = f"workflow:{self.book_id}:tasks"
-        task_ids = self.redis.smembers(tasks_key)
+        """Load existing workflow state from Redis in two round trips."""
+        pipe = self.redis.pipeline(transaction=False)
+        self._queue_load(pipe)
+        task_ids, count, phases, compacted_through, events = pipe.execute()
+
+        task_ids = sorted(task_ids)
+        snapshots = self.redis.mget(self._task_keys(task_ids)) if task_ids else []
+        pending = self._restore(task_ids, snapshots, count, phases, compacted_through, events)
+
+        if self.compact_every and pending >= self.compact_every:
+            self.compact()
+
+    def _queue_load(self, pipe):
+        """Queue the reads for loading: task IDs, count, phases and the event log."""
+        pipe.smembers(self._key("tasks"))
+        pipe.get(self._key("completed_count"))
+        pipe.hgetall(self._key("phases"))
+        pipe.get(self._key("events:compacted_through"))
+        pipe.xrange(self._key("events"))
+
+    def _key(self, suffix: str) -> str:
+        """Redis key for this workflow."""
+        return f"workflow:{self.book_id}:{suffix}"
+
+    def _task_keys(self, task_ids) -> List[str]:
+        """Redis keys of task snapshots, in the given order."""
+        return [self._key(f"task:{task_id}") for task_id in task_ids]
+
+    def _blob_key(self, result_ref: str) -> str:
+        """Redis key of a result blob."""
+        return self._key(f"blob:{result_ref}")
+
+    def _queue_result(self, pipe, result: Any) -> str:
+        """
+        Queue a write of a result blob, keyed by its content hash.
+
+        Identical results (e.g. an unchanged chapter) share one blob, and
+        an existing blob isn't rewritten.
+
+        Returns:
+            Reference to store in the task record
+        """
+        result_ref = hashlib.sha256(json_dumps(result, sort_keys=True).encode("utf-8")).hexdigest()
+        blob_key = self._blob_key(result_ref)
+        pipe.set(blob_key, self.codec.encode(result, blob_key), nx=True)
+        return result_ref
+
+    def _load_result(self, result_ref: str) -> Optional[Any]:
+        """Fetch and decode a result blob."""
+        blob_key = self._blob_key(result_ref)
+        data = self.redis.get(blob_key)
+        return self.codec.decode(data, blob_key) if data else None
+
+    @staticmethod
+    def _event_id(event_id: str) -> tuple:
+        """Sortable (milliseconds, sequence) form of a stream entry ID."""
+        ms, _, seq = event_id.partition("-")
+        return int(ms), int(seq or 0)
 
-        for task_id in task_ids:
-            task_data_key = f"workflow:{self.book_id}:task:{task_id}"
-            task_data = self.redis.get(task_data_key)
-            if task_data:
-                task = ChapterTask.from_dict(json.loads(task_data))
-                self.tasks[task_id] = task
+    @classmethod
+    def _pending_events(cls, events: List, compacted_through: Optional[str]) -> List:
+        """Events logged after the last compaction, oldest first."""
+        if not compacted_through:
+            return list(events)
+        last = cls._event_id(compacted_through)
+        return [event for event in events if cls._event_id(event[0]) > last]
+
+    @staticmethod
+    def _apply_event(views: Dict[str, Dict], fields: Dict[str, str]):
+        """Fold one logged event into the task views it touches."""
+        task_id = fields["task"]
+        data = json_loads(fields["data"])
+        if fields["op"] == "put":
+            views[task_id] = data
+        elif task_id in views:
+            views[task_id].update(data)
+
+    def _restore(
+        self,
+        task_ids: List[str],
+        snapshots: List[Optional[str]],
+        count: Optional[str],
+        phases: Dict[str, str],
+        compacted_through: Optional[str] = None,
+        events: Optional[List] = None
+    ) -> int:
+        """
+        Rebuild in-memory state from raw Redis values.
+
+        Task views start from the compacted snapshots and replay the events
+        logged since. Result blobs aren't read; tasks fetch them on demand.
+
+        Returns:
+            Number of events replayed on top of the snapshots
+        """
+        views = {}
+        for task_id, task_key, data in zip(task_ids, self._task_keys(task_ids), snapshots):
+            if data:
+                views[task_id] = self.codec.decode(data, task_key)
+
+        pending = self._pending_events(events or [], compacted_through)
+        for _, fields in pending:
+            self._apply_event(views, fields)
+
+        # Load tasks
+        for task_id in sorted(views):
+            task = ChapterTask.from_dict(views[task_id])
+            task._result_loader = self._result_loader
+            self._index_task(task)
 
         # Load completed count
-        count_key = f"workflow:{self.book_id}:completed_count"
-        count = self.redis.get(count_key)
         self.completed_tasks_count = int(count) if count else 0
 
+        # Load phase checkpoints
+        for phase, checkpoint in phases.items():
+            self.completed_phases[phase] = json_loads(checkpoint)
+
+        return len(pending)
+
+    @staticmethod
+    def _transition(task: ChapterTask) -> Dict:
+        """Fields a status transition can change."""
+        return {
+            "status": task.status.value,
+            "started_at": task.started_at,
+            "completed_at": task.completed_at,
+            "metadata": task.metadata,
+            "result_ref": task.result_ref
+        }
+
+    def _log_event(self, task_id: str, op: str, completed_delta: int = 0, result: Any = None):
+        """
+        Append a task event to the book's event stream.
+
+        A "put" event carries a whole task record, an "update" only the
+        fields a transition changed. Results go to a blob referenced by
+        result_ref, so writes stay small no matter how large results get.
+
+        Args:
+            task_id: Task ID
+            op: "put" or "update"
+            completed_delta: Change in the completed task count (+1 when the
+                task became COMPLETE, -1 when it left COMPLETE)
+            result: New task result to store as a blob
+        """
+        task = self.tasks[task_id]
+        pipe = self.redis.pipeline()
+        if result is not None:
+            task.result_ref = self._queue_result(pipe, result)
+        data = task.to_dict() if op == "put" else self._transition(task)
+        pipe.xadd(self._key("events"), {"task": task_id, "op": op, "data": json_dumps(data)})
+        if completed_delta:
+            pipe.incrby(self._key("completed_count"), completed_delta)
+        results = pipe.execute()
+
+        if completed_delta:
+            # Server-side count includes other workers' completions
+            # (write-behind buffers return no results; keep the local count)
+            self.completed_tasks_count = int(results[-1]) if results else self.completed_tasks_count + completed_delta
+
+        self._events_logged += 1
+        if self.compact_every and self._events_logged >= self.compact_every:
+            self.compact()
+
+    def _save_task(self, task_id: str, completed_delta: int = 0, result: Any = None):
+        """Log a status transition of a task."""
+        self._log_event(task_id, "update", completed_delta, result)
+
+    def compact(self) -> int:
+        """
+        Fold logged events into the per-task snapshots and trim the log.
+
+        The newest event_retention events are kept for get_timeline().
+        Only one worker compacts a book at a time; others return 0.
+
+        Returns:
+            Number of events folded
+        """
+        lock_key = self._key("events:compacting")
+        token = secrets.token_hex(16)
+        if not self.redis.set(lock_key, token, nx=True, ex=COMPACTION_LOCK_SECONDS):
+            return 0
+
+        try:
+            pipe = self.redis.pipeline(transaction=False)
+            pipe.get(self._key("events:compacted_through"))
+            pipe.xrange(self._key("events"))
+            compacted_through, events = pipe.execute()
+
+            pending = self._pending_events(events, compacted_through)
+            if not pending:
+                return 0
+
+            task_ids = sorted({fields["task"] for _, fields in pending})
+            snapshots = self.redis.mget(self._task_keys(task_ids))
+
+            pipe = self.redis.pipeline()
+            self._queue_compaction(pipe, task_ids, snapshots, pending)
+            pipe.execute()
+
+            self._events_logged = 0
+            return len(pending)
+        finally:
+            # Compare-and-delete, so a successor's lock (ours expired) is kept
+            def release(pipe):
+                held = pipe.get(lock_key) == token
+                pipe.multi()
+                if held:
+                    pipe.delete(lock_key)
+
+            self.redis.transaction(release, lock_key)
+
+    def _queue_compaction(self, pipe, task_ids: List[str], snapshots: List[Optional[str]], pending: List):
+        """Queue the snapshot rewrites, compaction marker and log trim."""
+        views = {}
+        for task_id, task_key, data in zip(task_ids, self._task_keys(task_ids), snapshots):
+            if data:
+                views[task_id] = self.codec.decode(data, task_key)
+
+        for _, fields in pending:
+            self._apply_event(views, fields)
+
+        for task_id, view in views.items():
+            task_key = self._key(f"task:{task_id}")
+            pipe.set(task_key, self.codec.encode(view, task_key))
+
+        pipe.set(self._key("events:compacted_through"), pending[-1][0])
+        pipe.xtrim(self._key("events"), maxlen=self.event_retention, approximate=True)
+
+    def get_timeline(self, task_id: Optional[str] = None) -> List[Dict]:
+        """
+        Replay the retained task events, e.g. for a post-mortem.
+
+        Args:
+            task_id: Only return events for this task (default: all tasks)
+
+        Returns:
+            Events oldest first, each with event_id, at, task, op and the
+            recorded fields
+        """
+        return self._timeline(self.redis.xrange(self._key("events")), task_id)
+
+    @staticmethod
+    def _timeline(events: List, task_id: Optional[str] = None) -> List[Dict]:
+        """Turn raw stream entries into timeline records."""
+        timeline = []
+        for event_id, fields in events:
+            if task_id is not None and fields["task"] != task_id:
+                continue
+            ms = int(event_id.partition("-")[0])
+            timeline.append({
+                "event_id": event_id,
+                "at": datetime.fromtimestamp(ms / 1000).isoformat(),
+                "task": fields["task"],
+                "op": fields["op"],
+                **json_loads(fields["data"])
+            })
+        return timeline
+
+    def _is_complete(self, task_id: str) -> bool:
+        """Check whether a task exists and is COMPLETE."""
+        task = self.tasks.get(task_id)
+        return task is not None and task.status == TaskStatus.COMPLETE
+
+    def _refresh_ready(self, task_id: str):
+        """Add/remove a task from the ready set based on its counters and status."""
+        task = self.tasks.get(task_id)
+        if (
+            task is not None
+            and self._unmet_deps.get(task_id) == 0
+            and task.status in (TaskStatus.PENDING, TaskStatus.BLOCKED)
+        ):
+            self._ready[task_id] = None
+        else:
+            self._ready.pop(task_id, None)
+
+    def _adjust_dependents(self, task_id: str, delta: int):
+        """Apply delta to the unmet-dependency count of every dependent of task_id."""
+        for dependent_id in self._dependents.get(task_id, ()):
+            self._unmet_deps[dependent_id] += delta
+            self._refresh_ready(dependent_id)
+
+    def _set_status(self, task_id: str, status: TaskStatus) -> int:
+        """
+        Change a task's status, keeping dependency counters in sync.
+
+        Returns:
+            Change in the completed task count (-1, 0 or +1)
+        """
+        task = self.tasks[task_id]
+        was_complete = task.status == TaskStatus.COMPLETE
+        task.status = status
+        is_complete = status == TaskStatus.COMPLETE
+
+        if is_complete and not was_complete:
+            self._adjust_dependents(task_id, -1)
+        elif was_complete and not is_complete:
+            self._adjust_dependents(task_id, +1)
+
+        self._refresh_ready(task_id)
+        return int(is_complete) - int(was_complete)
+
+    def _index_task(self, task: ChapterTask):
+        """
+        Insert (or replace) a task in memory and in the dependency index.
+
+        Cost is O(deg(task) + dependents(task)).
+        """
+        old = self.tasks.get(task.id)
+        was_complete = old is not None and old.status == TaskStatus.COMPLETE
+
+        # Drop the old task's outgoing edges
+        if old is not None:
+            for dep_id in old.dependencies:
+                self._dependents.get(dep_id, set()).discard(task.id)
+
+        self.tasks[task.id] = task
+        self.tasks_by_wave.clear()
+
+        # Register new outgoing edges
+        for dep_id in task.dependencies:
+            self._dependents.setdefault(dep_id, set()).add(task.id)
+        self._unmet_deps[task.id] = sum(
+            1 for dep_id in set(task.dependencies) if not self._is_complete(dep_id)
+        )
+
+        # Tasks waiting on this ID see it (re)appear
+        is_complete = task.status == TaskStatus.COMPLETE
+        if is_complete and not was_complete:
+            self._adjust_dependents(task.id, -1)
+        elif was_complete and not is_complete:
+            self._adjust_dependents(task.id, +1)
+
+        self._refresh_ready(task.id)
+
     def add_task(self, task: ChapterTask):
         """
         Add a task to the workflow.
@@ -163,25 +582,36 @@ class WorkflowStateManager:
         Args:
             task: ChapterTask to add
         """
-        self.tasks[task.id] = task
-
-        # Save to Redis
-        tasks_key = f"workflow:{self.book_id}:tasks"
-        self.redis.sadd(tasks_key, task.id)
+        with self.lock:
+            # Replacing a task can change the completed count
+            completed_delta = int(task.status == TaskStatus.COMPLETE) - int(self._is_complete(task.id))
+            self._index_task(task)
 
-        task_data_key = f"workflow:{self.book_id}:task:{task.id}"
-        self.redis.set(task_data_key, json.dumps(task.to_dict()))
+            # Save to Redis
+            tasks_key = f"workflow:{self.book_id}:tasks"
+            self.redis.sadd(tasks_key, task.id)
+            self._log_event(task.id, "put", completed_delta, result=task.result)
 
-    def add_flag(self, discovered_in: int, affects_chapter: int, issue: Dict):
+    def add_flag(self, discovered_in: int, affects_chapter: int, issue: Dict) -> str:
         """
         Add a cross-chapter flag and automatically create a fix task.
 
         This is the key integration with ManuscriptMemory.flag_cross_chapter_issue().
 
+        Flags on the same chapter are coalesced into its one fix task, which
+        carries every flag (most severe first) and waits for the analysis of
+        every discovering chapter. A pending or failed fix task is extended
+        and a completed one is replaced by a new pass for the new flag. A
+        running pass has already read its flags, so the flag is held back
+        and gets a pass of its own once the running one completes.
+
         Args:
             discovered_in: Chapter where issue was discovered
             affects_chapter: Chapter that needs fixing
             issue: Issue details
+
+        Returns:
+            ID of the fix task carrying the flag
         """
         flag = {
             "discovered_in": discovered_in,
@@ -189,47 +619,113 @@ class WorkflowStateManager:
             "issue": issue,
             "created_at": datetime.now().isoformat()
         }
-        self.flags.append(flag)
+        fix_id = f"{TaskType.FIX.value}_{affects_chapter}"
+
+        with self.lock:
+            self.flags.append(flag)
+
+            existing = self.tasks.get(fix_id)
+            if existing is not None and existing.status == TaskStatus.IN_PROGRESS:
+                existing.metadata["rerun_flags"] = existing.metadata.get("rerun_flags", []) + [flag]
+                self._save_task(fix_id)
+                return fix_id
+
+            flags = [flag]
+            dependencies = []
+            if existing is not None and existing.status != TaskStatus.COMPLETE:
+                flags = existing.flags + flags
+                dependencies = existing.dependencies
 
-        # Create fix task with dependency
-        # Fix task must wait for the discovering chapter's analysis to complete
-        fix_task = ChapterTask(
-            chapter_number=affects_chapter,
+            fix_task = self._build_fix_task(affects_chapter, flags, dependencies)
+            if existing is not None and existing.status != TaskStatus.COMPLETE:
+                fix_task.created_at = existing.created_at
+
+            self.add_task(fix_task)
+
+        return fix_id
+
+    @staticmethod
+    def _build_fix_task(
+        chapter_number: int,
+        flags: List[Dict],
+        dependencies: Optional[List[str]] = None
+    ) -> ChapterTask:
+        """
+        Build a blocked fix task for a chapter's flags.
+
+        Args:
+            chapter_number: Chapter that needs fixing
+            flags: Flags the pass resolves
+            dependencies: Dependencies to keep (e.g. from a task being extended)
+
+        Returns:
+            ChapterTask waiting on the analysis of every discovering chapter
+        """
+        dependencies = list(dependencies or [])
+        for flag in flags:
+            # Fix task must wait for the discovering chapter's analysis to complete
+            dep_id = f"analyze_{flag['discovered_in']}"  # Wait for Ch 15 analysis
+            if dep_id not in dependencies:
+                dependencies.append(dep_id)
+
+        flags = sorted(flags, key=_flag_priority)  # Stable: equal severities keep arrival order
+        return ChapterTask(
+            chapter_number=chapter_number,
             task_type=TaskType.FIX,
             status=TaskStatus.BLOCKED,
-            dependencies=[f"analyze_{discovered_in}"],  # Wait for Ch 15 analysis
-            flags=[flag],
+            dependencies=dependencies,
+            flags=flags,
             metadata={
-                "triggered_by": discovered_in,
-                "issue_type": issue.get("type", "unknown")
+                "triggered_by": sorted({f["discovered_in"] for f in flags}),
+                "issue_type": flags[0]["issue"].get("type", "unknown"),
+                "severity": flags[0]["issue"].get("severity", "unknown")
             }
         )
 
-        self.add_task(fix_task)
-
     def get_ready_tasks(self) -> List[ChapterTask]:
         """
         Get all tasks whose dependencies are satisfied and ready to execute.
 
+        Each returned task is moved to READY, so a task is returned once.
+
         Returns:
             List of ChapterTask objects ready to run
         """
-        ready = []
+        with self.lock:
+            ready = [self.tasks[task_id] for task_id in self._ready]
+            self._ready.clear()
 
-        for task in self.tasks.values():
-            if task.status == TaskStatus.PENDING or task.status == TaskStatus.BLOCKED:
-                # Check if all dependencies are complete
-                deps_complete = all(
-                    self.tasks.get(dep_id, ChapterTask(0, TaskType.ANALYZE)).status == TaskStatus.COMPLETE
-                    for dep_id in task.dependencies
-                )
-
-                if deps_complete:
-                    task.status = TaskStatus.READY
-                    ready.append(task)
+            for task in ready:
+                task.status = TaskStatus.READY
 
         return ready
 
+    def get_dependents(self, task_id: str) -> List[str]:
+        """
+        Get IDs of tasks that directly depend on a task.
+
+        Args:
+            task_id: Task ID
+
+        Returns:
+            List of dependent task IDs
+        """
+        return list(self._dependents.get(task_id, ()))
+
+    def get_unmet_dependency_count(self, task_id: str) -> int:
+        """
+        Get the number of a task's dependencies that are not yet COMPLETE.
+
+        Missing dependencies count as unmet.
+
+        Args:
+            task_id: Task ID
+
+        Returns:
+            Unmet dependency count (0 means the task can run)
+        """
+        return self._unmet_deps.get(task_id, 0)
+
     def get_tasks_by_wave(self) -> Dict[int, List[ChapterTask]]:
         """
         Organize tasks into execution waves based on dependencies.
@@ -239,80 +735,173 @@ class WorkflowStateManager:
         Wave 3: Tasks depending on Wave 1 or 2
         etc.
 
+        Uses Kahn's algorithm (O(V+E)); the layering is cached until the
+        next add_task. Tasks on a cycle or depending on a missing task
+        are left out.
+
         Returns:
             Dictionary mapping wave number to list of tasks
         """
-        waves = {}
-        wave_num = 1
-        assigned_tasks = set()
-
-        while len(assigned_tasks) < len(self.tasks):
-            wave_tasks = []
+        with self.lock:
+            return self._layer_waves()
+
+    def _layer_waves(self) -> Dict[int, List[ChapterTask]]:
+        """Compute (or reuse) the cached wave layering."""
+        if not self.tasks_by_wave:
+            in_degree = {
+                task_id: len(set(task.dependencies))
+                for task_id, task in self.tasks.items()
+            }
+            current = [task_id for task_id, degree in in_degree.items() if degree == 0]
+            wave_num = 1
+
+            while current:
+                self.tasks_by_wave[wave_num] = current
+                next_wave = []
+                for task_id in current:
+                    for dependent_id in self._dependents.get(task_id, ()):
+                        in_degree[dependent_id] -= 1
+                        if in_degree[dependent_id] == 0:
+                            next_wave.append(dependent_id)
+                current = next_wave
+                wave_num += 1
 
-            for task in self.tasks.values():
-                if task.id in assigned_tasks:
-                    continue
+        return {
+            wave_num: [self.tasks[task_id] for task_id in task_ids]
+            for wave_num, task_ids in self.tasks_by_wave.items()
+        }
 
-                # Check if all dependencies are in previous waves
-                deps_satisfied = all(
-                    dep_id in assigned_tasks
-                    for dep_id in task.dependencies
-                )
+    def mark_task_started(self, task_id: str, lease_seconds: int = DEFAULT_LEASE_SECONDS):
+        """
+        Mark a task as in progress.
 
-                if deps_satisfied:
-                    wave_tasks.append(task)
-                    assigned_tasks.add(task.id)
+        Args:
+            task_id: Task ID
+            lease_seconds: How long the task may stay IN_PROGRESS before a
+                resumed run treats it as abandoned
+        """
+        with self.lock:
+            if task_id in self.tasks:
+                now = time.time()
+                completed_delta = self._set_status(task_id, TaskStatus.IN_PROGRESS)
+                self.tasks[task_id].started_at = now
+                self.tasks[task_id].metadata["lease_expires_at"] = now + lease_seconds
 
-            if not wave_tasks:
-                # No progress - circular dependency or error
-                break
+                # Update Redis
+                self._save_task(task_id, completed_delta)
 
-            waves[wave_num] = wave_tasks
-            wave_num += 1
+    def mark_task_complete(self, task_id: str, result: Optional[Any] = None):
+        """
+        Mark a task as complete.
 
-        return waves
+        Args:
+            task_id: Task ID
+            result: Optional result data from task execution
+        """
+        with self.lock:
+            if task_id in self.tasks:
+                completed_delta = self._set_status(task_id, TaskStatus.COMPLETE)
+                self.tasks[task_id].completed_at = time.time()
+                self.tasks[task_id].result = result
+                self.tasks[task_id].result_ref = None  # Set by _save_task when there's a result
+                self.tasks[task_id].metadata.pop("lease_expires_at", None)
+                rerun_flags = self.tasks[task_id].metadata.pop("rerun_flags", None)
+
+                # Event, result blob and completed count change in one transaction
+                self._save_task(task_id, completed_delta, result)
+
+                if rerun_flags:
+                    # Flags raised while this pass ran get a pass of their own
+                    self.add_task(self._build_fix_task(self.tasks[task_id].chapter_number, rerun_flags))
 
-    def mark_task_started(self, task_id: str):
-        """Mark a task as in progress."""
-        if task_id in self.tasks:
-            self.tasks[task_id].status = TaskStatus.IN_PROGRESS
-            self.tasks[task_id].started_at = datetime.now().isoformat()
+    def mark_task_failed(self, task_id: str, error: str):
+        """Mark a task as failed."""
+        with self.lock:
+            if task_id in self.tasks:
+                completed_delta = self._set_status(task_id, TaskStatus.FAILED)
+                self.tasks[task_id].metadata["error"] = error
+                self.tasks[task_id].metadata.pop("lease_expires_at", None)
 
-            # Update Redis
-            task_data_key = f"workflow:{self.book_id}:task:{task_id}"
-            self.redis.set(task_data_key, json.dumps(self.tasks[task_id].to_dict()))
+                # Update Redis
+                self._save_task(task_id, completed_delta)
 
-    def mark_task_complete(self, task_id: str, result: Optional[Any] = None):
+    def is_lease_active(self, task_id: str, now: Optional[datetime] = None) -> bool:
         """
-        Mark a task as complete.
+        Check whether an IN_PROGRESS task is still held by a live worker.
 
         Args:
             task_id: Task ID
-            result: Optional result data from task execution
+            now: Current time (defaults to datetime.now())
+
+        Returns:
+            True if the task is IN_PROGRESS and its lease has not expired
         """
-        if task_id in self.tasks:
-            self.tasks[task_id].status = TaskStatus.COMPLETE
-            self.tasks[task_id].completed_at = datetime.now().isoformat()
-            self.tasks[task_id].result = result
+        task = self.tasks.get(task_id)
+        if task is None or task.status != TaskStatus.IN_PROGRESS:
+            return False
 
-            self.completed_tasks_count += 1
+        expires_at = task.metadata.get("lease_expires_at")
+        if not expires_at:
+            return False
 
-            # Update Redis
-            task_data_key = f"workflow:{self.book_id}:task:{task_id}"
-            self.redis.set(task_data_key, json.dumps(self.tasks[task_id].to_dict()))
+        return _to_timestamp(expires_at) > (now or datetime.now()).timestamp()
 
-            count_key = f"workflow:{self.book_id}:completed_count"
-            self.redis.set(count_key, self.completed_tasks_count)
+    def requeue_expired_tasks(self, now: Optional[datetime] = None) -> List[str]:
+        """
+        Return abandoned tasks to the queue after a crash.
 
-    def mark_task_failed(self, task_id: str, error: str):
-        """Mark a task as failed."""
-        if task_id in self.tasks:
-            self.tasks[task_id].status = TaskStatus.FAILED
-            self.tasks[task_id].metadata["error"] = error
+        IN_PROGRESS tasks whose lease has expired (and READY tasks that were
+        handed out but never started) go back to PENDING, or BLOCKED if a
+        dependency is still incomplete.
+
+        Args:
+            now: Current time (defaults to datetime.now())
+
+        Returns:
+            IDs of requeued tasks
+        """
+        requeued = []
+
+        with self.lock:
+            for task_id, task in self.tasks.items():
+                if task.status == TaskStatus.READY or (
+                    task.status == TaskStatus.IN_PROGRESS and not self.is_lease_active(task_id, now)
+                ):
+                    status = TaskStatus.PENDING if self._unmet_deps.get(task_id) == 0 else TaskStatus.BLOCKED
+                    self._set_status(task_id, status)
+                    task.started_at = None
+                    task.metadata.pop("lease_expires_at", None)
+                    task.metadata["requeue_count"] = task.metadata.get("requeue_count", 0) + 1
+                    self._save_task(task_id)
+                    requeued.append(task_id)
+
+        return requeued
+
+    def mark_phase_complete(self, phase: str, result: Optional[Any] = None):
+        """
+        Checkpoint a global (whole-manuscript) phase.
+
+        Args:
+            phase: Phase name (e.g. "analysis", "qa")
+            result: Optional JSON-serializable phase result to reuse on resume
+        """
+        checkpoint = {
+            "completed_at": datetime.now().isoformat(),
+            "result": result
+        }
+        with self.lock:
+            self.completed_phases[phase] = checkpoint
 
-            # Update Redis
-            task_data_key = f"workflow:{self.book_id}:task:{task_id}"
-            self.redis.set(task_data_key, json.dumps(self.tasks[task_id].to_dict()))
+        phases_key = f"workflow:{self.book_id}:phases"
+        self.redis.hset(phases_key, phase, json_dumps(checkpoint))
+
+    def is_phase_complete(self, phase: str) -> bool:
+        """Check whether a global phase has been checkpointed."""
+        return phase in self.completed_phases
+
+    def get_phase_result(self, phase: str) -> Optional[Any]:
+        """Get the persisted result of a checkpointed phase."""
+        return self.completed_phases.get(phase, {}).get("result")
 
     def has_circular_dependency(self, task_id: str, visited: Optional[Set[str]] = None) -> bool:
         """
@@ -366,13 +955,27 @@ class WorkflowStateManager:
             "progress_pct": (
                 self.completed_tasks_count / len(self.tasks) * 100
                 if self.tasks else 0
-            )
+            ),
+            "compression": self.codec.get_stats()
         }
 
     def get_task(self, task_id: str) -> Optional[ChapterTask]:
         """Get a specific task by ID."""
         return self.tasks.get(task_id)
 
+    def get_task_result(self, task_id: str) -> Optional[Any]:
+        """
+        Get a task's result, fetching its blob if not loaded yet.
+
+        Args:
+            task_id: Task ID
+
+        Returns:
+            Result data or None
+        """
+        task = self.tasks.get(task_id)
+        return task.result if task else None
+
     def get_tasks_for_chapter(self, chapter_number: int) -> List[ChapterTask]:
         """Get all tasks for a specific chapter."""
         return [
@@ -382,17 +985,35 @@ class WorkflowStateManager:
 
     def clear(self):
         """Clear all workflow state for this book."""
-        # Clear Redis
-        pattern = f"workflow:{self.book_id}:*"
-        keys = self.redis.keys(pattern)
-        if keys:
-            self.redis.delete(*keys)
-
-        # Clear in-memory state
-        self.tasks.clear()
-        self.flags.clear()
-        self.completed_tasks_count = 0
-        self.tasks_by_wave.clear()
+        # Incremental SCAN + UNLINK, so other jobs on a shared Redis aren't blocked
+        unlink_keys(self.redis, f"workflow:{self.book_id}:*")
+
+        self._reset()
+
+    def expire(self, ttl_seconds: int) -> int:
+        """
+        Let this book's workflow state age out after a TTL.
+
+        Args:
+            ttl_seconds: Time to live in seconds
+
+        Returns:
+            Number of keys given the TTL
+        """
+        return expire_keys(self.redis, f"workflow:{self.book_id}:*", ttl_seconds)
+
+    def _reset(self):
+        """Clear in-memory state."""
+        with self.lock:
+            self.tasks.clear()
+            self.flags.clear()
+            self.completed_tasks_count = 0
+            self.tasks_by_wave.clear()
+            self.completed_phases.clear()
+            self.codec.forget()
+            self._dependents.clear()
+            self._unmet_deps.clear()
+            self._ready.clear()
 
     def initialize_standard_workflow(self, num_chapters: int = 15):
         """
@@ -8,7 +8,7 @@ import os
 import sys
 import asyncio
 from datetime import datetime
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, List, Callable, Awaitable
 import json
 
 from dotenv import load_dotenv
@@ -22,13 +22,23 @@ from crewai_ghostwriter.core import (
     ManuscriptMemory,
     GhostwriterLongTermMemory,
     WorkflowStateManager,
+    ChapterTask,
     TaskStatus,
-    TaskType
+    TaskType,
+    LocalStore,
+    get_storage_client
 )
 
 from crewai_ghostwriter.core.orchestration import (
     ParallelExecutor,
-    MultiProviderRateLimiter
+    PipelineStage,
+    MultiProviderRateLimiter,
+    TaskResultCache,
+    RedisTaskResultCache,
+    RetryPolicy,
+    RetryBudget,
+    estimate_tokens,
+    make_cache_key
 )
 
 from crewai_ghostwriter.agents import (
@@ -53,6 +63,31 @@ from crewai_ghostwriter.agents import (
 )
 
 
+# Token budgets used for TPM admission (reconciled with actual usage)
+EXPANSION_MAX_OUTPUT_TOKENS = 6000  # ~3100 words plus tool-call overhead
+EDITING_MAX_OUTPUT_TOKENS = 5000  # Polished chapter of similar length
+QA_MAX_OUTPUT_TOKENS = 1500  # Per-chapter quality report
+RETRIEVED_CONTEXT_TOKENS = 3000  # Similar scenes and continuity facts pulled by tools
+
+# Per-chapter pipeline stages and the workflow tasks that checkpoint them
+CHAPTER_STAGE_TASKS = {
+    "expand": TaskType.EXPAND,
+    "edit": TaskType.POLISH,
+    "validate": TaskType.VALIDATE
+}
+CHAPTER_STAGE_DEPENDENCIES = {
+    TaskType.POLISH: TaskType.EXPAND,
+    TaskType.VALIDATE: TaskType.POLISH
+}
+
+
+def checkpoint_result(result: Any) -> Optional[str]:
+    """Reduce a crew output to JSON-safe text for task checkpoints."""
+    if result is None:
+        return None
+    return getattr(result, "raw", None) or str(result)
+
+
 class GhostwriterOrchestrator:
     """
     Main orchestrator for the ghostwriting system.
@@ -97,11 +132,13 @@ class GhostwriterOrchestrator:
         if anthropic_key:
             os.environ["ANTHROPIC_API_KEY"] = anthropic_key
 
-        # Initialize memory systems
+        # Initialize memory systems (sharing the process-wide Redis pool, or
+        # an embedded SQLite store with STORAGE_BACKEND=sqlite)
+        self.redis = get_storage_client(redis_host, redis_port)
+        local_storage = isinstance(self.redis, LocalStore)
         self.manuscript_memory = ManuscriptMemory(
             book_id=book_id,
-            redis_host=redis_host,
-            redis_port=redis_port
+            redis_client=self.redis
         )
 
         self.long_term_memory = GhostwriterLongTermMemory(
@@ -111,8 +148,7 @@ class GhostwriterOrchestrator:
 
         self.state_manager = WorkflowStateManager(
             book_id=book_id,
-            redis_host=redis_host,
-            redis_port=redis_port
+            redis_client=self.redis
         )
 
         # Initialize agents (will be created when needed)
@@ -120,12 +156,40 @@ class GhostwriterOrchestrator:
         self.tools = {}
 
         # Initialize parallel execution components
-        self.rate_limiter = MultiProviderRateLimiter()
+        # Redis-backed budgets are shared by every job and worker process
+        # using the same API key, so concurrent runs can't overshoot limits
+        if os.getenv("RATE_LIMIT_BACKEND", "redis") == "redis" and not local_storage:
+            self.rate_limiter = MultiProviderRateLimiter(
+                redis_client=self.redis,
+                api_keys={"openai": self.openai_key, "anthropic": self.anthropic_key}
+            )
+        else:
+            self.rate_limiter = MultiProviderRateLimiter()
+
+        # Content-addressed cache of chapter stage results; the Redis cache
+        # survives restarts so reruns of an unchanged book skip the API calls
+        cache_backend = os.getenv("RESULT_CACHE", "redis")
+        if cache_backend == "redis" and local_storage:
+            cache_backend = "memory"
+        cache_max_bytes = int(os.getenv("RESULT_CACHE_MAX_MB", "256")) * 1024 * 1024
+        if cache_backend == "redis":
+            self.result_cache = RedisTaskResultCache(
+                redis_client=self.redis,
+                max_bytes=cache_max_bytes
+            )
+        elif cache_backend == "memory":
+            self.result_cache = TaskResultCache(max_bytes=cache_max_bytes)
+        else:
+            self.result_cache = None
+
         self.parallel_executor = ParallelExecutor(
             state_manager=self.state_manager,
             max_concurrent=5,
             rate_limiter=self.rate_limiter,
-            verbose=self.verbose
+            verbose=self.verbose,
+            result_cache=self.result_cache,
+            retry_policy=RetryPolicy(max_attempts=int(os.getenv("RETRY_MAX_ATTEMPTS", "4"))),
+            retry_budget=RetryBudget(max_retries=int(os.getenv("RETRY_BUDGET", "100")))
         )
 
     def load_manuscript(self, manuscript_path: str):
@@ -253,7 +317,176 @@ class GhostwriterOrchestrator:
         )
         print("  ✓ Learning Coordinator")
 
-    def process_manuscript(self):
+    def prepare_resume(self) -> Dict[str, Any]:
+        """
+        Prepare an interrupted run to continue from its Redis checkpoints.
+
+        Tasks left IN_PROGRESS by a crashed worker are requeued once their
+        lease has expired; COMPLETE tasks and checkpointed phases are kept.
+
+        Returns:
+            Dictionary with requeued task IDs, completed phases and the
+            number of completed chapter tasks
+        """
+        requeued = self.state_manager.requeue_expired_tasks()
+        completed_phases = list(self.state_manager.completed_phases.keys())
+        completed_tasks = sum(
+            1 for task in self.state_manager.tasks.values()
+            if task.status == TaskStatus.COMPLETE
+        )
+
+        print(f"\n♻️  Resuming {self.book_id} from checkpoints")
+        print(f"  ✓ Completed phases: {', '.join(completed_phases) or 'none'}")
+        print(f"  ✓ Completed chapter tasks: {completed_tasks}")
+        if requeued:
+            print(f"  ↩️  Requeued {len(requeued)} abandoned tasks: {', '.join(sorted(requeued))}")
+
+        return {
+            "requeued": requeued,
+            "completed_phases": completed_phases,
+            "completed_tasks": completed_tasks
+        }
+
+    def run_phase(self, phase: str, runner: Callable[[], Any], resume: bool = False) -> Any:
+        """
+        Run a global phase and checkpoint it (blocking; coroutines use
+        run_phase_async).
+
+        Args:
+            phase: Phase name (e.g. "analysis", "qa")
+            runner: Function running the phase; its return value is persisted
+            resume: Reuse the checkpointed result instead of rerunning
+
+        Returns:
+            Phase result
+        """
+        if resume and self.state_manager.is_phase_complete(phase):
+            print(f"  ⏭️  {phase.capitalize()} already complete, reusing checkpoint")
+            return self.state_manager.get_phase_result(phase)
+
+        # Transient provider errors (429, timeouts, 5xx) are retried with backoff
+        result = self.parallel_executor.call_with_retry(runner, phase)
+        self.state_manager.mark_phase_complete(phase, result)
+        return result
+
+    async def run_phase_async(self, phase: str, runner: Callable[[], Any], resume: bool = False) -> Any:
+        """
+        Run a global phase and checkpoint it without blocking the event loop.
+
+        The runner executes on the executor's worker pool and retry backoff
+        is awaited, so other jobs on the same loop keep making progress.
+
+        Args:
+            phase: Phase name (e.g. "analysis", "qa")
+            runner: Blocking function running the phase; its return value is persisted
+            resume: Reuse the checkpointed result instead of rerunning
+
+        Returns:
+            Phase result
+        """
+        if resume and self.state_manager.is_phase_complete(phase):
+            print(f"  ⏭️  {phase.capitalize()} already complete, reusing checkpoint")
+            return self.state_manager.get_phase_result(phase)
+
+        result = await self.parallel_executor.run_with_retry(
+            lambda: self.parallel_executor.run_blocking(runner), phase
+        )
+        await asyncio.to_thread(self.state_manager.mark_phase_complete, phase, result)
+        return result
+
+    def _get_chapter_stage_status(self, task_type: TaskType, ch_num: int, resume: bool) -> str:
+        """
+        Register a chapter's stage task and report whether it still needs to run.
+
+        Returns:
+            "complete", "leased" (held by a live worker) or "pending"
+        """
+        task_id = f"{task_type.value}_{ch_num}"
+        task = self.state_manager.get_task(task_id)
+
+        if task is None or not resume:
+            previous = CHAPTER_STAGE_DEPENDENCIES.get(task_type)
+            self.state_manager.add_task(ChapterTask(
+                chapter_number=ch_num,
+                task_type=task_type,
+                status=TaskStatus.BLOCKED if previous else TaskStatus.PENDING,
+                dependencies=[f"{previous.value}_{ch_num}"] if previous else []
+            ))
+            return "pending"
+
+        if task.status == TaskStatus.COMPLETE:
+            return "complete"
+        if self.state_manager.is_lease_active(task_id):
+            return "leased"
+        return "pending"
+
+    def get_runnable_chapters(self, task_type: TaskType, resume: bool = False) -> List[int]:
+        """
+        Get chapters that still need a stage, registering their tasks.
+
+        Args:
+            task_type: Chapter stage (EXPAND, POLISH or VALIDATE)
+            resume: Skip chapters whose stage is COMPLETE or leased by a live worker
+
+        Returns:
+            Sorted chapter numbers to run
+        """
+        chapters = sorted(self.manuscript_memory.get_all_chapters().keys())
+        return [
+            ch_num for ch_num in chapters
+            if self._get_chapter_stage_status(task_type, ch_num, resume) == "pending"
+        ]
+
+    def _checkpointed(
+        self,
+        task_type: TaskType,
+        chapter_executor: Callable[[int], Awaitable[Any]]
+    ) -> Callable[[int], Awaitable[Any]]:
+        """
+        Wrap a per-chapter executor so each run is leased and checkpointed.
+
+        The state manager's Redis round trips run in a thread, so chapters
+        running concurrently don't stall the event loop on checkpoints.
+        """
+        async def run(ch_num: int):
+            task_id = f"{task_type.value}_{ch_num}"
+            await asyncio.to_thread(self.state_manager.mark_task_started, task_id)
+
+            try:
+                result = await chapter_executor(ch_num)
+            except Exception as e:
+                await asyncio.to_thread(self.state_manager.mark_task_failed, task_id, str(e))
+                raise
+
+            await asyncio.to_thread(self.state_manager.mark_task_complete, task_id, checkpoint_result(result))
+            return result
+
+        return run
+
+    async def run_chapter_stage(self, task_type: TaskType, ch_num: int):
+        """
+        Run one checkpointed chapter stage.
+
+        Goes through the same path as the batch and pipeline runs: the
+        result cache, the shared provider rate limits with TPM admission,
+        and retries of transient errors.
+
+        Args:
+            task_type: Chapter stage (EXPAND, POLISH or VALIDATE)
+            ch_num: Chapter number
+
+        Returns:
+            Crew output
+        """
+        stage = next(
+            stage for stage in self._get_chapter_stages()
+            if CHAPTER_STAGE_TASKS[stage.name] == task_type
+        )
+        result = await self.parallel_executor.execute_chapter_stage(ch_num, stage)
+        await asyncio.to_thread(self._checkpoint_cached_results, task_type, {ch_num: result})
+        return result
+
+    def process_manuscript(self, pipelined: Optional[bool] = None, resume: bool = False):
         """
         Process the manuscript through all phases.
 
@@ -264,34 +497,66 @@ class GhostwriterOrchestrator:
         4. Polish (Line Editor for each chapter)
         5. QA (QA Agent)
         6. Learning (Learning Coordinator)
+
+        In pipelined mode, phases 3-4 become a per-chapter pipeline
+        (expand → edit → chapter QA) so each chapter moves on as soon as its
+        own previous stage finishes. Analysis, continuity, manuscript-wide
+        QA and learning stay global barriers.
+
+        Every phase and chapter stage is checkpointed in Redis. With
+        resume=True, checkpointed phases and COMPLETE chapter tasks are
+        skipped (their persisted results reused) and the run continues from
+        the first incomplete stage.
+
+        Args:
+            pipelined: Use the per-chapter pipeline (default: PIPELINE_MODE env var)
+            resume: Continue an interrupted run from its checkpoints
         """
+        if pipelined is None:
+            pipelined = os.getenv("PIPELINE_MODE", "phased") == "pipelined"
+
+        if resume:
+            self.prepare_resume()
+
         print(f"\n🚀 Processing manuscript: {self.book_id}\n")
         print("=" * 60)
 
         # Phase 1: Manuscript Analysis
         print("\n📊 PHASE 1: Manuscript Analysis")
         print("-" * 60)
-        self._run_analysis()
+        self.run_phase("analysis", self._run_analysis, resume)
 
         # Phase 2: Continuity Build
         print("\n🔍 PHASE 2: Continuity Database Build")
         print("-" * 60)
-        self._run_continuity_build()
-
-        # Phase 3: Chapter Expansion
-        print("\n✍️  PHASE 3: Chapter Expansion")
-        print("-" * 60)
-        self._run_expansion()
-
-        # Phase 4: Line Editing
-        print("\n✨ PHASE 4: Line Editing")
-        print("-" * 60)
-        self._run_editing()
+        self.run_phase("continuity", self._run_continuity_build, resume)
+
+        completed_before = self.state_manager.completed_tasks_count
+
+        if pipelined:
+            # Phases 3-4: Per-chapter pipeline (no barrier between stages)
+            print("\n✍️  PHASES 3-4: Chapter Pipeline (expand → edit → validate)")
+            print("-" * 60)
+            self._run_chapter_pipeline(resume)
+        else:
+            # Phase 3: Chapter Expansion
+            print("\n✍️  PHASE 3: Chapter Expansion")
+            print("-" * 60)
+            self._run_expansion(resume)
+
+            # Phase 4: Line Editing
+            print("\n✨ PHASE 4: Line Editing")
+            print("-" * 60)
+            self._run_editing(resume)
+
+        # Chapters redone in this run invalidate later checkpoints
+        if self.state_manager.completed_tasks_count != completed_before:
+            resume = False
 
         # Phase 5: Quality Assurance
         print("\n✅ PHASE 5: Quality Assurance")
         print("-" * 60)
-        qa_pass = self._run_qa()
+        qa_pass = self.run_phase("qa", self._run_qa, resume)
 
         if not qa_pass:
             print("\n⚠️  QA Failed - would normally iterate, but skipping for demo")
@@ -299,7 +564,18 @@ class GhostwriterOrchestrator:
         # Phase 6: Learning
         print("\n🧠 PHASE 6: Learning & Memory Storage")
         print("-" * 60)
-        self._run_learning()
+        self.run_phase("learning", self._run_learning, resume)
+
+        if self.result_cache:
+            cache_stats = self.result_cache.get_stats()
+            print(f"\n♻️  Result cache: {cache_stats['hits']} hits, {cache_stats['misses']} misses")
+
+        # Finished books age out of Redis instead of needing a cleanup sweep
+        ttl_days = float(os.getenv("BOOK_TTL_DAYS", "0"))
+        if ttl_days > 0:
+            ttl_seconds = int(ttl_days * 86400)
+            expiring = self.manuscript_memory.expire(ttl_seconds) + self.state_manager.expire(ttl_seconds)
+            print(f"\n⏳ {expiring} keys for this book expire in {ttl_days:g} days")
 
         print("\n" + "=" * 60)
         print("✅ MANUSCRIPT PROCESSING COMPLETE!")
@@ -341,75 +617,270 @@ class GhostwriterOrchestrator:
         result = crew.kickoff()
         print(f"\n✓ Continuity database built")
 
-    def _run_expansion(self):
-        """Expand all chapters using parallel execution."""
-        chapters = self.manuscript_memory.get_all_chapters()
-        chapter_numbers = sorted(chapters.keys())
+    def _estimate_chapter_tokens(self, ch_num: int, task_description: str, max_output_tokens: int) -> int:
+        """
+        Estimate tokens for a chapter-level agent call before dispatch.
 
-        print(f"\n  Expanding {len(chapter_numbers)} chapters in parallel...")
+        Counts the task prompt, the full chapter, the story contract and
+        retrieved context, plus the output budget.
 
-        # Define async task executor for expansion
-        async def expand_chapter(ch_num: int):
-            task = Task(
-                description=get_architect_expansion_task(ch_num),
-                agent=self.agents['architect'],
-                expected_output=f"Expanded Chapter {ch_num} (~3100 words)"
-            )
+        Args:
+            ch_num: Chapter number
+            task_description: Task prompt
+            max_output_tokens: Max tokens the agent may generate
+
+        Returns:
+            Estimated total tokens
+        """
+        chapter = self.manuscript_memory.get_chapter(ch_num) or {}
+        prompt = "".join([
+            task_description,
+            chapter.get("text", ""),
+            self.manuscript_memory.get_story_contract().to_json()
+        ])
+        return estimate_tokens(prompt, max_output_tokens + RETRIEVED_CONTEXT_TOKENS)
+
+    def _chapter_cache_key(self, task_type: TaskType, ch_num: int, task_description: str, model: str) -> str:
+        """
+        Build the result cache key for a chapter-level agent call.
+
+        Args:
+            task_type: Chapter stage
+            ch_num: Chapter number
+            task_description: Task prompt
+            model: Model the agent runs on
+
+        Returns:
+            Content address of the inputs the stage acts on: the chapter's
+            text, the story contract, the prompt, the model, and the memory
+            its tools read for this chapter (neighbouring chapters, the
+            chapter's analysis and open flags, continuity facts). Edits to
+            chapters further away don't change it, so a rerun may reuse a
+            result produced before such an edit.
+        """
+        chapter = self.manuscript_memory.get_chapter(ch_num) or {}
+        return make_cache_key(
+            task_type=task_type.value,
+            chapter_text=chapter.get("text", ""),
+            contract_version=self.manuscript_memory.get_story_contract().get_fingerprint(),
+            prompt_template=task_description,
+            model=model,
+            memory_state=self.manuscript_memory.get_chapter_context_fingerprint(ch_num)
+        )
+
+    def _checkpoint_cached_results(self, task_type: TaskType, results: Dict[int, Any]):
+        """Checkpoint chapter results served from the cache (they skip the executor)."""
+        for ch_num, result in results.items():
+            task = self.state_manager.get_task(f"{task_type.value}_{ch_num}")
+            if task is not None and task.status != TaskStatus.COMPLETE:
+                self.state_manager.mark_task_complete(task.id, checkpoint_result(result))
+
+    async def _expand_chapter(self, ch_num: int):
+        """Expand one chapter with the Scene Architect."""
+        task = Task(
+            description=get_architect_expansion_task(ch_num),
+            agent=self.agents['architect'],
+            expected_output=f"Expanded Chapter {ch_num} (~3100 words)"
+        )
+
+        crew = Crew(
+            agents=[self.agents['architect']],
+            tasks=[task],
+            process=Process.sequential,
+            verbose=False  # Reduce noise in parallel execution
+        )
+
+        # kickoff() blocks, so run it on the executor's worker pool
+        return await self.parallel_executor.run_blocking(crew.kickoff)
+
+    async def _edit_chapter(self, ch_num: int):
+        """Polish one chapter with the Line Editor."""
+        task = Task(
+            description=get_line_edit_task(ch_num),
+            agent=self.agents['editor'],
+            expected_output=f"Polished Chapter {ch_num}"
+        )
+
+        crew = Crew(
+            agents=[self.agents['editor']],
+            tasks=[task],
+            process=Process.sequential,
+            verbose=False  # Reduce noise in parallel execution
+        )
+
+        # kickoff() blocks, so run it on the executor's worker pool
+        return await self.parallel_executor.run_blocking(crew.kickoff)
+
+    async def _validate_chapter(self, ch_num: int):
+        """Run per-chapter QA with the QA Agent."""
+        task = Task(
+            description=get_qa_evaluation_task(ch_num),
+            agent=self.agents['qa'],
+            expected_output=f"Chapter {ch_num} quality report with pass/fail decision"
+        )
+
+        crew = Crew(
+            agents=[self.agents['qa']],
+            tasks=[task],
+            process=Process.sequential,
+            verbose=False  # Reduce noise in parallel execution
+        )
 
-            crew = Crew(
-                agents=[self.agents['architect']],
-                tasks=[task],
-                process=Process.sequential,
-                verbose=False  # Reduce noise in parallel execution
+        # kickoff() blocks, so run it on the executor's worker pool
+        return await self.parallel_executor.run_blocking(crew.kickoff)
+
+    def _get_chapter_stages(self) -> List[PipelineStage]:
+        """Per-chapter stages for pipelined processing (expand → edit → validate)."""
+        return [
+            PipelineStage(
+                name="expand",
+                task_executor=self._checkpointed(TaskType.EXPAND, self._expand_chapter),
+                provider="openai",
+                token_estimator=lambda ch_num: self._estimate_chapter_tokens(
+                    ch_num, get_architect_expansion_task(ch_num), EXPANSION_MAX_OUTPUT_TOKENS
+                ),
+                model="gpt-4o",
+                cache_key=lambda ch_num: self._chapter_cache_key(
+                    TaskType.EXPAND, ch_num, get_architect_expansion_task(ch_num), "gpt-4o"
+                )
+            ),
+            PipelineStage(
+                name="edit",
+                task_executor=self._checkpointed(TaskType.POLISH, self._edit_chapter),
+                provider="openai",
+                token_estimator=lambda ch_num: self._estimate_chapter_tokens(
+                    ch_num, get_line_edit_task(ch_num), EDITING_MAX_OUTPUT_TOKENS
+                ),
+                model="gpt-4o",
+                cache_key=lambda ch_num: self._chapter_cache_key(
+                    TaskType.POLISH, ch_num, get_line_edit_task(ch_num), "gpt-4o"
+                )
+            ),
+            PipelineStage(
+                name="validate",
+                task_executor=self._checkpointed(TaskType.VALIDATE, self._validate_chapter),
+                provider="anthropic",
+                token_estimator=lambda ch_num: self._estimate_chapter_tokens(
+                    ch_num, get_qa_evaluation_task(ch_num), QA_MAX_OUTPUT_TOKENS
+                ),
+                model="anthropic/claude-sonnet-4-5",
+                cache_key=lambda ch_num: self._chapter_cache_key(
+                    TaskType.VALIDATE, ch_num, get_qa_evaluation_task(ch_num), "anthropic/claude-sonnet-4-5"
+                )
             )
+        ]
 
-            result = crew.kickoff()
-            return result
+    async def run_chapter_pipeline_async(
+        self,
+        on_progress: Optional[Callable[[int, str, str], None]] = None,
+        resume: bool = False
+    ) -> Dict[int, Dict[str, Any]]:
+        """
+        Run every chapter through expand → edit → validate without phase barriers.
+
+        Args:
+            on_progress: Optional callback (chapter, stage, status)
+            resume: Skip COMPLETE stages (reusing their persisted results) and
+                chapters with a stage still leased by a live worker
+
+        Returns:
+            Dictionary mapping chapter numbers to their stage results
+        """
+        chapters = sorted(self.manuscript_memory.get_all_chapters().keys())
+        chapter_numbers = []
+        completed: Dict[int, Dict[str, Any]] = {}
+
+        for ch_num in chapters:
+            statuses = {
+                name: self._get_chapter_stage_status(task_type, ch_num, resume)
+                for name, task_type in CHAPTER_STAGE_TASKS.items()
+            }
+            if "leased" in statuses.values():
+                continue
+
+            completed[ch_num] = {
+                name: self.state_manager.get_task_result(f"{CHAPTER_STAGE_TASKS[name].value}_{ch_num}")
+                for name, status in statuses.items() if status == "complete"
+            }
+            chapter_numbers.append(ch_num)
+
+        results = await self.parallel_executor.execute_chapter_pipeline(
+            chapter_numbers=chapter_numbers,
+            stages=self._get_chapter_stages(),
+            on_progress=on_progress,
+            completed=completed
+        )
+
+        for name, task_type in CHAPTER_STAGE_TASKS.items():
+            await asyncio.to_thread(self._checkpoint_cached_results, task_type, {
+                ch_num: stages[name] for ch_num, stages in results.items() if name in stages
+            })
+
+        return results
+
+    def _run_chapter_pipeline(self, resume: bool = False):
+        """Expand, edit and validate chapters as a per-chapter pipeline."""
+        chapters = self.manuscript_memory.get_all_chapters()
+        print(f"\n  Pipelining {len(chapters)} chapters (expand → edit → validate)...")
+
+        results = asyncio.run(self.run_chapter_pipeline_async(resume=resume))
+
+        finished = sum(1 for stages in results.values() if "validate" in stages)
+        print(f"  ✓ {finished}/{len(chapters)} chapters expanded, polished and validated")
+
+    def _run_expansion(self, resume: bool = False):
+        """Expand all chapters using parallel execution."""
+        chapter_numbers = self.get_runnable_chapters(TaskType.EXPAND, resume)
+        if not chapter_numbers:
+            print("\n  ✓ All chapters already expanded")
+            return
+
+        print(f"\n  Expanding {len(chapter_numbers)} chapters in parallel...")
 
         # Execute all chapters in parallel with rate limiting
         results = asyncio.run(
             self.parallel_executor.execute_chapter_batch(
                 chapter_numbers=chapter_numbers,
-                task_executor=expand_chapter,
-                provider="openai"
+                task_executor=self._checkpointed(TaskType.EXPAND, self._expand_chapter),
+                provider="openai",
+                token_estimator=lambda ch_num: self._estimate_chapter_tokens(
+                    ch_num, get_architect_expansion_task(ch_num), EXPANSION_MAX_OUTPUT_TOKENS
+                ),
+                model="gpt-4o",
+                cache_key=lambda ch_num: self._chapter_cache_key(
+                    TaskType.EXPAND, ch_num, get_architect_expansion_task(ch_num), "gpt-4o"
+                )
             )
         )
+        self._checkpoint_cached_results(TaskType.EXPAND, results)
 
         print(f"  ✓ All {len(chapter_numbers)} chapters expanded")
 
-    def _run_editing(self):
+    def _run_editing(self, resume: bool = False):
         """Polish all chapters using parallel execution."""
-        chapters = self.manuscript_memory.get_all_chapters()
-        chapter_numbers = sorted(chapters.keys())
+        chapter_numbers = self.get_runnable_chapters(TaskType.POLISH, resume)
+        if not chapter_numbers:
+            print("\n  ✓ All chapters already polished")
+            return
 
         print(f"\n  Editing {len(chapter_numbers)} chapters in parallel...")
 
-        # Define async task executor for editing
-        async def edit_chapter(ch_num: int):
-            task = Task(
-                description=get_line_edit_task(ch_num),
-                agent=self.agents['editor'],
-                expected_output=f"Polished Chapter {ch_num}"
-            )
-
-            crew = Crew(
-                agents=[self.agents['editor']],
-                tasks=[task],
-                process=Process.sequential,
-                verbose=False  # Reduce noise in parallel execution
-            )
-
-            result = crew.kickoff()
-            return result
-
         # Execute all chapters in parallel with rate limiting
         results = asyncio.run(
             self.parallel_executor.execute_chapter_batch(
                 chapter_numbers=chapter_numbers,
-                task_executor=edit_chapter,
-                provider="openai"
+                task_executor=self._checkpointed(TaskType.POLISH, self._edit_chapter),
+                provider="openai",
+                token_estimator=lambda ch_num: self._estimate_chapter_tokens(
+                    ch_num, get_line_edit_task(ch_num), EDITING_MAX_OUTPUT_TOKENS
+                ),
+                model="gpt-4o",
+                cache_key=lambda ch_num: self._chapter_cache_key(
+                    TaskType.POLISH, ch_num, get_line_edit_task(ch_num), "gpt-4o"
+                )
             )
         )
+        self._checkpoint_cached_results(TaskType.POLISH, results)
 
         print(f"  ✓ All {len(chapter_numbers)} chapters polished")
 
@@ -458,16 +929,25 @@ def main():
     """Main entry point."""
     if len(sys.argv) < 2:
         print("Usage: python main.py <manuscript_path>")
+        print("       python main.py --resume <book_id>")
         sys.exit(1)
 
-    manuscript_path = sys.argv[1]
+    resume = sys.argv[1] == "--resume"
 
-    if not os.path.exists(manuscript_path):
-        print(f"Error: File not found: {manuscript_path}")
-        sys.exit(1)
+    if resume:
+        if len(sys.argv) < 3:
+            print("Usage: python main.py --resume <book_id>")
+            sys.exit(1)
+        book_id = sys.argv[2]
+    else:
+        manuscript_path = sys.argv[1]
+
+        if not os.path.exists(manuscript_path):
+            print(f"Error: File not found: {manuscript_path}")
+            sys.exit(1)
 
-    # Generate book ID from timestamp
-    book_id = f"book_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        # Generate book ID from timestamp
+        book_id = f"book_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
 
     # Create orchestrator
     orchestrator = GhostwriterOrchestrator(
@@ -475,14 +955,20 @@ def main():
         verbose=True
     )
 
-    # Load manuscript
-    orchestrator.load_manuscript(manuscript_path)
+    if resume:
+        # Chapters and checkpoints are reloaded from Redis
+        if not orchestrator.manuscript_memory.get_all_chapters():
+            print(f"Error: No stored chapters for book: {book_id}")
+            sys.exit(1)
+    else:
+        # Load manuscript
+        orchestrator.load_manuscript(manuscript_path)
 
     # Initialize agents
     orchestrator.initialize_agents()
 
     # Process manuscript
-    orchestrator.process_manuscript()
+    orchestrator.process_manuscript(resume=resume)
 
     print(f"\n📝 Results stored in memory for book: {book_id}")
     print(f"✅ Processing complete!")
@@ -11,7 +11,7 @@ import json
 
 class LoadChapterInput(BaseModel):
     """Input schema for loading a chapter."""
-    chapter_number: int = Field(..., description="Chapter number to load (1-15)")
+    chapter_number: int = Field(..., description="Chapter number to load")
     include_metadata: bool = Field(True, description="Include metadata like word count (default: True)")
 
 
@@ -30,7 +30,7 @@ class ChapterContextLoaderTool(BaseTool):
     Returns the chapter text and optional metadata (word count, scene count, etc.).
 
     Input:
-    - chapter_number: Which chapter to load (1-15)
+    - chapter_number: Which chapter to load
     - include_metadata: Whether to include metadata (default: True)
     """
     args_schema: type[BaseModel] = LoadChapterInput
@@ -56,9 +56,6 @@ class ChapterContextLoaderTool(BaseTool):
         Returns:
             Chapter text with optional metadata
         """
-        if not (1 <= chapter_number <= 15):
-            return f"Error: chapter_number must be between 1-15, got {chapter_number}"
-
         chapter_data = self.memory.get_chapter(chapter_number)
 
         if not chapter_data:
@@ -127,8 +124,8 @@ class LoadMultipleChaptersTool(BaseTool):
         if not chapter_numbers:
             return "Error: Must provide at least one chapter number"
 
-        if any(ch < 1 or ch > 15 for ch in chapter_numbers):
-            return "Error: All chapter numbers must be between 1-15"
+        if any(ch < 1 for ch in chapter_numbers):
+            return "Error: All chapter numbers must be 1 or higher"
 
         result = [f"Loading {len(chapter_numbers)} chapters: {chapter_numbers}\n\n"]
 
@@ -10,8 +10,8 @@ from pydantic import BaseModel, Field
 
 class IssueTrackerInput(BaseModel):
     """Input schema for IssueTracker tool."""
-    discovered_in: int = Field(..., description="Chapter number where issue was discovered (1-15)")
-    affects_chapter: int = Field(..., description="Chapter number that needs fixing (1-15)")
+    discovered_in: int = Field(..., description="Chapter number where issue was discovered")
+    affects_chapter: int = Field(..., description="Chapter number that needs fixing")
     issue_type: str = Field(..., description="Type of issue: 'foreshadowing', 'continuity', 'pacing', 'character', 'plot'")
     detail: str = Field(..., description="Detailed description of the issue and what needs to be fixed")
     severity: str = Field(..., description="Issue severity: 'low', 'medium', 'high', 'critical'")
@@ -45,6 +45,9 @@ class IssueTrackerTool(BaseTool):
     - issue_type: Type (foreshadowing/continuity/pacing/character/plot)
     - detail: What needs to be fixed
     - severity: How important (low/medium/high/critical)
+
+    If an open flag on the same chapter already describes the same kind of
+    issue, your report is merged into it instead of creating a new flag.
     """
     args_schema: type[BaseModel] = IssueTrackerInput
 
@@ -75,11 +78,11 @@ class IssueTrackerTool(BaseTool):
             Success message with flag ID
         """
         # Validate inputs
-        if not (1 <= discovered_in <= 15):
-            return f"Error: discovered_in must be between 1-15, got {discovered_in}"
+        if not self.memory.has_chapter(discovered_in):
+            return f"Error: discovered_in must be a loaded chapter, got {discovered_in}"
 
-        if not (1 <= affects_chapter <= 15):
-            return f"Error: affects_chapter must be between 1-15, got {affects_chapter}"
+        if not self.memory.has_chapter(affects_chapter):
+            return f"Error: affects_chapter must be a loaded chapter, got {affects_chapter}"
 
         if discovered_in == affects_chapter:
             return f"Error: Use regular editing for same-chapter issues, not cross-chapter flagging"
@@ -99,35 +102,57 @@ class IssueTrackerTool(BaseTool):
             "severity": severity
         }
 
-        # Flag in ManuscriptMemory
-        flag_id = self.memory.flag_cross_chapter_issue(
+        # Flag in ManuscriptMemory (near-duplicates of an open flag are merged into it)
+        flag_id, merged = self.memory.flag_or_merge_issue(
             discovered_in=discovered_in,
             affects_chapter=affects_chapter,
             issue=issue
         )
 
-        # Create fix task in WorkflowStateManager
-        self.state.add_flag(
+        # Create (or extend) the chapter's fix task in WorkflowStateManager;
+        # a merged report still goes to it so the fix sees every wording
+        fix_id = self.state.add_flag(
             discovered_in=discovered_in,
             affects_chapter=affects_chapter,
-            issue=issue
+            issue=dict(issue, duplicate_of=flag_id) if merged else issue
         )
-
-        return (
-            f"✓ Issue flagged successfully!\n"
-            f"Flag ID: {flag_id}\n"
-            f"Discovered in: Chapter {discovered_in}\n"
-            f"Affects: Chapter {affects_chapter}\n"
-            f"Type: {issue_type} ({severity} severity)\n"
-            f"Detail: {detail}\n\n"
-            f"A fix task has been automatically created for Chapter {affects_chapter}.\n"
-            f"It will execute after Chapter {discovered_in} analysis completes."
+        fix_task = self.state.get_task(fix_id)
+        waits_for = ", ".join(str(ch) for ch in fix_task.metadata["triggered_by"])
+
+        if merged:
+            existing = self.memory.get_flag(flag_id)
+            summary = (
+                f"✓ Issue already flagged - merged into existing flag.\n"
+                f"Flag ID: {flag_id}\n"
+                f"Originally discovered in: Chapter {existing['discovered_in']}\n"
+                f"Affects: Chapter {affects_chapter}\n"
+                f"Type: {issue_type} ({existing['issue']['severity']} severity)\n"
+                f"Existing detail: {existing['issue']['detail']}\n\n"
+                f"Your report was added to it ({len(existing['duplicates'])} duplicate report(s) so far).\n"
+            )
+        else:
+            summary = (
+                f"✓ Issue flagged successfully!\n"
+                f"Flag ID: {flag_id}\n"
+                f"Discovered in: Chapter {discovered_in}\n"
+                f"Affects: Chapter {affects_chapter}\n"
+                f"Type: {issue_type} ({severity} severity)\n"
+                f"Detail: {detail}\n\n"
+            )
+        if "rerun_flags" in fix_task.metadata:
+            return summary + (
+                f"Fix task {fix_id} for Chapter {affects_chapter} is running; "
+                f"{len(fix_task.metadata['rerun_flags'])} flag(s) will get another pass once it completes."
+            )
+        return summary + (
+            f"Fix task {fix_id} for Chapter {affects_chapter} now carries {len(fix_task.flags)} flag(s).\n"
+            f"It will execute after analysis of Chapter(s) {waits_for} completes."
         )
 
 
 class GetFlagsForChapterInput(BaseModel):
     """Input schema for getting flags."""
-    chapter_number: int = Field(..., description="Chapter number to check for flags (1-15)")
+    chapter_number: int = Field(..., description="Chapter number to check for flags")
 
 
 class GetFlagsForChapterTool(BaseTool):
@@ -164,8 +189,8 @@ class GetFlagsForChapterTool(BaseTool):
         Returns:
             Formatted list of flags or message if none
         """
-        if not (1 <= chapter_number <= 15):
-            return f"Error: chapter_number must be between 1-15, got {chapter_number}"
+        if chapter_number < 1:
+            return f"Error: chapter_number must be 1 or higher, got {chapter_number}"
 
         flags = self.memory.get_flags_for_chapter(chapter_number)
 
@@ -182,6 +207,11 @@ class GetFlagsForChapterTool(BaseTool):
                 f"   Detail: {flag['issue']['detail']}\n"
                 f"   Flag ID: {flag['id']}"
             )
+            for duplicate in flag.get("duplicates", []):
+                result.append(
+                    f"\n   Also reported from Chapter {duplicate['discovered_in']} "
+                    f"({duplicate['severity']}): {duplicate['detail']}"
+                )
 
         result.append(f"\nTotal: {len(flags)} issue(s) to address")
         return "".join(result)
@@ -223,13 +253,7 @@ class ResolveFlagTool(BaseTool):
         Returns:
             Success message
         """
-        # Check if flag exists
-        all_flags = self.memory.get_unresolved_flags()
-        flag_exists = any(f['id'] == flag_id for f in all_flags)
-
-        if not flag_exists:
+        if not self.memory.resolve_flag(flag_id):
             return f"Error: Flag ID '{flag_id}' not found or already resolved"
 
-        self.memory.resolve_flag(flag_id)
-
         return f"✓ Flag {flag_id} marked as resolved!"
@@ -209,7 +209,7 @@ class GetGlobalStoryContractTool(BaseTool):
 
 class CheckRomancePacingInput(BaseModel):
     """Input schema for checking romance pacing."""
-    chapter_number: int = Field(..., description="Current chapter number (1-15)")
+    chapter_number: int = Field(..., description="Current chapter number")
     proposed_action: str = Field(..., description="Romantic action you want to write (e.g., 'first kiss', 'love confession')")
 
 
@@ -230,7 +230,7 @@ class CheckRomancePacingTool(BaseTool):
     - Can they have physical intimacy in Chapter 10? (Check boundaries!)
 
     Input:
-    - chapter_number: Current chapter (1-15)
+    - chapter_number: Current chapter
     - proposed_action: What you want to write
 
     Returns guidance on whether it's allowed and why.
@@ -267,7 +267,7 @@ class CheckRomancePacingTool(BaseTool):
 
 class CheckMagicRevealInput(BaseModel):
     """Input schema for checking magic reveals."""
-    chapter_number: int = Field(..., description="Current chapter number (1-15)")
+    chapter_number: int = Field(..., description="Current chapter number")
     proposed_reveal: str = Field(..., description="Magic information you want to reveal")
 
 
@@ -288,7 +288,7 @@ class CheckMagicRevealTool(BaseTool):
     - Is this reveal on the forbidden list? (Check forbidden knowledge!)
 
     Input:
-    - chapter_number: Current chapter (1-15)
+    - chapter_number: Current chapter
     - proposed_reveal: What magic info you want to reveal
 
     Returns guidance on whether it's allowed and what CAN be revealed.
@@ -13,6 +13,8 @@ from crewai_ghostwriter.core.memory.manuscript_memory import ManuscriptMemory
 from crewai_ghostwriter.core.orchestration.state_manager import (
     WorkflowStateManager, ChapterTask, TaskStatus, TaskType
 )
+from crewai_ghostwriter.core.memory.redis_pool import get_redis_pool_stats
+from crewai_ghostwriter.core.memory.local_store import LocalStore
 
 
 def test_cross_chapter_flagging():
@@ -215,6 +217,976 @@ def test_wave_based_execution():
     print("\n✓ Test passed: Wave-based execution works!\n")
 
 
+def test_dependency_index_scaling():
+    """
+    Test Scenario: Large multi-book style workflow uses the incremental
+    dependency index instead of rescanning every task.
+    """
+    import time
+
+    print("=" * 60)
+    print("TEST: Dependency Index Scaling")
+    print("=" * 60)
+
+    book_id = "test_book_004"
+    state_manager = WorkflowStateManager(book_id)
+    state_manager.clear()
+
+    num_chapters = 500
+    state_manager.initialize_standard_workflow(num_chapters=num_chapters)
+    state_manager.add_flag(discovered_in=num_chapters, affects_chapter=1, issue={"type": "plot"})
+    print(f"\n1. Created {len(state_manager.tasks)} tasks")
+
+    start = time.time()
+    waves = state_manager.get_tasks_by_wave()
+    elapsed = time.time() - start
+    print(f"2. Wave layering: {len(waves)} waves in {elapsed * 1000:.1f}ms")
+    assert [len(waves[w]) for w in sorted(waves)] == [num_chapters, num_chapters + 1, num_chapters, num_chapters]
+
+    # Drain the workflow through ready lookups only
+    start = time.time()
+    processed = 0
+    ready = state_manager.get_ready_tasks()
+    while ready:
+        for task in ready:
+            state_manager.mark_task_complete(task.id)
+            processed += 1
+        ready = state_manager.get_ready_tasks()
+    elapsed = time.time() - start
+
+    print(f"3. Drained {processed} tasks via ready lookups in {elapsed:.2f}s")
+    assert processed == len(state_manager.tasks)
+
+    # Cleanup
+    state_manager.clear()
+    print("\n✓ Test passed: Dependency index scales linearly!\n")
+
+
+def test_checkpoint_resume():
+    """
+    Test Scenario: A run crashes mid-editing. A fresh process reloads the
+    workflow from Redis, requeues the abandoned chapter and skips work
+    that already completed.
+    """
+    from datetime import datetime, timedelta
+
+    print("=" * 60)
+    print("TEST: Checkpoint and Resume")
+    print("=" * 60)
+
+    book_id = "test_book_005"
+    state_manager = WorkflowStateManager(book_id)
+    state_manager.clear()
+
+    state_manager.initialize_standard_workflow(num_chapters=3)
+    state_manager.mark_phase_complete("analysis")
+    state_manager.mark_phase_complete("qa_precheck", result=True)
+
+    # Chapters 1-3 analyzed and expanded, chapter 1 polished
+    for ch in range(1, 4):
+        state_manager.mark_task_complete(f"analyze_{ch}", result=f"analysis {ch}")
+        state_manager.mark_task_complete(f"expand_{ch}", result=f"expanded {ch}")
+    state_manager.mark_task_complete("polish_1", result="polished 1")
+
+    # Crash: chapter 2 was mid-edit (worker died), chapter 3 is held by a live worker
+    state_manager.mark_task_started("polish_2", lease_seconds=60)
+    state_manager.mark_task_started("polish_3", lease_seconds=3600)
+    print("\n1. Simulated crash during editing (polish_2 abandoned, polish_3 still leased)")
+
+    # New process reloads everything from Redis
+    resumed = WorkflowStateManager(book_id)
+    print(f"2. Reloaded {len(resumed.tasks)} tasks, phases: {list(resumed.completed_phases)}")
+    assert resumed.is_phase_complete("analysis")
+    assert resumed.get_phase_result("qa_precheck") is True
+    assert resumed.get_task("expand_2").result == "expanded 2"
+
+    # Lease for polish_2 has expired 2 minutes later; polish_3's has not
+    later = datetime.now() + timedelta(minutes=2)
+    requeued = resumed.requeue_expired_tasks(now=later)
+    print(f"3. Requeued: {requeued}")
+    assert requeued == ["polish_2"]
+    assert resumed.get_task("polish_2").status == TaskStatus.PENDING
+    assert resumed.get_task("polish_3").status == TaskStatus.IN_PROGRESS
+    assert resumed.is_lease_active("polish_3", now=later)
+
+    # Only incomplete, unleased work is ready: polish_2 and validate_1
+    ready_ids = sorted(task.id for task in resumed.get_ready_tasks())
+    print(f"4. Ready after resume: {ready_ids}")
+    assert ready_ids == ["polish_2", "validate_1"]
+
+    # Requeue state is persisted too
+    assert WorkflowStateManager(book_id).get_task("polish_2").metadata["requeue_count"] == 1
+
+    # Cleanup
+    state_manager.clear()
+    print("\n✓ Test passed: Interrupted workflow resumes from checkpoints!\n")
+
+
+def test_flag_store():
+    """
+    Test Scenario: A long book accumulates hundreds of flags. Flags are
+    individual records with chapter and status indexes, so resolving one
+    never rewrites the others and a reload keeps creation order.
+    """
+    print("=" * 60)
+    print("TEST: Indexed Flag Store")
+    print("=" * 60)
+
+    book_id = "test_book_006"
+    memory = ManuscriptMemory(book_id)
+    memory.clear()
+
+    flag_ids = [
+        memory.flag_cross_chapter_issue(
+            discovered_in=20,
+            affects_chapter=i % 10 + 1,
+            issue={"type": "continuity", "detail": f"Issue {i}", "severity": "medium"}
+        )
+        for i in range(300)
+    ]
+    print(f"\n1. Created {len(flag_ids)} flags across 10 chapters")
+    assert len(memory.get_flags_for_chapter(3)) == 30
+
+    # Resolve every flag affecting chapter 3
+    for flag in memory.get_flags_for_chapter(3):
+        assert memory.resolve_flag(flag["id"])
+    assert not memory.resolve_flag(flag_ids[2]), "already resolved"
+    assert not memory.resolve_flag("flag_missing")
+    print(f"2. Resolved chapter 3 flags, {len(memory.get_unresolved_flags())} still open")
+    assert memory.get_flags_for_chapter(3) == []
+    assert len(memory.get_unresolved_flags()) == 270
+
+    # Redis holds one record per flag plus the status/chapter indexes
+    assert memory.redis.hlen(f"book:{book_id}:flags:records") == 300
+    assert memory.redis.zcard(f"book:{book_id}:flags:open") == 270
+    assert memory.redis.zcard(f"book:{book_id}:flags:resolved") == 30
+    assert memory.redis.zcard(f"book:{book_id}:flags:chapter:3") == 30
+
+    # A fresh process sees the same flags in creation order
+    reloaded = ManuscriptMemory(book_id)
+    reloaded_ids = [f["id"] for f in reloaded.get_flags_for_chapter(4)]
+    print(f"3. Reloaded: {reloaded.get_memory_stats()['unresolved_flags']} open flags")
+    assert reloaded_ids == [f["id"] for f in memory.get_flags_for_chapter(4)]
+    assert reloaded.get_flag(flag_ids[2])["status"] == "resolved"
+    assert reloaded.get_state_fingerprint() == memory.get_state_fingerprint()
+
+    # A chapter's listing shows flags other workers opened or resolved since
+    other_id = reloaded.flag_cross_chapter_issue(12, 4, {"type": "plot", "detail": "Late flag", "severity": "low"})
+    assert [f["id"] for f in memory.get_flags_for_chapter(4)][-1] == other_id
+    assert reloaded.resolve_flag(other_id)
+    assert other_id not in [f["id"] for f in memory.get_flags_for_chapter(4)]
+    assert memory.get_flag(other_id)["status"] == "resolved"
+
+    # A chapter's context fingerprint follows its flags, neighbours and continuity
+    fingerprints = {ch: reloaded.get_chapter_context_fingerprint(ch) for ch in (4, 5)}
+    assert fingerprints[4] == memory.get_chapter_context_fingerprint(4)
+    reloaded.resolve_flag(reloaded.get_flags_for_chapter(5)[0]["id"])
+    assert reloaded.get_chapter_context_fingerprint(4) == fingerprints[4]
+    assert reloaded.get_chapter_context_fingerprint(5) != fingerprints[5]
+    fingerprints[5] = reloaded.get_chapter_context_fingerprint(5)
+    reloaded.store_chapter(7, "A distant chapter.")
+    assert reloaded.get_chapter_context_fingerprint(5) == fingerprints[5]
+    reloaded.store_chapter(6, "A neighbouring chapter.")
+    assert reloaded.get_chapter_context_fingerprint(5) != fingerprints[5]
+    assert reloaded.get_chapter_context_fingerprint(4) == fingerprints[4]
+    reloaded.store_continuity_fact("characters", "Aria", "left-handed")
+    assert reloaded.get_chapter_context_fingerprint(4) != fingerprints[4]
+
+    # Cleanup
+    memory.clear()
+    print("\n✓ Test passed: Flags are indexed by chapter and status!\n")
+
+
+def test_long_serial():
+    """
+    Test Scenario: A 60-chapter serial is stored, reloaded and checked
+    against the story contract without losing chapters past 15.
+    """
+    print("=" * 60)
+    print("TEST: Arbitrary Chapter Counts")
+    print("=" * 60)
+
+    book_id = "test_book_007"
+    memory = ManuscriptMemory(book_id)
+    memory.clear()
+
+    # Store out of order; the registry keeps chapter order
+    for ch in reversed(range(1, 61)):
+        memory.store_chapter(ch, f"Chapter {ch} text", {"word_count": 3})
+    print(f"\n1. Stored {len(memory.get_all_chapters())} chapters")
+
+    reloaded = ManuscriptMemory(book_id)
+    numbers = list(reloaded.get_all_chapters())
+    print(f"2. Reloaded chapters {numbers[0]}-{numbers[-1]}")
+    assert numbers == list(range(1, 61))
+    assert reloaded.get_chapter(60)["text"] == "Chapter 60 text"
+    assert reloaded.has_chapter(42) and not reloaded.has_chapter(61)
+
+    # Ladders are spread over all 60 chapters and looked up by range
+    reloaded.initialize_story_contract_from_manuscript()
+    contract = reloaded.get_story_contract()
+    ladder = contract.contract["romance"]["escalation_ladder"]
+    print(f"3. Romance ladder: {list(ladder)}")
+    assert list(ladder) == [
+        "chapters_1_12", "chapters_13_24", "chapters_25_36", "chapters_37_48", "chapters_49_60"
+    ]
+    assert contract.check_romance_pacing(5, "banter")["current_level"] == "antagonistic_tension"
+    assert contract.check_romance_pacing(40, "banter")["current_level"] == "undeniable_attraction"
+    assert contract.check_romance_pacing(60, "vows")["current_level"] == "commitment_and_HEA"
+    assert "connection to MMC powers" in contract.check_magic_reveal(55, "bond")["allowed_reveals"]
+
+    # Custom ladders may use open-ended ranges
+    contract.set_romance_rules("slow_burn", {"chapters_1_30": "slow", "chapters_31_plus": "burn"}, [])
+    assert contract.check_romance_pacing(99, "kiss")["current_level"] == "burn"
+
+    # Cleanup
+    memory.clear()
+    print("\n✓ Test passed: Long serials keep every chapter!\n")
+
+
+def test_compression():
+    """
+    Test Scenario: Expanded chapters and task results are compressed in
+    Redis and read back transparently; small values stay plain JSON.
+    """
+    print("=" * 60)
+    print("TEST: Value Compression")
+    print("=" * 60)
+
+    book_id = "test_book_008"
+    memory = ManuscriptMemory(book_id)
+    memory.clear()
+
+    paragraph = (
+        "Lyra pressed her palm to the cold stone of the tower, feeling the old "
+        "wards hum beneath her skin like a second heartbeat. "
+    )
+    long_text = "".join(f"{paragraph}({i}) " for i in range(200))
+    memory.store_chapter(1, long_text, {"word_count": len(long_text.split())})
+    memory.store_chapter(2, "Short chapter.")
+
+    stored = memory.redis.get(f"book:{book_id}:chapter:1")
+    print(f"\n1. Chapter 1: {len(long_text):,} chars stored as {len(stored):,} ({stored[:5]})")
+    assert stored.startswith(("zstd:", "zlib:"))
+    assert memory.redis.get(f"book:{book_id}:chapter:2").startswith("{")
+
+    reloaded = ManuscriptMemory(book_id)
+    assert reloaded.get_chapter(1)["text"] == long_text
+    stats = reloaded.get_memory_stats()["compression"]
+    print(f"2. Reloaded, compression: {stats}")
+    assert stats["values"] == 2 and stats["compression_ratio"] > 2
+
+    # Task results are compressed the same way
+    state_manager = WorkflowStateManager(book_id)
+    state_manager.clear()
+    state_manager.add_task(ChapterTask(1, TaskType.EXPAND, TaskStatus.PENDING, []))
+    state_manager.mark_task_complete("expand_1", result=long_text)
+    result_ref = state_manager.get_task("expand_1").result_ref
+    assert state_manager.redis.get(f"workflow:{book_id}:blob:{result_ref}").startswith(("zstd:", "zlib:"))
+    assert WorkflowStateManager(book_id).get_task("expand_1").result == long_text
+    print(f"3. Task results: {state_manager.get_workflow_stats()['compression']['compression_ratio']}x")
+
+    # Cleanup
+    state_manager.clear()
+    memory.clear()
+    print("\n✓ Test passed: Large values are compressed transparently!\n")
+
+
+def test_chapter_history():
+    """
+    Test Scenario: Editing passes rewrite a few paragraphs each. Every
+    version stays retrievable as a delta, identical text is stored once,
+    and old versions are pruned past the retention limit.
+    """
+    print("=" * 60)
+    print("TEST: Chapter Version History")
+    print("=" * 60)
+
+    book_id = "test_book_009"
+    memory = ManuscriptMemory(book_id, max_chapter_versions=4)
+    memory.clear()
+
+    paragraphs = [f"Paragraph {i}: the court gathered beneath the silver moon.\n" for i in range(100)]
+    texts = ["".join(paragraphs)]
+    assert memory.store_chapter(1, texts[0], label="original") == 1
+
+    # The current full text is kept once, in the chapter key
+    texts_key = f"book:{book_id}:chapter:1:texts"
+    head_blob = memory.redis.hget(texts_key, memory.get_chapter(1)["content_hash"])
+    assert memory.codec.decode(head_blob) == {"head": True}
+
+    # Each pass rewrites one paragraph
+    for version in range(2, 5):
+        paragraphs[version * 10] = f"Paragraph {version * 10}: rewritten in pass {version}.\n"
+        texts.append("".join(paragraphs))
+        assert memory.store_chapter(1, texts[-1], label=f"pass_{version}") == version
+
+    blobs = memory.redis.hgetall(f"book:{book_id}:chapter:1:texts")
+    stored = sum(len(blob) for blob in blobs.values())
+    print(f"\n1. 4 versions of {len(texts[0]):,} chars stored in {stored:,} chars")
+    assert stored < len(texts[0]) * 1.5
+
+    reloaded = ManuscriptMemory(book_id, max_chapter_versions=4)
+    for version, text in enumerate(texts, 1):
+        assert reloaded.get_chapter_version(1, version) == text
+    diff = reloaded.diff_chapter_versions(1, 1, 2)
+    print(f"2. All versions retrievable; v1→v2 diff has {diff.count(chr(10))} lines")
+    assert "rewritten in pass 2" in diff
+
+    # Storing the same text again is not a new version; rollback reuses the blob
+    assert reloaded.store_chapter(1, texts[-1]) == 4
+    assert reloaded.rollback_chapter(1, 1) == 5
+    assert reloaded.get_chapter(1)["text"] == texts[0]
+    assert len(memory.redis.hgetall(f"book:{book_id}:chapter:1:texts")) == 4
+    print(f"3. Rolled back to v1 as v5: {[v['label'] for v in reloaded.get_chapter_versions(1)]}")
+
+    assert ManuscriptMemory(book_id).get_chapter_version(1, 5) == texts[0]
+
+    # Retention keeps the last 4 versions, and they still resolve
+    versions = [v["version"] for v in reloaded.get_chapter_versions(1)]
+    assert versions == [2, 3, 4, 5]
+    assert reloaded.get_chapter_version(1, 1) is None
+    assert reloaded.get_chapter_version(1, 2) == texts[1]
+    assert len(memory.redis.hgetall(f"book:{book_id}:chapter:1:texts")) == 4
+
+    # Cleanup
+    memory.clear()
+    print("\n✓ Test passed: Chapter versions are stored as deltas!\n")
+
+
+def test_shared_redis_pool():
+    """
+    Test Scenario: Many jobs in one API process create memories and state
+    managers concurrently. They share one bounded connection pool instead
+    of each opening its own sockets.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    print("=" * 60)
+    print("TEST: Shared Redis Connection Pool")
+    print("=" * 60)
+
+    def run_job(job: int) -> int:
+        memory = ManuscriptMemory(f"test_pool_{job}")
+        state_manager = WorkflowStateManager(f"test_pool_{job}")
+        assert memory.redis.connection_pool is state_manager.redis.connection_pool
+        memory.store_chapter(1, f"Job {job} chapter")
+        state_manager.initialize_standard_workflow(num_chapters=2)
+        stored = len(ManuscriptMemory(f"test_pool_{job}").get_all_chapters())
+        memory.clear()
+        state_manager.clear()
+        return stored
+
+    with ThreadPoolExecutor(max_workers=20) as pool:
+        stored = list(pool.map(run_job, range(40)))
+    assert stored == [1] * 40
+
+    stats = get_redis_pool_stats()["localhost:6379/0"]
+    print(f"\n1. 40 concurrent jobs, pool stats: {stats}")
+    assert stats["created_connections"] <= stats["max_connections"]
+    assert stats["checkouts"] > 40 * 5
+    assert stats["in_use"] == 0
+
+    print("\n✓ Test passed: Jobs share one bounded Redis pool!\n")
+
+
+def test_local_store():
+    """
+    Test Scenario: A CI benchmark runs without a Redis server. Memory and
+    workflow state use the embedded SQLite store and survive a reopen.
+    """
+    import tempfile
+
+    print("=" * 60)
+    print("TEST: Embedded Local Store (no Redis server)")
+    print("=" * 60)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "ghostwriter.db")
+        store = LocalStore(path)
+
+        memory = ManuscriptMemory("test_local", redis_client=store, max_chapter_versions=3)
+        state_manager = WorkflowStateManager("test_local", redis_client=store)
+
+        for chapter in range(1, 4):
+            memory.store_chapter(chapter, f"Chapter {chapter}, first draft.\n" * 50)
+        for draft in range(2, 6):
+            memory.store_chapter(2, f"Chapter 2, draft {draft}.\n" * 50, label=f"pass_{draft}")
+        flag_id = memory.flag_cross_chapter_issue(3, 1, {"type": "continuity", "description": "Scar moved"})
+        memory.increment_iteration()
+        state_manager.initialize_standard_workflow(num_chapters=3)
+        state_manager.add_flag(3, 1, {"type": "continuity"})
+        state_manager.mark_task_started("analyze_1")
+        state_manager.mark_task_complete("analyze_1", "analysis")
+        state_manager.mark_phase_complete("analysis", {"chapters": 3})
+        store.close()
+
+        print("\n1. Reopening the database file...")
+        reopened = LocalStore(path)
+        memory = ManuscriptMemory("test_local", redis_client=reopened, max_chapter_versions=3)
+        state_manager = WorkflowStateManager("test_local", redis_client=reopened)
+
+        versions = [v["version"] for v in memory.get_chapter_versions(2)]
+        print(f"   Chapters: {memory.get_chapter_numbers()}, chapter 2 versions: {versions}")
+        assert memory.get_chapter_numbers() == [1, 2, 3]
+        assert versions == [3, 4, 5]
+        assert memory.get_chapter_version(2, 4) == "Chapter 2, draft 4.\n" * 50
+        assert [f["id"] for f in memory.get_unresolved_flags()] == [flag_id]
+        assert memory.get_iteration_count() == 1
+
+        stats = state_manager.get_workflow_stats()
+        print(f"   Tasks: {stats['total_tasks']}, completed: {stats['completed']}")
+        assert state_manager.get_task("analyze_1").status == TaskStatus.COMPLETE
+        assert state_manager.get_task("analyze_1").result == "analysis"
+        assert state_manager.is_phase_complete("analysis")
+        assert [t.id for t in state_manager.get_ready_tasks()][:2] == ["analyze_2", "analyze_3"]
+
+        print("\n2. Clearing removes every key for the book...")
+        memory.clear()
+        state_manager.clear()
+        assert reopened.keys("*") == []
+        reopened.close()
+
+    print("\n✓ Test passed: Memory and state run on the embedded store!\n")
+
+
+def test_scan_cleanup_and_ttl():
+    """
+    Test Scenario: Two books share one Redis. Clearing one book must not
+    issue KEYS (which blocks the whole instance) or touch the other book,
+    and a finished book can be given a TTL so it ages out on its own.
+    """
+    print("=" * 60)
+    print("TEST: SCAN/UNLINK Cleanup and Book TTL")
+    print("=" * 60)
+
+    class NoKeysClient:
+        """Redis client proxy that fails on KEYS."""
+
+        def __init__(self, client):
+            self.client = client
+
+        def keys(self, *args, **kwargs):
+            raise AssertionError("KEYS issued during cleanup")
+
+        def __getattr__(self, name):
+            return getattr(self.client, name)
+
+    memory_a = ManuscriptMemory("test_scan_a")
+    memory_b = ManuscriptMemory("test_scan_b")
+    state_a = WorkflowStateManager("test_scan_a")
+    for chapter in range(1, 31):
+        memory_a.store_chapter(chapter, f"Book A chapter {chapter}")
+        memory_b.store_chapter(chapter, f"Book B chapter {chapter}")
+    state_a.initialize_standard_workflow(num_chapters=30)
+    keys_b = sorted(memory_b.redis.scan_iter(match="book:test_scan_b:*"))
+
+    print(f"\n1. Clearing book A ({len(list(memory_a.redis.scan_iter(match='book:test_scan_a:*')))} keys)...")
+    memory_a.redis = NoKeysClient(memory_a.redis)
+    state_a.redis = NoKeysClient(state_a.redis)
+    memory_a.clear()
+    state_a.clear()
+    assert not list(memory_b.redis.scan_iter(match="*test_scan_a:*"))
+    assert sorted(memory_b.redis.scan_iter(match="book:test_scan_b:*")) == keys_b
+    print(f"   Book A gone, book B's {len(keys_b)} keys untouched")
+
+    print("\n2. Expiring finished book B...")
+    expiring = memory_b.expire(3600)
+    ttls = {memory_b.redis.ttl(key) for key in keys_b}
+    print(f"   {expiring} keys, TTLs: {min(ttls)}-{max(ttls)}s")
+    assert expiring == len(keys_b)
+    assert all(0 < ttl <= 3600 for ttl in ttls)
+
+    # Cleanup
+    memory_b.clear()
+    print("\n✓ Test passed: Cleanup is incremental and books can age out!\n")
+
+
+def test_concurrent_mutations():
+    """
+    Test Scenario: Many workers (threads, and a second process sharing the
+    book) flag issues, resolve flags, count iterations and complete tasks
+    at the same time. IDs stay unique and counters stay exact.
+    """
+    import json
+    from concurrent.futures import ThreadPoolExecutor
+
+    print("=" * 60)
+    print("TEST: Atomic Flag and Task Mutations")
+    print("=" * 60)
+
+    book_id = "test_concurrent"
+    memory = ManuscriptMemory(book_id)
+    other_process = ManuscriptMemory(book_id)  # Same book, separate in-memory state
+    memory.clear()
+
+    def worker(job: int) -> list:
+        target = memory if job % 2 else other_process
+        flag_ids = []
+        for i in range(25):
+            flag_ids.append(target.flag_cross_chapter_issue(
+                job, 1, {"type": "continuity", "detail": f"worker {job} issue {i}"}
+            ))
+            target.increment_iteration()
+        return flag_ids
+
+    print("\n1. 8 workers flag 25 issues each...")
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        flag_ids = [flag_id for ids in pool.map(worker, range(8)) for flag_id in ids]
+    reloaded = ManuscriptMemory(book_id)
+    print(f"   {len(set(flag_ids))} unique IDs, {len(reloaded.get_unresolved_flags())} stored")
+    assert len(set(flag_ids)) == 200
+    assert len(reloaded.get_unresolved_flags()) == 200
+    assert reloaded.get_iteration_count() == 200
+
+    print("\n2. Workers resolve the same flags concurrently...")
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        resolved = list(pool.map(memory.resolve_flag, flag_ids[:50] * 4))
+    assert sum(resolved) == 50
+    assert len(ManuscriptMemory(book_id).get_unresolved_flags()) == 150
+
+    print("\n3. Books flagged with count-based IDs don't collide...")
+    memory.clear()
+    legacy = {"id": "flag_2_to_1_1", "discovered_in": 2, "affects_chapter": 1, "issue": {},
+              "status": "open", "created_at": "2025-01-01T00:00:00"}
+    memory.redis.hset(memory._flag_key("records"), "flag_2_to_1_1", json.dumps(legacy))
+    new_id = ManuscriptMemory(book_id).flag_cross_chapter_issue(2, 1, {"type": "pacing"})
+    print(f"   Legacy flag_2_to_1_1, new {new_id}")
+    assert new_id != "flag_2_to_1_1"
+    memory.clear()
+
+    print("\n4. Workers complete tasks on two state managers...")
+    state_manager = WorkflowStateManager(book_id)
+    state_manager.clear()
+    state_manager.initialize_standard_workflow(num_chapters=10)
+    other_state = WorkflowStateManager(book_id)
+    task_ids = sorted(state_manager.tasks)
+
+    def complete(i: int):
+        target = state_manager if i % 2 else other_state
+        target.mark_task_started(task_ids[i])
+        target.mark_task_complete(task_ids[i], "done")
+        target.mark_task_complete(task_ids[i], "done again")  # Not counted twice
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(complete, range(len(task_ids))))
+    count = WorkflowStateManager(book_id).completed_tasks_count
+    print(f"   {len(task_ids)} tasks, completed count: {count}")
+    assert count == len(task_ids)
+
+    # Cleanup
+    state_manager.clear()
+    print("\n✓ Test passed: Flag and task mutations are atomic!\n")
+
+
+def test_event_log():
+    """
+    Test Scenario: Task transitions are appended to an event stream as small
+    entries instead of rewriting whole tasks. Reloading replays them,
+    compaction folds them into snapshots, and the timeline stays readable.
+    """
+    print("=" * 60)
+    print("TEST: Event-Sourced Task State")
+    print("=" * 60)
+
+    for backend, client in (("redis", None), ("sqlite", LocalStore())):
+        book_id = "test_event_log"
+        state_manager = WorkflowStateManager(book_id, redis_client=client, compact_every=0)
+        state_manager.clear()
+        state_manager.initialize_standard_workflow(num_chapters=3)
+
+        print(f"\n1. [{backend}] Transitions of a task with a large result...")
+        big_result = "chapter analysis " * 20000
+        state_manager.mark_task_started("analyze_1")
+        state_manager.mark_task_complete("analyze_1", big_result)
+        state_manager.mark_task_started("expand_1")
+        state_manager.mark_task_failed("expand_1", "timeout")
+        events = state_manager.redis.xrange(state_manager._key("events"))
+        largest = max(len(fields["data"]) for _, fields in events)
+        print(f"   {len(events)} events, largest {largest} bytes (result {len(big_result)} bytes)")
+        assert largest < 1000
+
+        print(f"\n2. [{backend}] Reload replays the log...")
+        reloaded = WorkflowStateManager(book_id, redis_client=client, compact_every=0)
+        assert reloaded.get_task("analyze_1").result == big_result
+        assert reloaded.get_task("expand_1").status == TaskStatus.FAILED
+        assert reloaded.get_task("expand_1").metadata["error"] == "timeout"
+        assert reloaded.completed_tasks_count == 1
+        assert [t.id for t in reloaded.get_ready_tasks()] == [t.id for t in state_manager.get_ready_tasks()]
+
+        print(f"\n3. [{backend}] Compaction folds events into snapshots...")
+        folded = state_manager.compact()
+        state_manager.mark_task_started("analyze_2")
+        compacted = WorkflowStateManager(book_id, redis_client=client, compact_every=0)
+        print(f"   Folded {folded} events")
+        assert folded == len(events)
+        assert compacted.get_task("analyze_1").result == big_result
+        assert compacted.get_task("expand_1").status == TaskStatus.FAILED
+        assert compacted.get_task("analyze_2").status == TaskStatus.IN_PROGRESS
+
+        # A compaction that outlived its lock leaves the next holder's lock alone
+        lock_key = state_manager._key("events:compacting")
+        queue_compaction = state_manager._queue_compaction
+
+        def lock_taken_over(*args):
+            state_manager.redis.set(lock_key, "next-worker")
+            queue_compaction(*args)
+
+        state_manager._queue_compaction = lock_taken_over
+        assert state_manager.compact() == 1
+        assert state_manager.redis.get(lock_key) == "next-worker"
+        assert state_manager.compact() == 0, "lock held by another worker"
+        state_manager.redis.delete(lock_key)
+        del state_manager._queue_compaction
+
+        print(f"\n4. [{backend}] Timeline for a post-mortem...")
+        timeline = compacted.get_timeline("expand_1")
+        for event in timeline:
+            print(f"   {event['at']} {event['op']:6} {event['status']}")
+        assert [event["status"] for event in timeline] == ["blocked", "in_progress", "failed"]
+
+        print(f"\n5. [{backend}] Automatic compaction trims the log...")
+        auto = WorkflowStateManager(book_id, redis_client=client, compact_every=5, event_retention=3)
+        for task_id in ("analyze_3", "expand_2", "expand_3"):
+            auto.mark_task_started(task_id)
+            auto.mark_task_complete(task_id, "ok")
+        retained = auto.redis.xlen(auto._key("events"))
+        print(f"   {retained} events retained")
+        assert retained <= 10  # Redis trims approximately
+        final = WorkflowStateManager(book_id, redis_client=client)
+        assert final.completed_tasks_count == 4
+        assert final.get_task("expand_3").result == "ok"
+
+        # Cleanup
+        state_manager.clear()
+
+    print("\n✓ Test passed: Task transitions are event-sourced!\n")
+
+
+def test_result_blobs():
+    """
+    Test Scenario: Task results are stored as content-addressed blobs that
+    task records reference. Status queries after a reload never fetch them,
+    and identical results share one blob.
+    """
+    print("=" * 60)
+    print("TEST: Out-of-Line Result Blobs")
+    print("=" * 60)
+
+    book_id = "test_result_blobs"
+    state_manager = WorkflowStateManager(book_id)
+    state_manager.clear()
+    state_manager.initialize_standard_workflow(num_chapters=3)
+
+    print("\n1. Completing tasks with chapter-sized results...")
+    chapter_text = "The storm broke over the harbor. " * 5000
+    for ch_num in range(1, 4):
+        state_manager.mark_task_started(f"expand_{ch_num}")
+        state_manager.mark_task_complete(f"expand_{ch_num}", chapter_text)  # Same text every time
+    state_manager.mark_task_complete("analyze_1", {"themes": ["loss"], "word_count": 3000})
+    state_manager.compact()
+
+    blobs = list(state_manager.redis.scan_iter(match=f"workflow:{book_id}:blob:*"))
+    record = state_manager.redis.get(f"workflow:{book_id}:task:expand_1")
+    print(f"   {len(blobs)} blobs, task record {len(record)} bytes")
+    assert len(blobs) == 2
+    assert len(record) < 1000
+
+    print("\n2. Status queries after reload don't touch results...")
+    reloaded = WorkflowStateManager(book_id)
+    stats = reloaded.get_workflow_stats()
+    reloaded.visualize_dependencies()
+    print(f"   {stats['completed']} completed, results loaded: "
+          f"{sum(task._result is not None for task in reloaded.tasks.values())}")
+    assert stats["completed"] == 4
+    assert all(task._result is None for task in reloaded.tasks.values())
+
+    print("\n3. Results are fetched on demand...")
+    assert reloaded.get_task_result("expand_2") == chapter_text
+    assert reloaded.get_task("analyze_1").result == {"themes": ["loss"], "word_count": 3000}
+    assert reloaded.get_task_result("polish_1") is None
+
+    # Cleanup
+    state_manager.clear()
+    print("\n✓ Test passed: Task results live in referenced blobs!\n")
+
+
+def test_compact_task_model():
+    """
+    Test Scenario: Tasks are slotted with numeric timestamps and interned
+    IDs, state is serialized as compact JSON (orjson when installed), and
+    records written by older versions still load.
+    """
+    import json
+    import sys
+    from datetime import datetime
+    from crewai_ghostwriter.core.memory import codec
+    from crewai_ghostwriter.core.memory.codec import ValueCodec
+    from crewai_ghostwriter.core.memory.story_contract import GlobalStoryContract
+
+    print("=" * 60)
+    print("TEST: Compact Task Model and Codec")
+    print("=" * 60)
+
+    print(f"\n1. Slotted tasks (serializer: {ValueCodec().get_stats()['serializer']})...")
+    task = ChapterTask(3, TaskType.EXPAND, TaskStatus.BLOCKED, ["analyze_3"])
+    assert not hasattr(task, "__dict__")
+    assert task.id is sys.intern("expand_3")
+    assert isinstance(task.created_at, float)
+
+    book_id = "test_compact_model"
+    state_manager = WorkflowStateManager(book_id)
+    state_manager.clear()
+    state_manager.add_task(task)
+    state_manager.mark_task_started("expand_3", lease_seconds=60)
+    state_manager.mark_task_complete("expand_3", {"chapter": 3, "words": 4200})
+    reloaded = WorkflowStateManager(book_id).get_task("expand_3")
+    print(f"   Started {reloaded.started_at:.0f}, completed {reloaded.completed_at:.0f}")
+    assert reloaded.completed_at >= reloaded.started_at >= reloaded.created_at
+    assert reloaded.result == {"chapter": 3, "words": 4200}
+
+    print("\n2. Records with ISO timestamps still load...")
+    legacy = {"id": "polish_3", "chapter_number": 3, "task_type": "polish", "status": "in_progress",
+              "dependencies": ["expand_3"], "flags": [], "created_at": "2025-01-01T09:00:00",
+              "started_at": "2025-01-01T09:30:00", "completed_at": None, "result": None,
+              "metadata": {"lease_expires_at": "2025-01-01T10:00:00"}}
+    state_manager.redis.sadd(f"workflow:{book_id}:tasks", "polish_3")
+    state_manager.redis.set(f"workflow:{book_id}:task:polish_3", json.dumps(legacy))
+    resumed = WorkflowStateManager(book_id)
+    assert resumed.get_task("polish_3").started_at == datetime(2025, 1, 1, 9, 30).timestamp()
+    assert resumed.requeue_expired_tasks() == ["polish_3"]
+
+    print("\n3. Compact contract JSON and the json fallback...")
+    contract = GlobalStoryContract(book_id)
+    contract.set_pov("third_limited", "Elena", "past", ["No head hopping"])
+    text = contract.to_json()
+    print(f"   Contract: {len(text)} chars")
+    assert "\n" not in text
+    orjson, codec.orjson = codec.orjson, None
+    try:
+        assert codec.json_loads(codec.json_dumps(contract.contract)) == contract.contract
+        assert codec.json_dumps({1: "a"}) == json.dumps({1: "a"}, separators=(",", ":"))
+    finally:
+        codec.orjson = orjson
+    restored = GlobalStoryContract(book_id)
+    restored.from_json(text)
+    assert restored.contract == contract.contract
+
+    # Cleanup
+    state_manager.clear()
+    print("\n✓ Test passed: Tasks and state serialize compactly!\n")
+
+
+def test_flag_coalescing():
+    """
+    Test Scenario: Several chapters flag issues in Chapter 1. They're merged
+    into one fix task carrying every flag, most severe first, that waits for
+    every discovering chapter's analysis. A flag raised while the pass is
+    running is held back for a pass of its own.
+    """
+    print("=" * 60)
+    print("TEST: Flag Coalescing")
+    print("=" * 60)
+
+    book_id = "test_flag_coalescing"
+    state_manager = WorkflowStateManager(book_id)
+    state_manager.clear()
+    state_manager.initialize_standard_workflow(num_chapters=12)
+
+    print("\n1. Chapters 5, 9 and 12 flag Chapter 1...")
+    for discovered_in, severity in ((5, "low"), (9, "critical"), (12, "medium")):
+        fix_id = state_manager.add_flag(discovered_in, 1, {
+            "type": "foreshadowing", "detail": f"Seed the reveal from chapter {discovered_in}", "severity": severity
+        })
+    fix_tasks = [t for t in state_manager.get_tasks_for_chapter(1) if t.task_type == TaskType.FIX]
+    fix_task = state_manager.get_task(fix_id)
+    print(f"   {len(fix_tasks)} fix task, flags: {[f['issue']['severity'] for f in fix_task.flags]}")
+    assert len(fix_tasks) == 1
+    assert [f["issue"]["severity"] for f in fix_task.flags] == ["critical", "medium", "low"]
+    assert fix_task.dependencies == ["analyze_5", "analyze_9", "analyze_12"]
+    assert fix_task.metadata["triggered_by"] == [5, 9, 12]
+
+    print("\n2. Fix task waits for all discovering chapters...")
+    for ch_num in (5, 9):
+        state_manager.mark_task_complete(f"analyze_{ch_num}")
+    assert fix_id not in [t.id for t in state_manager.get_ready_tasks()]
+    state_manager.mark_task_complete("analyze_12")
+    assert fix_id in [t.id for t in state_manager.get_ready_tasks()]
+
+    print("\n3. Merged flags survive a reload...")
+    reloaded = WorkflowStateManager(book_id)
+    assert len(reloaded.get_task(fix_id).flags) == 3
+
+    print("\n4. A flag after the fix pass completed starts a new pass...")
+    state_manager.mark_task_started(fix_id)
+    state_manager.mark_task_complete(fix_id)
+    state_manager.add_flag(7, 1, {"type": "continuity", "detail": "Scar on wrong hand", "severity": "high"})
+    fix_task = state_manager.get_task(fix_id)
+    print(f"   {fix_id} [{fix_task.status.value}] with {len(fix_task.flags)} flag")
+    assert fix_task.status == TaskStatus.BLOCKED
+    assert len(fix_task.flags) == 1
+    assert WorkflowStateManager(book_id).completed_tasks_count == 3  # The analyses
+
+    print("\n5. A flag raised while the fix pass runs gets its own pass...")
+    state_manager.mark_task_complete("analyze_7")
+    state_manager.get_ready_tasks()
+    state_manager.mark_task_started(fix_id)
+    state_manager.add_flag(12, 1, {"type": "timeline", "detail": "Wedding date moved", "severity": "low"})
+    fix_task = state_manager.get_task(fix_id)
+    assert fix_task.status == TaskStatus.IN_PROGRESS
+    assert [f["discovered_in"] for f in fix_task.flags] == [7]  # Running pass is untouched
+    assert len(WorkflowStateManager(book_id).get_task(fix_id).metadata["rerun_flags"]) == 1
+
+    state_manager.mark_task_complete(fix_id)
+    fix_task = state_manager.get_task(fix_id)
+    print(f"   {fix_id} reopened [{fix_task.status.value}] with {[f['issue']['detail'] for f in fix_task.flags]}")
+    assert fix_task.status != TaskStatus.COMPLETE
+    assert [f["discovered_in"] for f in fix_task.flags] == [12]
+    assert "rerun_flags" not in fix_task.metadata
+    assert fix_id in [t.id for t in state_manager.get_ready_tasks()]
+
+    state_manager.mark_task_started(fix_id)
+    state_manager.mark_task_complete(fix_id)
+    assert state_manager.get_task(fix_id).status == TaskStatus.COMPLETE
+
+    # Cleanup
+    state_manager.clear()
+    print("\n✓ Test passed: Flags coalesce into one fix task per chapter!\n")
+
+
+def test_flag_dedupe():
+    """
+    Test Scenario: Several chapters report the same foreshadowing problem in
+    different words. Near-duplicates are merged into the open flag; other
+    chapters, issue types and resolved flags are left alone.
+    """
+    import time
+
+    print("=" * 60)
+    print("TEST: Near-Duplicate Flag Detection")
+    print("=" * 60)
+
+    book_id = "test_flag_dedupe"
+    memory = ManuscriptMemory(book_id)
+    memory.clear()
+    detail = "Ch 1 needs to foreshadow the magic reveal in Ch 15"
+    issue = {"type": "foreshadowing", "detail": detail, "severity": "medium"}
+
+    print("\n1. Three chapters report the same problem...")
+    flag_id, merged = memory.flag_or_merge_issue(15, 1, issue)
+    assert not merged
+    for discovered_in, reworded in (
+        (12, "Chapter 1 needs to foreshadow the magic reveal in Ch 15"),
+        (14, "ch 1 needs to foreshadow the magic reveal in ch 15!"),
+    ):
+        duplicate_id, merged = memory.flag_or_merge_issue(
+            discovered_in, 1, {"type": "foreshadowing", "detail": reworded, "severity": "critical"}
+        )
+        assert merged and duplicate_id == flag_id
+    flag = memory.get_flag(flag_id)
+    print(f"   1 open flag, {len(flag['duplicates'])} merged reports, severity {flag['issue']['severity']}")
+    assert len(memory.get_unresolved_flags()) == 1
+    assert flag["issue"]["severity"] == "critical"
+
+    print("\n2. Different chapter, type or detail isn't merged...")
+    assert not memory.flag_or_merge_issue(15, 2, issue)[1]
+    assert not memory.flag_or_merge_issue(15, 1, dict(issue, type="plot"))[1]
+    assert not memory.flag_or_merge_issue(15, 1, dict(issue, detail="Elena's scar is on the wrong hand"))[1]
+    assert not memory.flag_or_merge_issue(15, 1, dict(
+        issue, detail="Ch 1 needs to foreshadow the dragon attack in Ch 15"
+    ))[1]
+
+    print("\n   Flags without a usable detail are never merged...")
+    for blank in ({"type": "pacing"}, {"type": "pacing", "detail": ""}, {"type": "pacing", "detail": "?!"}):
+        assert not memory.flag_or_merge_issue(15, 1, blank)[1]
+    assert len(memory.get_flags_for_chapter(1)) == 7
+
+    print("\n3. Reload rebuilds the index; resolved flags drop out...")
+    reloaded = ManuscriptMemory(book_id)
+    assert len(reloaded.get_flag(flag_id)["duplicates"]) == 2
+    assert reloaded.flag_or_merge_issue(9, 1, issue) == (flag_id, True)
+    reloaded.resolve_flag(flag_id)
+    assert not reloaded.flag_or_merge_issue(9, 1, issue)[1]
+
+    print("\n   A flag resolved by another worker isn't merged into...")
+    new_id, merged = memory.flag_or_merge_issue(10, 1, issue)  # memory still thinks it's open
+    assert not merged and new_id != flag_id
+    stored = ManuscriptMemory(book_id).get_flag(flag_id)
+    assert stored["status"] == "resolved" and len(stored["duplicates"]) == 3
+
+    print("\n4. Lookups stay fast with many open flags...")
+    memory.clear()
+    for i in range(1000):
+        memory.flag_cross_chapter_issue(20, 1 + i % 10, {
+            "type": "continuity", "detail": f"Timeline entry {i * 7919} contradicts ledger {i}", "severity": "low"
+        })
+    start = time.perf_counter()
+    for i in range(100):
+        memory.flag_index.find_duplicate((1, "continuity"), f"Unrelated complaint number {i} about pacing")
+    elapsed = time.perf_counter() - start
+    print(f"   100 lookups over {len(memory.flag_index)} flags in {elapsed * 1000:.0f}ms")
+    assert memory.flag_or_merge_issue(30, 4, {
+        "type": "continuity", "detail": "Timeline entry 23757 contradicts ledger 3.", "severity": "low"
+    })[1]
+
+    # Cleanup
+    memory.clear()
+    print("\n✓ Test passed: Near-duplicate flags are merged!\n")
+
+
+def test_legacy_layout_migration():
+    """
+    Test Scenario: A book stored before the chapter registry and the indexed
+    flag store (chapters 1-15 under fixed keys, flags in one list) is loaded.
+    Its chapters and flags are migrated once and keep working.
+    """
+    import json
+
+    print("=" * 60)
+    print("TEST: Legacy Layout Migration")
+    print("=" * 60)
+
+    book_id = "test_legacy_layout"
+    memory = ManuscriptMemory(book_id)
+    memory.clear()
+    client = memory.redis
+
+    print("\n1. Writing chapters and flags in the old layout...")
+    for ch_num in (1, 2, 3):
+        client.set(f"book:{book_id}:chapter:{ch_num}", json.dumps({
+            "text": f"Old chapter {ch_num}.", "metadata": {}, "stored_at": "2024-01-01T00:00:00"
+        }))
+    for i, (affects, status) in enumerate([(1, "resolved"), (2, "open")]):
+        client.lpush(f"book:{book_id}:flags", json.dumps({
+            "id": f"flag_3_to_{affects}_{i}", "discovered_in": 3, "affects_chapter": affects,
+            "issue": {"type": "plot", "detail": f"Old issue {i}", "severity": "low"},
+            "status": status, "created_at": f"2024-01-0{i + 2}T00:00:00"
+        }))
+
+    print("\n2. Loading migrates them...")
+    migrated = ManuscriptMemory(book_id)
+    print(f"   Chapters: {sorted(migrated.get_all_chapters())}, open flags: {len(migrated.get_unresolved_flags())}")
+    assert sorted(migrated.get_all_chapters()) == [1, 2, 3]
+    assert client.zcard(f"book:{book_id}:chapters") == 3
+    assert client.hlen(f"book:{book_id}:flags:records") == 2
+    assert not client.exists(f"book:{book_id}:flags")
+    assert [f["id"] for f in migrated.get_flags_for_chapter(2)] == ["flag_3_to_2_1"]
+    assert migrated.get_flag("flag_3_to_1_0")["status"] == "resolved"
+
+    print("\n3. Migrated data keeps working and isn't migrated twice...")
+    new_id = migrated.flag_cross_chapter_issue(3, 2, {"type": "pacing", "detail": "New issue", "severity": "low"})
+    assert new_id not in ("flag_3_to_2_0", "flag_3_to_2_1")
+    assert migrated.resolve_flag("flag_3_to_2_1")
+    assert migrated.store_chapter(16, "A chapter past the old range.") == 1
+    reloaded = ManuscriptMemory(book_id)
+    assert sorted(reloaded.get_all_chapters()) == [1, 2, 3, 16]
+    assert [f["id"] for f in reloaded.get_flags_for_chapter(2)] == [new_id]
+
+    # Cleanup
+    memory.clear()
+    print("\n✓ Test passed: Old-layout books are migrated on load!\n")
+
+
 def main():
     """Run all tests."""
     print("\n" + "=" * 60)
@@ -225,6 +1197,22 @@ def main():
         test_cross_chapter_flagging()
         test_dependency_tracking()
         test_wave_based_execution()
+        test_dependency_index_scaling()
+        test_checkpoint_resume()
+        test_flag_store()
+        test_long_serial()
+        test_compression()
+        test_chapter_history()
+        test_shared_redis_pool()
+        test_local_store()
+        test_scan_cleanup_and_ttl()
+        test_concurrent_mutations()
+        test_event_log()
+        test_result_blobs()
+        test_compact_task_model()
+        test_flag_coalescing()
+        test_flag_dedupe()
+        test_legacy_layout_migration()
 
         print("=" * 60)
         print("ALL TESTS PASSED ✓")
@@ -235,6 +1223,22 @@ def main():
         print("3. ✓ Dependency-aware task scheduling")
         print("4. ✓ Wave-based parallel execution")
         print("5. ✓ Circular dependency detection")
+        print("6. ✓ Linear-time dependency indexing")
+        print("7. ✓ Checkpoint and resume with task leases")
+        print("8. ✓ Indexed flag records with O(1) resolve")
+        print("9. ✓ Chapter registry and range ladders for any chapter count")
+        print("10. ✓ Transparent compression of chapters and task results")
+        print("11. ✓ Chapter version history with deltas, dedupe and rollback")
+        print("12. ✓ Process-wide Redis connection pool with utilization stats")
+        print("13. ✓ Embedded SQLite storage backend (no Redis server)")
+        print("14. ✓ Non-blocking SCAN/UNLINK cleanup and per-book TTL")
+        print("15. ✓ Atomic flag IDs, flag resolution and task counters under concurrency")
+        print("16. ✓ Event-sourced task transitions with compaction and a replayable timeline")
+        print("17. ✓ Content-addressed result blobs kept out of task records")
+        print("18. ✓ Slotted tasks with numeric timestamps and a fast JSON codec")
+        print("19. ✓ Flags coalesced into one severity-ordered fix task per chapter")
+        print("20. ✓ MinHash near-duplicate flag detection with merging")
+        print("21. ✓ One-time migration of pre-registry chapters and list-stored flags")
         print("\nNext Steps:")
         print("- Start Docker services: cd docker && docker-compose up -d")
         print("- Run tests: python tests/test_memory.py")